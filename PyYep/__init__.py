@@ -10,12 +10,23 @@ Classes:
     ArrayValidator
     DictValidator
     ValidationError
+    ValidationResult
 """
 
 from __future__ import annotations
+import asyncio
+import inspect
+from time import perf_counter
 from typing import (
+    IO,
     Any,
+    Dict,
+    Iterable,
+    Iterator,
     List,
+    Mapping,
+    Set,
+    Tuple,
     Callable,
     Self,
     TypeVar,
@@ -30,6 +41,28 @@ from PyYep.validators.bool import BooleanValidator
 from PyYep.validators.array import ArrayValidator
 from PyYep.validators.dict import DictValidator
 from PyYep.exceptions import ValidationError
+from PyYep.result import ValidationResult
+from PyYep.profiler import PROFILER
+from PyYep.utils.batch import iter_outcomes, iter_outcomes_in_processes
+from PyYep.utils.cache import CacheInfo, ResultCache, snapshot
+from PyYep.utils.compiler import compile_schema
+from PyYep.utils.csvfile import CSVShard, CSVSummary, validate_csv
+from PyYep.utils.limits import (
+    MAX_ERRORS,
+    collect_outcomes,
+    raise_error,
+)
+from PyYep.utils.optimizer import (
+    CheckOrderOptimizer,
+    order_checks,
+    static_rank,
+)
+from PyYep.spec import allow_references, schema_from_spec, schema_to_spec
+from PyYep.utils.decorators import (
+    AsyncFunctionCall,
+    FunctionCall,
+    ValidatorCall,
+)
 
 if TYPE_CHECKING:
     from PyYep.validators.validator import Validator
@@ -54,20 +87,85 @@ class Schema(Generic[R]):
             a callable to be used as a error hook
     abort_early: bool
             sets if the schema will raise a exception soon after
-            a validation error happens
+            a validation error happens, including the errors of the
+            items of nested arrays and dicts
+    dependencies: Dict[str, Iterable[str]]
+            the names of the inputs each input depends on, used by the
+            incremental validation
+    max_errors: Optional[int]
+            the maximum number of errors collected when not aborting
+            early, including the errors of nested arrays and dicts
 
     Methods
     -------
-    validate():
+    validate(data):
             Execute the inputs validators and return a dict containing all the
             inputs' values
+
+    safe_validate(data):
+            Execute the inputs validators and return a result object
+            instead of raising
+
+    validate_async(data, concurrency):
+            Execute the inputs validators, awaiting the asynchronous ones
+            concurrently, and return a dict containing all the inputs'
+            values
+
+    validate_many(records, abort_early, max_errors, chunk_size):
+            Validate an iterable of records and return the valid ones along
+            with the errors of the invalid ones
+
+    validate_csv(path, report, shard, encoding, block_size, **fmtparams):
+            Validate the rows of a CSV file through a memory map, writing
+            the errors to a report
+
+    compile():
+            Compiles the schema into a specialized validation function
+
+    describe():
+            Return a description of the schema inputs and their checks
+
+    to_spec():
+            Convert the schema into a declarative spec
+
+    from_spec(spec):
+            Build a schema from a declarative spec
+
+    cached(maxsize):
+            Cache the outcomes of the validation of repeated data
+
+    cache_info():
+            Return the statistics of the cache
+
+    clear_cache():
+            Discard the cached outcomes
+
+    validate_incremental(data):
+            Validate only the inputs whose values changed since the last
+            incremental validation, and the inputs depending on them
+
+    reset_incremental():
+            Discard the values and outcomes stored by the incremental
+            validation
     """
 
+    __slots__ = (
+        "_inputs",
+        "on_fail",
+        "abort_early",
+        "dependencies",
+        "max_errors",
+        "_cache",
+        "_incremental",
+    )
+
     def __init__(
         self,
         inputs: List[Validator | InputItem],
         on_fail: Callable[[], None] | None = None,
         abort_early: bool | None = True,
+        dependencies: Mapping[str, Iterable[str]] | None = None,
+        max_errors: int | None = None,
     ) -> None:
         """
         Constructs all the necessary attributes for the schema object.
@@ -81,20 +179,52 @@ class Schema(Generic[R]):
                 abort_early (bool):
                     sets if the schema will raise a exception soon after
                     an error happens
+                dependencies (Mapping[str, Iterable[str]]):
+                    the names of the inputs each input depends on, an
+                    input is revalidated by the incremental validation
+                    when any of its dependencies changes
+                max_errors (int):
+                    the maximum number of errors collected when not
+                    aborting early, the validation stops once the limit
+                    is reached, including the validation of the items of
+                    nested arrays and dicts
+
+        Raises
+        -------
+        ValueError: if max_errors is lower than 1
         """
 
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("The limit of errors must be at least 1")
+
         for item in inputs:
             item.set_schema(self)
 
         self._inputs = inputs
         self.on_fail = on_fail
         self.abort_early = abort_early
-
-    def validate(self) -> R:
+        self.dependencies = {
+            name: set(names) for name, names in (dependencies or {}).items()
+        }
+        self.max_errors = max_errors
+        self._cache = None
+        # the snapshot of the last value and the outcome of each input,
+        # keyed by the index of the input
+        self._incremental: Dict[int, Tuple[bytes | None, Any]] = {}
+
+    def validate(self, data: Mapping[str, Any] | None = None) -> R:
         """
         Execute the inputs validators and return a dict containing
         all the inputs' values
 
+        Parameters
+        ----------
+        data : Optional[Mapping[str, Any]]
+                the values that will be validated, keyed by the inputs'
+                names. If passed the data containers of the inputs are
+                not read, which allows the same schema to be shared
+                between threads
+
         Raises
         -------
         ValidationError: if any validation error happens in the
@@ -105,29 +235,528 @@ class Schema(Generic[R]):
         result (R): a dict containing all the validated values
         """
 
-        result = {}
-        errors = []
+        if self._cache is not None:
+            result, error = self._cache.lookup(
+                self._read_values(data), self._run
+            )
+
+            if error is not None:
+                raise error
+
+            return result
+
+        # the outcomes are produced lazily, so when aborting early the
+        # inputs after the first invalid one are not validated
+        return self._merge_outcomes(
+            (item, item.run(self._get_value(item, data)))
+            for item in self._inputs
+        )
+
+    def _run(
+        self, data: Mapping[str, Any]
+    ) -> Tuple[R | None, ValidationError | None]:
+        try:
+            result = self._merge_outcomes(
+                (item, item.run(data.get(item.name))) for item in self._inputs
+            )
+        except ValidationError as error:
+            return None, error
+
+        return result, None
+
+    def _read_values(self, data: Mapping[str, Any] | None) -> Dict[str, Any]:
+        if data is not None:
+            return data
+
+        return {
+            item.name: self._get_value(item, None) for item in self._inputs
+        }
+
+    async def validate_async(
+        self,
+        data: Mapping[str, Any] | None = None,
+        concurrency: int | None = None,
+    ) -> R:
+        """
+        Execute the inputs validators and return a dict containing
+        all the inputs' values. The inputs using coroutine validators are
+        awaited concurrently, the other inputs are validated inline
+
+        Parameters
+        ----------
+        data : Optional[Mapping[str, Any]]
+                the values that will be validated, keyed by the inputs'
+                names. If not passed the data containers are read
+        concurrency : Optional[int]
+                the maximum number of coroutine validators awaited at
+                the same time, including the ones of nested validators
+
+        Raises
+        -------
+        ValidationError: if any validation error happens in the
+        inputs validation methods, when aborting early the error of the
+        first invalid input is raised
+
+        Returns
+        -------
+        result (R): a dict containing all the validated values
+        """
+
+        limiter = None
+
+        if concurrency is not None:
+            limiter = asyncio.Semaphore(concurrency)
+
+        outcomes: List[Tuple[Any, ValidationError | None]] = []
+        pending = []
+        # the tasks created by gather inherit the limit of errors
+        token = MAX_ERRORS.set(self._error_limit())
 
-        for item in self._inputs:
-            try:
-                result[item.name] = item.verify()
-            except ValidationError as error:
-                if self.abort_early:
-                    raise error
+        try:
+            for item in self._inputs:
+                value = self._get_value(item, data)
 
-                if error.inner:
-                    errors.extend(error.inner)
+                if not item.is_async():
+                    outcomes.append(item.run(value))
                     continue
 
-                errors.append(error)
+                pending.append(
+                    (len(outcomes), item.run_async(value, limiter))
+                )
+                outcomes.append((None, None))
+
+            if pending:
+                indexes, coroutines = zip(*pending)
+
+                for index, outcome in zip(
+                    indexes, await asyncio.gather(*coroutines)
+                ):
+                    outcomes[index] = outcome
+        finally:
+            MAX_ERRORS.reset(token)
+
+        return self._merge_outcomes(zip(self._inputs, outcomes))
 
-        if not self.abort_early and errors:
+    def _merge_outcomes(
+        self,
+        outcomes: Iterator[
+            Tuple[
+                Validator | InputItem, Tuple[Any, ValidationError | None]
+            ]
+        ],
+    ) -> R:
+        result: Dict[str, Any] = {}
+        errors = collect_outcomes(
+            ((item.name, outcome) for item, outcome in outcomes),
+            self._error_limit(),
+            result.__setitem__,
+            raise_error if self.abort_early else None,
+        )
+
+        if errors:
             raise ValidationError(
                 "", "One or more inputs failed during validation", inner=errors
             )
 
         return cast(R, result)
 
+    def _error_limit(self) -> int | None:
+        if self.abort_early:
+            return 1
+
+        return self.max_errors
+
+    def safe_validate(
+        self, data: Mapping[str, Any] | None = None
+    ) -> ValidationResult[R]:
+        """
+        Execute the inputs validators without raising, the errors are
+        reported through the returned result
+
+        Parameters
+        ----------
+        data : Optional[Mapping[str, Any]]
+                the values that will be validated, keyed by the inputs'
+                names. If not passed the data containers are read
+
+        Returns
+        -------
+        result (ValidationResult[R]): the validation result, containing
+        the validated values or the errors of the inputs
+        """
+
+        if self._cache is not None:
+            result, error = self._cache.lookup(
+                self._read_values(data), self._run
+            )
+
+            if error is not None:
+                return ValidationResult(None, error.inner or [error])
+
+            return ValidationResult(result, [])
+
+        result: Dict[str, Any] = {}
+        errors = collect_outcomes(
+            (
+                (item.name, item.run(self._get_value(item, data)))
+                for item in self._inputs
+            ),
+            self._error_limit(),
+            result.__setitem__,
+        )
+
+        if errors:
+            return ValidationResult(None, errors)
+
+        return ValidationResult(cast(R, result), errors)
+
+    def _get_value(
+        self, item: Validator | InputItem, data: Mapping[str, Any] | None
+    ) -> Any:
+        if data is not None:
+            return data.get(item.name)
+
+        if isinstance(item, InputItem):
+            return item.get_container_value()
+
+        return item.get_input_item_value()
+
+    def validate_many(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        abort_early: bool = False,
+        max_errors: int | None = None,
+        chunk_size: int = 1000,
+        workers: int | None = None,
+    ) -> Tuple[List[R], Dict[int, List[ValidationError]]]:
+        """
+        Validate an iterable of records, each record is a mapping with the
+        values keyed by the inputs' names. The records are consumed in
+        chunks, once a full chunk is received the schema is compiled, so
+        the cost of the compilation is amortized along the batch. While
+        the profiler is active, the schema is cached or an input item
+        observes the order of its checks the records are validated by
+        the validate method
+
+        Parameters
+        ----------
+        records : Iterable[Mapping[str, Any]]
+                the records that will be validated
+        abort_early : bool
+                stops the validation of the batch on the first invalid record
+        max_errors : Optional[int]
+                stops the validation of the batch after the given number of
+                invalid records
+        chunk_size : int
+                the number of records consumed from the iterable at a time
+        workers : Optional[int]
+                the number of processes used to validate the records, if
+                passed the schema, its hooks and the records must be
+                picklable
+
+        Returns
+        -------
+        result (Tuple[List[R], Dict[int, List[ValidationError]]]):
+                the valid records and the errors of the invalid ones,
+                keyed by the index of the record
+        """
+
+        valid: List[R] = []
+        errors: Dict[int, List[ValidationError]] = {}
+
+        if workers is None:
+            outcomes = iter_outcomes(self, records, chunk_size)
+        else:
+            outcomes = iter_outcomes_in_processes(
+                self, records, workers, chunk_size
+            )
+
+        for index, (result, error) in enumerate(outcomes):
+            if error is None:
+                valid.append(result)
+                continue
+
+            errors[index] = error
+
+            if abort_early or (
+                max_errors is not None and len(errors) >= max_errors
+            ):
+                outcomes.close()
+                break
+
+        return valid, errors
+
+    def validate_csv(
+        self,
+        path: str,
+        report: IO[str] | None = None,
+        shard: Tuple[int, int] | CSVShard | None = None,
+        encoding: str = "utf-8",
+        block_size: int = 1 << 20,
+        **fmtparams: Any,
+    ) -> CSVSummary:
+        """
+        Validate the rows of a CSV file, the columns are mapped to the
+        inputs by the names in the header and the values are received as
+        strings. The file is memory-mapped and decoded in blocks, and the
+        errors are written to the report as they are found, so the memory
+        used doesn't depend on the size of the file
+
+        Parameters
+        ----------
+        path : str
+                the path of the CSV file
+        report : Optional[IO[str]]
+                a text file object, opened with newline="", receiving one
+                CSV line per error with the line number of the row, the
+                path of the input and the message. The header of the
+                report is only written by the first shard
+        shard : Optional[Union[Tuple[int, int], CSVShard]]
+                the index of the shard and the number of shards, the file
+                is split in contiguous ranges of rows, at line breaks, so
+                each range can be validated by a different process. The
+                shards returned by plan_csv_shards skip counting the lines
+                before them
+        encoding : str
+                the encoding of the file, compatible with ASCII
+        block_size : int
+                the number of bytes decoded at a time
+        **fmtparams : Any
+                the formatting parameters of the csv reader, like delimiter
+
+        Raises
+        -------
+        ValueError: if the shard index is not within the number of shards
+
+        Returns
+        -------
+        summary (CSVSummary): the number of rows validated, of invalid
+        rows and of errors
+        """
+
+        return validate_csv(
+            self, path, report, shard, encoding, block_size, **fmtparams
+        )
+
+    def compile(self) -> Callable[[Mapping[str, Any] | None], R]:
+        """
+        Compiles the schema, including nested validators, into a single
+        specialized function equivalent to the validate method. Changes
+        made to the schema after the compilation are not reflected on the
+        compiled function
+
+        Returns
+        -------
+        function (Callable[[Optional[Mapping[str, Any]]], R]):
+                the compiled validation function
+        """
+
+        return cast(
+            Callable[[Mapping[str, Any] | None], R], compile_schema(self)
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Return a description of the schema inputs and their checks,
+        readable by tools like documentation generators and linters
+
+        Returns
+        -------
+        description (Dict[str, Any]): the description of each input, the
+        abort_early flag and the dependencies between the inputs
+        """
+
+        return {
+            "inputs": [item.describe() for item in self._inputs],
+            "abort_early": self.abort_early,
+            "dependencies": {
+                name: sorted(names)
+                for name, names in self.dependencies.items()
+            },
+        }
+
+    def to_spec(self) -> Dict[str, Any]:
+        """
+        Convert the schema into a declarative spec made of JSON types,
+        which can be stored and built again by the from_spec method
+
+        Raises
+        -------
+        TypeError: if a check argument, a condition or a hook can't be
+        stored in the spec, like lambdas and nested functions
+
+        Returns
+        -------
+        spec (Dict[str, Any]): the spec of the schema
+        """
+
+        return schema_to_spec(self)
+
+    @classmethod
+    def from_spec(
+        cls, spec: Mapping[str, Any], allowed: Iterable[str] | None = None
+    ) -> Schema:
+        """
+        Build a schema from a declarative spec, the inputs built have no
+        data container, so the schema is validated with the data argument
+
+        Parameters
+        ----------
+        spec : Mapping[str, Any]
+                the spec returned by the to_spec method
+        allowed : Optional[Iterable[str]]
+                the modules and "module:name" references the spec can
+                use. If not passed any module level function can be
+                imported and called, so the spec must be trusted
+
+        Raises
+        -------
+        ValueError: if the spec has an unknown type, check or argument,
+        or a reference that is not allowed
+        ImportError: if a reference of the spec can't be imported
+
+        Returns
+        -------
+        schema (Schema): the schema built
+        """
+
+        with allow_references(allowed):
+            return schema_from_spec(spec)
+
+    def validate_incremental(self, data: Mapping[str, Any] | None = None) -> R:
+        """
+        Validate only the inputs whose values changed since the last
+        incremental validation, and the inputs that depend on them, and
+        return the validated values of all the inputs. The outcomes of
+        the unchanged inputs are reused, so their hooks are not called.
+        The values are compared by their pickled form, values that can't
+        be pickled are always validated. The stored values and outcomes
+        are not synchronized, the schema must not be validated
+        incrementally by multiple threads at once
+
+        Parameters
+        ----------
+        data : Optional[Mapping[str, Any]]
+                the values that will be validated, keyed by the inputs'
+                names. If not passed the data containers are read
+
+        Raises
+        -------
+        ValidationError: if the current value of any input is invalid
+
+        Returns
+        -------
+        result (R): a dict containing all the validated values
+        """
+
+        values = [self._get_value(item, data) for item in self._inputs]
+        # taken before the validation, which may change the values
+        snapshots = [snapshot(value) for value in values]
+        changed = set()
+
+        for index, item in enumerate(self._inputs):
+            stored = self._incremental.get(index)
+
+            if (
+                stored is None
+                or snapshots[index] is None
+                or stored[0] != snapshots[index]
+            ):
+                changed.add(item.name)
+
+        changed = self._add_dependents(changed)
+
+        return self._merge_outcomes(
+            self._incremental_outcomes(values, snapshots, changed)
+        )
+
+    def reset_incremental(self) -> None:
+        """
+        Discard the values and outcomes stored by the incremental
+        validation, so every input is validated on the next call
+        """
+
+        self._incremental.clear()
+
+    def _add_dependents(self, changed: Set[str]) -> Set[str]:
+        # repeated until no input is added, so dependencies of
+        # dependencies are followed
+        added = True
+
+        while added:
+            added = False
+
+            for name, names in self.dependencies.items():
+                if name not in changed and not names.isdisjoint(changed):
+                    changed.add(name)
+                    added = True
+
+        return changed
+
+    def _incremental_outcomes(
+        self,
+        values: List[Any],
+        snapshots: List[bytes | None],
+        changed: Set[str],
+    ) -> Iterator[
+        Tuple[Validator | InputItem, Tuple[Any, ValidationError | None]]
+    ]:
+        for index, item in enumerate(self._inputs):
+            if item.name in changed:
+                # stored before being yielded, as the merge stops at the
+                # first error when aborting early
+                outcome = item.run(values[index])
+                self._incremental[index] = (snapshots[index], outcome)
+
+            yield item, self._incremental[index][1]
+
+    def cached(self, maxsize: int = 1024) -> Self:
+        """
+        Cache the outcomes of the validate and safe_validate methods,
+        keyed by the validated data, so repeated payloads skip the
+        validation. The outcomes, including the failures, are stored and
+        returned as copies and the hooks are not called when an outcome
+        is reused. The data is compared by its pickled form, data that
+        can't be pickled is always validated. The compiled function and
+        the asynchronous and batch methods don't use the cache
+
+        Parameters
+        ----------
+        maxsize : int
+                the maximum number of outcomes stored, the least recently
+                used outcome is discarded when the limit is reached
+
+        Returns
+        -------
+        self (Schema): the schema itself
+        """
+
+        self._cache = ResultCache(maxsize)
+        return self
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Return the statistics of the cache
+
+        Returns
+        -------
+        info (Optional[CacheInfo]): the hits, misses, maximum size and
+        current size of the cache, or None if the cache is not enabled
+        """
+
+        if self._cache is None:
+            return None
+
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """
+        Discard the cached outcomes and reset the statistics of the cache
+        """
+
+        if self._cache is not None:
+            self._cache.clear()
+
 
 class InputItem(Generic[T]):
     """
@@ -146,7 +775,7 @@ class InputItem(Generic[T]):
     _path: str
             the property or method name that store the value within
             the data_container
-    _validators: List[Callable[[T], None]]
+    _validators: List[ValidatorCall | FunctionCall]
             a list of validators
     on_success: Callable[[], None]
             a callable used as a local success hook
@@ -161,6 +790,24 @@ class InputItem(Generic[T]):
     verify(result):
             Execute the inputs validators and return the result
 
+    check(value):
+            Execute the inputs validators on a value and return the result
+
+    run(value):
+            Execute the inputs validators on a value and return the result
+            and the error, without raising
+
+    run_async(value, limiter):
+            Execute the inputs validators on a value, awaiting the
+            coroutine validators, and return the result and the error
+
+    is_async():
+            Verify if any of the validators is a coroutine function or
+            uses one on a nested validator
+
+    describe():
+            Return a description of the input item checks
+
     validate(validator):
             receives a validator and appends it on the validators list
 
@@ -170,6 +817,10 @@ class InputItem(Generic[T]):
     modifier(modifier):
             Set a modifier to allow changes in the value after validation
 
+    reorder(warmup):
+            Mark the checks as order-independent and run the cheaper ones
+            first
+
     string():
             create a StringValidator using the input item as base
 
@@ -177,6 +828,18 @@ class InputItem(Generic[T]):
             create a NumericValidator using the input item as base
     """
 
+    __slots__ = (
+        "name",
+        "_schema",
+        "data_container",
+        "_path",
+        "_validators",
+        "_modifier",
+        "_optimizer",
+        "on_fail",
+        "on_success",
+    )
+
     def __init__(
         self,
         name: str,
@@ -208,8 +871,8 @@ class InputItem(Generic[T]):
         self._path = path
 
         self._validators = []
-        self._conditions = {}
         self._modifier = None
+        self._optimizer: CheckOrderOptimizer | None = None
         self.on_fail = on_fail
         self.on_success = on_success
 
@@ -273,32 +936,208 @@ class InputItem(Generic[T]):
         if result is None:
             result = self.get_container_value()
 
+        return self.check(result)
+
+    def check(self, value: T) -> T | None:
+        """
+        Execute all the validators on the received value, the data
+        container is never read
+
+        Parameters
+        ----------
+        value : T
+                the value that will be validated
+
+        Raises:
+        _______
+        ValidationError:
+                if any error happens during the validation process
+
+        Returns
+        -------
+        result (T): The value received after all the validation
+        """
+
+        result, error = self.run(value)
+
+        if error is not None:
+            raise error
+
+        return result
+
+    def run(self, value: T) -> Tuple[T | None, ValidationError | None]:
+        """
+        Execute all the validators on the received value without raising,
+        the data container is never read
+
+        Parameters
+        ----------
+        value : T
+                the value that will be validated
+
+        Returns
+        -------
+        result (Tuple[Optional[T], Optional[ValidationError]]):
+                The value received after all the validation and the
+                validation error, if any
+        """
+
+        if PROFILER.active:
+            return self._run_profiled(value)
+
+        if self._optimizer is not None:
+            return self._run_observed(value)
+
         for validator in self._validators:
-            if validator in self._conditions and not self._conditions[
-                validator
-            ](result):
+            condition = validator.condition
+
+            if condition is not None and not condition(value):
                 continue
 
-            try:
-                validator(result)
-            except ValidationError as error:
-                if self.on_fail is not None:
-                    self.on_fail()
-                elif (
-                    self._schema is not None
-                    and self._schema.on_fail is not None
-                ):
-                    self._schema.on_fail()
+            error = validator.check(value)
 
-                raise error
+            if error is not None:
+                self._call_fail_hook()
+                return value, error
+
+        return self._succeed(value)
+
+    def _run_profiled(
+        self, value: T
+    ) -> Tuple[T | None, ValidationError | None]:
+        for validator in self._validators:
+            condition = validator.condition
+
+            if condition is not None and not condition(value):
+                continue
+
+            start = perf_counter()
+            error = validator.check(value)
+            PROFILER.record(
+                self, validator, perf_counter() - start, error is not None
+            )
+
+            if error is not None:
+                self._call_fail_hook()
+                return value, error
+
+        return self._succeed(value)
+
+    def _run_observed(
+        self, value: T
+    ) -> Tuple[T | None, ValidationError | None]:
+        optimizer = self._optimizer
+        checks = self._validators
+        error = None
+
+        for position, validator in enumerate(checks):
+            condition = validator.condition
+
+            if condition is not None and not condition(value):
+                continue
+
+            start = perf_counter()
+            error = validator.check(value)
+            optimizer.record(
+                position, perf_counter() - start, error is not None
+            )
+
+            if error is not None:
+                break
+
+        # the runs of other threads may end the window at the same time
+        if optimizer.finish_run() and self._optimizer is optimizer:
+            self._validators = optimizer.order(checks)
+            self._optimizer = None
+
+        if error is not None:
+            self._call_fail_hook()
+            return value, error
+
+        return self._succeed(value)
+
+    async def run_async(
+        self, value: T, limiter: asyncio.Semaphore | None = None
+    ) -> Tuple[T | None, ValidationError | None]:
+        """
+        Execute all the validators on the received value without raising,
+        awaiting the coroutine validators. The validators are executed in
+        order, the synchronous ones are called inline
+
+        Parameters
+        ----------
+        value : T
+                the value that will be validated
+        limiter : Optional[asyncio.Semaphore]
+                a semaphore limiting the number of coroutine validators
+                awaited at the same time
+
+        Returns
+        -------
+        result (Tuple[Optional[T], Optional[ValidationError]]):
+                The value received after all the validation and the
+                validation error, if any
+        """
+
+        for validator in self._validators:
+            condition = validator.condition
+
+            if condition is not None and not condition(value):
+                continue
 
+            if validator.is_async():
+                error = await validator.check_async(value, limiter)
+            else:
+                error = validator.check(value)
+
+            if error is not None:
+                self._call_fail_hook()
+                return value, error
+
+        return self._succeed(value)
+
+    def is_async(self) -> bool:
+        """
+        Verify if any of the validators is a coroutine function or uses
+        one on a nested validator
+
+        Returns
+        -------
+        result (bool): if the input must be validated asynchronously
+        """
+
+        return any(validator.is_async() for validator in self._validators)
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Return a description of the input item checks, in the order they
+        are executed
+
+        Returns
+        -------
+        description (Dict[str, Any]): the name of the input item, and the
+        name, arguments and presence of a condition of each check
+        """
+
+        return {
+            "name": self.name,
+            "checks": [validator.describe() for validator in self._validators],
+        }
+
+    def _call_fail_hook(self) -> None:
+        if self.on_fail is not None:
+            self.on_fail()
+        elif self._schema is not None and self._schema.on_fail is not None:
+            self._schema.on_fail()
+
+    def _succeed(self, value: T) -> Tuple[T | None, None]:
         if self.on_success is not None:
             self.on_success()
 
         if self._modifier is not None:
-            return self._modifier(result)
+            return self._modifier(value), None
 
-        return result
+        return value, None
 
     def get_container_value(self) -> T:
         value = getattr(self.data_container, self._path)
@@ -312,11 +1151,23 @@ class InputItem(Generic[T]):
         """
         Append a validator in the input item validators list
 
+        Parameters
+        ----------
+        validator : Callable
+                a callable that raises a ValidationError if the received
+                value is invalid, coroutine functions are awaited by the
+                asynchronous validation methods
+
         Returns
         -------
         self (InputItem): The input item itself
         """
 
+        if inspect.iscoroutinefunction(validator):
+            validator = AsyncFunctionCall(validator)
+        elif not isinstance(validator, ValidatorCall):
+            validator = FunctionCall(validator)
+
         self._validators.append(validator)
         return self
 
@@ -335,7 +1186,7 @@ class InputItem(Generic[T]):
         InputItem
         """
 
-        self._conditions[self._validators[-1]] = condition
+        self._validators[-1].condition = condition
         return self
 
     def modifier(self, modifier: Callable[[T | None], T | None]) -> Self:
@@ -355,6 +1206,40 @@ class InputItem(Generic[T]):
         self._modifier = modifier
         return self
 
+    def reorder(self, warmup: int = 1000) -> Self:
+        """
+        Mark the checks as order-independent, so the cheaper checks and
+        the ones that fail more often are executed first. The checks are
+        sorted by static cost hints at once, then the checks executed by
+        the next validations are timed and their failures counted, and
+        the checks are sorted again by their observed cost divided by
+        their failure rate when the warm-up window ends. The nested
+        validators and the coroutine validators keep their position, only
+        the checks that don't read the items of the value, like required
+        and the length checks, move across them
+
+        Parameters
+        ----------
+        warmup : int
+                the number of validations measured before the observed
+                order is used, 0 keeps the static order
+
+        Raises
+        ------
+        ValueError: if the warm-up window is negative
+
+        Returns
+        -------
+        InputItem
+        """
+
+        if warmup < 0:
+            raise ValueError("The warm-up window can't be negative")
+
+        self._validators = order_checks(self._validators, static_rank)
+        self._optimizer = CheckOrderOptimizer(warmup) if warmup else None
+        return self
+
     def string(self) -> StringValidator[T]:
         """
         create a StringValidator using the input item as base
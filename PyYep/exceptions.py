@@ -1,4 +1,13 @@
-from typing import List
+from typing import List, Tuple
+
+# a segment of the path of an error, the keys of dicts and the names of
+# the inputs are strings and the indexes of arrays are ints
+PathSegment = str | int
+
+# the path stored as a linked list of (segment, rest) pairs, starting at
+# the outermost segment, so the nested validators prepend the segments
+# of their level without copying the segments of the inner levels
+LinkedPath = Tuple[PathSegment, "LinkedPath"] | None
 
 
 class ValidationError(Exception):
@@ -11,12 +20,32 @@ class ValidationError(Exception):
     ----------
     path : str
             the schema path of the input respnsable for the error
-            or the schema name itself
+            or the schema name itself, like items[0].name
+    path_segments : Tuple[Union[str, int], ...]
+            the keys and indexes of the path, like ("items", 0, "name")
+    json_pointer : str
+            the path as a JSON Pointer, like /items/0/name
     inner : Optional[List[ValidationError]]
             a list of inner error in case the exception is beeing raise for
             the schema and not a single input
+
+    Methods
+    -------
+    prepend_path(*segments):
+            Add segments to the start of the path
+
+    replace_path(*segments):
+            Replace the path by the received segments
+
+    nest_path(base, key):
+            Set the path of an error raised for an item of a nested value
+
+    copy():
+            Return a copy of the error and of its inner errors
     """
 
+    __slots__ = ("_path", "inner")
+
     def __init__(
         self,
         path: str,
@@ -36,13 +65,126 @@ class ValidationError(Exception):
         """
 
         super(ValidationError, self).__init__(message)
-        self._path = path
+        self._path: LinkedPath = (path, None) if path else None
         self.inner = inner
 
+    def __reduce__(self):
+        # the default reduce passes only the message to __init__
+        return (
+            ValidationError,
+            ("", str(self), self.inner),
+            {"_path": self._path},
+        )
+
+    def copy(self) -> "ValidationError":
+        """
+        Return a copy of the error and of its inner errors, the paths of
+        the copies can be changed without changing the original ones
+
+        Returns
+        -------
+        error (ValidationError): the copy of the error
+        """
+
+        error = ValidationError(
+            "", str(self), [inner.copy() for inner in self.inner]
+        )
+        # the linked paths are immutable, so they are shared
+        error._path = self._path
+
+        return error
+
+    def prepend_path(self, *segments: PathSegment) -> None:
+        """
+        Add segments to the start of the path, the existing segments are
+        not copied
+
+        Parameters
+        ----------
+        *segments : Union[str, int]
+                the keys and indexes added, from the outermost
+        """
+
+        path = self._path
+
+        for segment in reversed(segments):
+            path = (segment, path)
+
+        self._path = path
+
+    def replace_path(self, *segments: PathSegment) -> None:
+        """
+        Replace the path by the received segments
+
+        Parameters
+        ----------
+        *segments : Union[str, int]
+                the keys and indexes of the path, from the outermost
+        """
+
+        self._path = None
+        self.prepend_path(*segments)
+
+    def nest_path(self, base: str, key: PathSegment) -> None:
+        """
+        Set the path of an error raised for an item of an array or dict,
+        the path of an error without inner errors is replaced by the path
+        of the item, the paths of the inner errors are prefixed by it
+
+        Parameters
+        ----------
+        base : str
+                the path of the array or dict, empty for the outermost one
+        key : Union[str, int]
+                the key or index of the item
+        """
+
+        segments = (base, key) if base else (key,)
+
+        if not self.inner:
+            self.replace_path(*segments)
+            return
+
+        # the segments are linked in front of the inner paths, which are
+        # not copied, so the cost doesn't grow with the depth of the errors
+        for error in self.inner:
+            error.prepend_path(*segments)
+
+    @property
+    def path_segments(self) -> Tuple[PathSegment, ...]:
+        segments = []
+        path = self._path
+
+        while path is not None:
+            segment, path = path
+            segments.append(segment)
+
+        return tuple(segments)
+
     @property
     def path(self) -> str:
-        return self._path
+        parts = []
+        path = self._path
+
+        while path is not None:
+            segment, path = path
+
+            if isinstance(segment, int):
+                parts.append(f"[{segment}]")
+            elif parts:
+                parts.append(f".{segment}")
+            else:
+                parts.append(segment)
+
+        return "".join(parts)
 
     @path.setter
     def path(self, path: str):
-        self._path = path.replace("._PyYepBlank", "")
+        self._path = (path, None) if path else None
+
+    @property
+    def json_pointer(self) -> str:
+        return "".join(
+            "/" + str(segment).replace("~", "~0").replace("/", "~1")
+            for segment in self.path_segments
+        )
@@ -1,5 +1,27 @@
-import re
+from functools import cache
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 from PyYep.exceptions import ValidationError
+from PyYep.utils.patterns import compile_pattern, register_pattern
+from PyYep.utils.vectorize import is_ndarray, numpy
+
+
+CPF_PATTERN = register_pattern(
+    "pt_BR.cpf", r"(^\d{3}\x2E\d{3}\x2E\d{3}\x2D\d{2}$)"
+)
+CNPJ_PATTERN = register_pattern(
+    "pt_BR.cnpj", r"(^\d{2}.\d{3}.\d{3}/\d{4}-\d{2}$)"
+)
+NON_DIGITS = compile_pattern(r"[^0-9]")
+
+CPF_FIRST_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+CPF_SECOND_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+CNPJ_FIRST_WEIGHTS = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+CNPJ_SECOND_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# the slices of the formatted documents holding each group of digits
+# and the position of the first digit of each group
+CPF_GROUPS = ((0, 3, 0), (4, 7, 3), (8, 11, 6))
+CNPJ_GROUPS = ((0, 2, 0), (3, 6, 2), (7, 10, 5), (11, 15, 8))
 
 
 class DocumentsValidators:
@@ -15,6 +37,12 @@ class DocumentsValidators:
 
     cpf(value):
         Verify if the received value is a valid cpf
+
+    cnpj_many(values):
+        Verify a batch of values and return a mask of the invalid cnpjs
+
+    cpf_many(values):
+        Verify a batch of values and return a mask of the invalid cpfs
     """
 
     def cnpj(self, value: str) -> None:
@@ -36,12 +64,12 @@ class DocumentsValidators:
         None
         """
 
-        if re.fullmatch(r"(^\d{2}.\d{3}.\d{3}/\d{4}-\d{2}$)", value) is None:
+        if CNPJ_PATTERN.fullmatch(value) is None:
             raise ValidationError(
                 "", "Value for CNPJ type does not match a valid format"
             )
 
-        value = re.sub(r"[^0-9]", "", value)
+        value = NON_DIGITS.sub("", value)
 
         if len(set([*value])) == 1:
             raise ValidationError("", "Invalid CNPJ received")
@@ -91,15 +119,12 @@ class DocumentsValidators:
         None
         """
 
-        if (
-            re.fullmatch(r"(^\d{3}\x2E\d{3}\x2E\d{3}\x2D\d{2}$)", value)
-            is None
-        ):
+        if CPF_PATTERN.fullmatch(value) is None:
             raise ValidationError(
                 "", "Value for CPF type does not match a valid format"
             )
 
-        value = re.sub(r"[^0-9]", "", value)
+        value = NON_DIGITS.sub("", value)
 
         if len(set([*value])) == 1:
             raise ValidationError("", "Invalid CPF received")
@@ -124,3 +149,183 @@ class DocumentsValidators:
 
         if (s_result * 10) % 11 != int(value[-1]):
             raise ValidationError("", "CPF value does not pass validation")
+
+    def cnpj_many(self, values: Iterable[Any]) -> List[bool] | Any:
+        """
+        Verify a batch of values, with the same rules of the cnpj method.
+        The weighted sums of the check digits are read from tables
+        built once for each group of digits, so the values are neither
+        converted or iterated digit by digit
+
+        Parameters
+        ----------
+        values : (Iterable[Any])
+            the values that will be checked, values that are not strings
+            are considered invalid
+
+        Returns
+        ----------
+        mask (Union[List[bool], numpy.ndarray]):
+            True for the positions of the invalid cnpjs, a NumPy array if
+            the values are received as a NumPy array
+        """
+
+        return check_many(values, is_invalid_cnpj, self.cnpj)
+
+    def cpf_many(self, values: Iterable[Any]) -> List[bool] | Any:
+        """
+        Verify a batch of values, with the same rules of the cpf method.
+        The weighted sums of the check digits are read from tables
+        built once for each group of digits, so the values are neither
+        converted or iterated digit by digit
+
+        Parameters
+        ----------
+        values : (Iterable[Any])
+            the values that will be checked, values that are not strings
+            are considered invalid
+
+        Returns
+        ----------
+        mask (Union[List[bool], numpy.ndarray]):
+            True for the positions of the invalid cpfs, a NumPy array if
+            the values are received as a NumPy array
+        """
+
+        return check_many(values, is_invalid_cpf, self.cpf)
+
+
+@cache
+def group_table(
+    first_weights: Tuple[int, ...], second_weights: Tuple[int, ...]
+) -> Dict[str, Tuple[int, int]]:
+    # maps each group of digits to its weighted sums for both check
+    # digits, so the sums of a document take a lookup per group
+    size = len(first_weights)
+    table = {}
+
+    for number in range(10**size):
+        digits = str(number).zfill(size)
+        values = [int(digit) for digit in digits]
+        table[digits] = (
+            sum(map(int.__mul__, values, first_weights)),
+            sum(map(int.__mul__, values, second_weights)),
+        )
+
+    return table
+
+
+@cache
+def group_tables(
+    groups: Tuple[Tuple[int, int, int], ...],
+    first_weights: Tuple[int, ...],
+    second_weights: Tuple[int, ...],
+) -> Tuple[Tuple[int, int, Dict[str, Tuple[int, int]]], ...]:
+    tables = []
+
+    for start, stop, position in groups:
+        end = position + stop - start
+        table = group_table(
+            first_weights[position:end], second_weights[position:end]
+        )
+        tables.append((start, stop, table))
+
+    return tuple(tables)
+
+
+def weighted_sums(
+    value: str, tables: Tuple[Tuple[int, int, Dict[str, Any]], ...]
+) -> Tuple[int, int]:
+    first = second = 0
+
+    for start, stop, table in tables:
+        group_first, group_second = table[value[start:stop]]
+        first += group_first
+        second += group_second
+
+    return first, second
+
+
+def is_invalid_cpf(value: str) -> bool | None:
+    if CPF_PATTERN.fullmatch(value) is None:
+        return True
+
+    # \d also matches non ascii digits, which are checked by the cpf
+    # method itself
+    if not value.isascii():
+        return None
+
+    if value.count(value[0]) == 11:
+        return True
+
+    tables = group_tables(CPF_GROUPS, CPF_FIRST_WEIGHTS, CPF_SECOND_WEIGHTS)
+    first, second = weighted_sums(value, tables)
+    first_digit = int(value[12])
+    second += CPF_SECOND_WEIGHTS[-1] * first_digit
+
+    return (
+        first * 10 % 11 != first_digit
+        or second * 10 % 11 != int(value[13])
+    )
+
+
+def is_invalid_cnpj(value: str) -> bool | None:
+    if CNPJ_PATTERN.fullmatch(value) is None:
+        return True
+
+    # the pattern accepts any separator between the first groups, values
+    # using digits as separators are checked by the cnpj method itself
+    if not value.isascii() or value[2].isdigit() or value[6].isdigit():
+        return None
+
+    if value.count(value[0]) == 14:
+        return True
+
+    tables = group_tables(CNPJ_GROUPS, CNPJ_FIRST_WEIGHTS, CNPJ_SECOND_WEIGHTS)
+    first, second = weighted_sums(value, tables)
+    first_digit = int(value[16])
+    first %= 11
+    second = (second + CNPJ_SECOND_WEIGHTS[-1] * first_digit) % 11
+
+    # a remainder lower than 2 never passes the validation of the
+    # cnpj method
+    return (
+        first < 2
+        or 11 - first != first_digit
+        or second < 2
+        or 11 - second != int(value[17])
+    )
+
+
+def check_many(
+    values: Iterable[Any],
+    is_invalid: Callable[[str], bool | None],
+    check: Callable[[str], None],
+) -> List[bool] | Any:
+    mask = []
+
+    for value in values:
+        if not isinstance(value, str):
+            mask.append(True)
+            continue
+
+        invalid = is_invalid(value)
+
+        if invalid is None:
+            invalid = fails(check, value)
+
+        mask.append(invalid)
+
+    if is_ndarray(values):
+        return numpy.array(mask, dtype=bool)
+
+    return mask
+
+
+def fails(check: Callable[[str], None], value: str) -> bool:
+    try:
+        check(value)
+    except ValidationError:
+        return True
+
+    return False
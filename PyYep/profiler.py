@@ -0,0 +1,296 @@
+"""
+Measures the time spent by each check of the validated fields.
+
+While a profile is active, the input items time each of their checks and
+the validators time their type coercion. The measures are grouped by
+the path of the field, like user.email or items[].price, and by the name
+of the check, like StringValidator.email. When no profile is active the
+validation only reads a flag, so the cost of the profiler is negligible.
+Compiled functions, process pools and coroutine validators are not
+profiled.
+
+Functions:
+    profile
+
+Classes:
+    ProfileEntry
+    ProfileReport
+"""
+
+from __future__ import annotations
+import json
+from contextlib import contextmanager
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+)
+import PyYep
+from PyYep.utils.decorators import ValidatorCall
+
+if TYPE_CHECKING:
+    from PyYep import InputItem, Schema
+    from PyYep.validators.validator import Validator
+
+
+class ProfileEntry(NamedTuple):
+    """
+    The measures of a check of a field
+
+    Attributes
+    ----------
+    path : str
+            the path of the field
+    check : str
+            the name of the check
+    calls : int
+            the number of times the check was executed
+    total : float
+            the cumulative time of the check in seconds, including the
+            time of the nested validators
+    failures : int
+            the number of times the check failed
+    """
+
+    path: str
+    check: str
+    calls: int
+    total: float
+    failures: int
+
+    @property
+    def average(self) -> float:
+        return self.total / self.calls
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.calls
+
+
+class ProfileReport:
+    """
+    A class to represent the measures collected by a profile.
+
+    ...
+
+    Attributes
+    ----------
+    entries : List[ProfileEntry]
+            the measures of each check, sorted by the cumulative time
+
+    Methods
+    -------
+    to_dict():
+            Return the measures as a list of dicts
+
+    dump(path):
+            Write the measures to a json file
+    """
+
+    def __init__(self, entries: List[ProfileEntry]) -> None:
+        """
+        Constructs all the necessary attributes for the report object.
+
+        Parameters
+        ----------
+                entries (List[ProfileEntry]): the measures of each check
+        """
+
+        self.entries = sorted(entries, key=lambda entry: -entry.total)
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """
+        Return the measures as a list of dicts, including the average time
+        and the failure rate of each check
+
+        Returns
+        -------
+        result (List[Dict[str, Any]]): the measures of each check
+        """
+
+        return [
+            {
+                **entry._asdict(),
+                "average": entry.average,
+                "failure_rate": entry.failure_rate,
+            }
+            for entry in self.entries
+        ]
+
+    def dump(self, path: str) -> None:
+        """
+        Write the measures to a json file
+
+        Parameters
+        ----------
+        path : str
+                the path of the file
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'field -> check':<48}{'calls':>10}{'total ms':>12}"
+            f"{'avg us':>10}{'failed':>8}"
+        ]
+
+        for entry in self.entries:
+            lines.append(
+                f"{entry.path + ' -> ' + entry.check:<48}{entry.calls:>10}"
+                f"{entry.total * 1e3:>12.3f}{entry.average * 1e6:>10.2f}"
+                f"{entry.failure_rate:>8.1%}"
+            )
+
+        return "\n".join(lines)
+
+
+class Profiler:
+    """
+    A class to represent the state of the profiling, shared by all the
+    validators.
+
+    ...
+
+    Attributes
+    ----------
+    active : bool
+            if the checks must be measured
+
+    Methods
+    -------
+    record(input_item, check, elapsed, failed):
+            Add a measure of a check
+
+    start(roots):
+            Discard the previous measures and activate the profiling
+
+    stop():
+            Deactivate the profiling and return the report
+    """
+
+    def __init__(self) -> None:
+        self.active = False
+        self._lock = Lock()
+        self._measures: Dict[Tuple[int, str], List[Any]] = {}
+        self._paths: Dict[int, str] = {}
+
+    def record(
+        self, input_item: InputItem, check: Any, elapsed: float, failed: bool
+    ) -> None:
+        key = (id(input_item), check_name(check))
+
+        with self._lock:
+            measure = self._measures.get(key)
+
+            if measure is None:
+                # the input item is kept, so its id is not reused
+                measure = self._measures[key] = [input_item, 0, 0.0, 0]
+
+            measure[1] += 1
+            measure[2] += elapsed
+            measure[3] += failed
+
+    def start(self, roots: Tuple[Schema | Validator, ...]) -> None:
+        if self.active:
+            raise RuntimeError("A profile is already active")
+
+        self._measures = {}
+        self._paths = {}
+
+        for root in roots:
+            if isinstance(root, PyYep.Schema):
+                for item in root._inputs:
+                    self._add_paths(item, item.name)
+            else:
+                self._add_paths(root, root.name)
+
+        self.active = True
+
+    def stop(self) -> ProfileReport:
+        self.active = False
+
+        with self._lock:
+            measures = list(self._measures.items())
+
+        entries = []
+
+        for (key, check), (input_item, calls, total, failures) in measures:
+            path = self._paths.get(key, input_item.name or "<unnamed>")
+            entries.append(ProfileEntry(path, check, calls, total, failures))
+
+        return ProfileReport(entries)
+
+    def _add_paths(self, item: Validator | InputItem, path: str) -> None:
+        input_item = item
+
+        if not isinstance(item, PyYep.InputItem):
+            input_item = item.input_item
+
+        if input_item is None:
+            return
+
+        self._paths[id(input_item)] = path
+
+        for check in input_item._validators:
+            if not isinstance(check, ValidatorCall):
+                continue
+
+            name = check.func.__qualname__
+
+            if name == "ArrayValidator.of":
+                self._add_paths(check.args[0], f"{path}[]")
+            elif name == "DictValidator.shape":
+                for key, nested in check.args[0].items():
+                    self._add_paths(nested, f"{path}.{key}" if path else key)
+            elif name == "DictValidator.columns":
+                for key, nested in check.args[0].items():
+                    column = f"{path}.{key}" if path else key
+                    self._add_paths(nested, f"{column}[]")
+
+
+def check_name(check: Any) -> str:
+    if isinstance(check, str):
+        return check
+
+    return check.name
+
+
+PROFILER = Profiler()
+
+
+@contextmanager
+def profile(*roots: Schema | Validator) -> Iterator[ProfileReport]:
+    """
+    Measure the checks executed inside the context, the report is filled
+    when the context exits
+
+    Parameters
+    ----------
+    *roots : Union[Schema, Validator]
+            the schemas and validators used to name the paths of the
+            fields, the checks of other validators are named after the
+            name of their input
+
+    Raises
+    ------
+    RuntimeError: if a profile is already active
+
+    Returns
+    -------
+    report (Iterator[ProfileReport]): the report of the profile
+    """
+
+    PROFILER.start(roots)
+    report = ProfileReport([])
+
+    try:
+        yield report
+    finally:
+        report.entries = PROFILER.stop().entries
@@ -0,0 +1,48 @@
+from typing import Generic, List, TypeVar
+from PyYep.exceptions import ValidationError
+
+
+T = TypeVar("T")
+
+
+class ValidationResult(Generic[T]):
+    """
+    A class to represent the result of a validation that does not raise.
+
+    ...
+
+    Attributes
+    ----------
+    value : Optional[T]
+            the validated value, None if the validation failed
+    errors : List[ValidationError]
+            the errors found during the validation
+    valid : bool
+            if the validation succeeded
+    """
+
+    def __init__(
+        self, value: T | None, errors: List[ValidationError]
+    ) -> None:
+        """
+        Constructs all the necessary attributes for the validation
+        result object.
+
+        Parameters
+        ----------
+                value (T): the validated value
+                errors (list): the errors found during the validation
+        """
+
+        self.value = value
+        self.errors = errors
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        if self.errors:
+            return f"ValidationResult(errors={self.errors!r})"
+
+        return f"ValidationResult(value={self.value!r})"
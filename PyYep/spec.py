@@ -0,0 +1,645 @@
+"""
+Converts schemas and validators to and from a declarative spec.
+
+A spec is a dict made of JSON types describing a schema or a validator:
+the type and name of each validator, its checks in order, by the name
+of the validator method and its arguments, and its settings. Nested
+validators, the allowed values of membership checks and the other
+arguments that are not JSON types are stored as dicts with a single
+key starting with "$", like {"$validator": {...}} or {"$in": [...]}.
+Custom checks, conditions, modifiers and hooks are stored by reference,
+as "module:qualified name" strings, so they must be module level
+functions. The prepared schemas can be cached on disk, so a worker
+loads a ready to run schema without rebuilding it from its spec.
+
+Building a spec imports the modules of its references and installs
+their functions as checks and hooks, and loading a cached schema
+unpickles it, so both can execute arbitrary code. The specs and the
+cache directories must be trusted, or the references restricted to an
+allow-list and the cached files signed with a secret.
+
+Functions:
+    to_spec
+    from_spec
+    load_spec
+"""
+
+from __future__ import annotations
+import hashlib
+import hmac
+import importlib
+import os
+import pickle
+import re
+import sys
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+)
+import PyYep
+from PyYep.utils.decorators import ProxyContainer, ValidatorCall
+from PyYep.utils.membership import MembershipLookup
+
+if TYPE_CHECKING:
+    from PyYep import InputItem, Schema
+    from PyYep.validators.validator import Validator
+
+
+# changed when the format of the specs or of the cached schemas changes,
+# so the schemas cached by previous versions are not loaded
+SPEC_VERSION = 2
+
+Spec = Dict[str, Any]
+
+# the modules and references that can be resolved while a spec is built,
+# None when any module level function or class can be resolved
+ALLOWED_REFERENCES: ContextVar[FrozenSet[str] | None] = ContextVar(
+    "allowed_references", default=None
+)
+
+DIGEST_SIZE = hashlib.sha256().digest_size
+
+# the errors of a cached file that is missing, truncated, corrupted or
+# references a function or attribute that doesn't exist anymore
+CACHE_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    ImportError,
+    AttributeError,
+    IndexError,
+    KeyError,
+    TypeError,
+    ValueError,
+)
+
+
+def to_spec(item: Schema | Validator | InputItem) -> Spec:
+    """
+    Convert a schema, a validator or an input item into a spec
+
+    Parameters
+    ----------
+    item : Union[Schema, Validator, InputItem]
+            the object that will be converted
+
+    Raises
+    ------
+    TypeError: if a check argument, a condition or a hook can't be
+    stored in the spec, like lambdas and nested functions
+
+    Returns
+    -------
+    spec (Dict[str, Any]): the spec of the object
+    """
+
+    if isinstance(item, PyYep.Schema):
+        return schema_to_spec(item)
+
+    if isinstance(item, PyYep.InputItem):
+        return {
+            "type": "InputItem",
+            "name": item.name,
+            **input_item_to_spec(item),
+        }
+
+    return validator_to_spec(item)
+
+
+def from_spec(
+    spec: Spec, allowed: Iterable[str] | None = None
+) -> Schema | Validator | InputItem:
+    """
+    Build a schema, a validator or an input item from a spec. The input
+    items built have no data container, so the schemas are validated
+    with the data argument and the validators with the validate method.
+    The references of the spec are imported and their functions are
+    called by the validation, so a spec from an untrusted source must
+    be built with an allow-list of references
+
+    Parameters
+    ----------
+    spec : Dict[str, Any]
+            the spec of the object
+    allowed : Optional[Iterable[str]]
+            the modules, like "myapp.checks", and the "module:name"
+            references that can be resolved. If not passed any module
+            level function or class can be resolved
+
+    Raises
+    ------
+    ValueError: if the spec has an unknown type, check or argument, or
+    a reference that is not allowed
+    ImportError: if a reference can't be imported
+
+    Returns
+    -------
+    result (Union[Schema, Validator, InputItem]): the object built
+    """
+
+    with allow_references(allowed):
+        if "inputs" in spec:
+            return schema_from_spec(spec)
+
+        if spec.get("type") == "InputItem":
+            input_item = PyYep.InputItem(spec.get("name", ""), None, "")
+            add_checks(input_item, spec)
+
+            return input_item
+
+        return validator_from_spec(spec)
+
+
+def load_spec(
+    spec: Spec,
+    cache_dir: str,
+    allowed: Iterable[str] | None = None,
+    secret: bytes | None = None,
+) -> Schema | Validator | InputItem:
+    """
+    Build a schema, a validator or an input item from a spec, caching
+    the object built on disk. The file is keyed by the hash of the spec,
+    of the allowed references and of the versions of Python and of the
+    spec format, so the following calls, including the ones of other
+    processes, unpickle the object instead of rebuilding it. Missing,
+    stale or corrupted files are rebuilt and replaced atomically.
+
+    Unpickling a file can execute arbitrary code, so the files are
+    signed with the secret and the files with an invalid signature are
+    rebuilt. Without a secret the files only carry a checksum, which
+    detects corrupted files but not forged ones, so the cache directory
+    must be writable by trusted users only
+
+    Parameters
+    ----------
+    spec : Dict[str, Any]
+            the spec of the object
+    cache_dir : str
+            the directory of the cached objects, created if missing
+    allowed : Optional[Iterable[str]]
+            the modules and references that can be resolved, as in
+            from_spec
+    secret : Optional[bytes]
+            the key of the HMAC signing the cached files
+
+    Raises
+    ------
+    ValueError: if the spec has an unknown type, check or argument, or
+    a reference that is not allowed
+    ImportError: if a reference can't be imported
+
+    Returns
+    -------
+    result (Union[Schema, Validator, InputItem]): the object built
+    """
+
+    if allowed is not None:
+        allowed = sorted(allowed)
+
+    # pickling the spec is faster than dumping it as JSON, specs read
+    # from the same file have the same order of keys, so the same hash
+    payload = pickle.dumps(
+        [SPEC_VERSION, sys.version, allowed, spec], pickle.HIGHEST_PROTOCOL
+    )
+    key = hashlib.sha256(payload).hexdigest()
+    path = os.path.join(cache_dir, f"{key}.pickle")
+
+    try:
+        with open(path, "rb") as file:
+            content = file.read()
+
+        digest = content[:DIGEST_SIZE]
+        data = content[DIGEST_SIZE:]
+
+        # the data is only unpickled when its signature is valid
+        if hmac.compare_digest(digest, sign(data, secret)):
+            return pickle.loads(data)
+    except CACHE_ERRORS:
+        # a missing file, or a file that can't be loaded anymore, like
+        # one referencing a function that was removed, is rebuilt
+        pass
+
+    result = from_spec(spec, allowed)
+    data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    os.makedirs(cache_dir, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=cache_dir)
+
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(sign(data, secret))
+            file.write(data)
+
+        # concurrent writers replace the file with the same content
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+    return result
+
+
+def sign(data: bytes, secret: bytes | None) -> bytes:
+    if secret is None:
+        return hashlib.sha256(data).digest()
+
+    return hmac.new(secret, data, hashlib.sha256).digest()
+
+
+@contextmanager
+def allow_references(allowed: Iterable[str] | None) -> Iterator[None]:
+    """
+    Restrict the references resolved within the context, the nested
+    specs built without an allow-list keep the enclosing one
+
+    Parameters
+    ----------
+    allowed : Optional[Iterable[str]]
+            the modules and "module:name" references that can be
+            resolved, None keeps the current restriction
+    """
+
+    if allowed is None:
+        yield
+        return
+
+    token = ALLOWED_REFERENCES.set(frozenset(allowed))
+
+    try:
+        yield
+    finally:
+        ALLOWED_REFERENCES.reset(token)
+
+
+def schema_to_spec(schema: Schema) -> Spec:
+    spec: Spec = {
+        "inputs": [to_spec(item) for item in schema._inputs],
+        "abort_early": schema.abort_early,
+    }
+
+    if schema.max_errors is not None:
+        spec["max_errors"] = schema.max_errors
+
+    if schema.dependencies:
+        spec["dependencies"] = {
+            name: sorted(names) for name, names in schema.dependencies.items()
+        }
+
+    if schema.on_fail is not None:
+        spec["on_fail"] = reference(schema.on_fail)
+
+    if schema._cache is not None:
+        spec["cache"] = schema._cache.maxsize
+
+    return spec
+
+
+def schema_from_spec(spec: Spec) -> Schema:
+    schema = PyYep.Schema(
+        [from_spec(item) for item in spec["inputs"]],
+        on_fail=resolve_optional(spec.get("on_fail")),
+        abort_early=spec.get("abort_early", True),
+        dependencies=spec.get("dependencies"),
+        max_errors=spec.get("max_errors"),
+    )
+
+    if "cache" in spec:
+        schema.cached(spec["cache"])
+
+    return schema
+
+
+def validator_to_spec(validator: Validator) -> Spec:
+    spec: Spec = {"type": type_name(type(validator)), "name": validator.name}
+
+    if isinstance(validator, PyYep.BooleanValidator):
+        spec["strict"] = validator.strict
+
+    if validator.input_item is not None:
+        spec.update(input_item_to_spec(validator.input_item))
+
+    if validator._max_errors is not None:
+        spec["max_errors"] = validator._max_errors
+
+    if validator._cache is not None:
+        spec["cache"] = validator._cache.maxsize
+
+    return spec
+
+
+def validator_from_spec(spec: Spec) -> Validator:
+    cls = resolve_type(spec.get("type", ""))
+    args: List[Any] = []
+    name = spec.get("name", "")
+
+    if issubclass(cls, PyYep.BooleanValidator):
+        args.append(spec.get("strict", False))
+
+    # unnamed validators, like the nested ones, read their values from a
+    # proxy, as the ones built directly
+    if name:
+        args.append(PyYep.InputItem(name, None, ""))
+    elif needs_input_item(spec):
+        args.append(PyYep.InputItem("", ProxyContainer(), "get_value"))
+
+    validator = cls(*args)
+
+    if validator.input_item is not None:
+        add_checks(validator.input_item, spec, validator)
+
+    if "max_errors" in spec:
+        validator.max_errors(spec["max_errors"])
+
+    if "cache" in spec:
+        validator.cached(spec["cache"])
+
+    return validator
+
+
+def input_item_to_spec(input_item: InputItem) -> Spec:
+    spec: Spec = {"checks": []}
+
+    for check in input_item._validators:
+        if isinstance(check, ValidatorCall):
+            entry: Spec = {"check": check.func.__name__}
+
+            if check.args:
+                entry["args"] = [encode(arg) for arg in check.args]
+
+            if check.kwargs:
+                entry["kwargs"] = {
+                    key: encode(arg) for key, arg in check.kwargs.items()
+                }
+        else:
+            entry = {"function": reference(check.func)}
+
+        if check.condition is not None:
+            entry["condition"] = reference(check.condition)
+
+        spec["checks"].append(entry)
+
+    for hook in ("modifier", "on_success", "on_fail"):
+        func = getattr(input_item, "_modifier" if hook == "modifier" else hook)
+
+        if func is not None:
+            spec[hook] = reference(func)
+
+    return spec
+
+
+def add_checks(
+    input_item: InputItem, spec: Spec, validator: Validator | None = None
+) -> None:
+    for entry in spec.get("checks", []):
+        if "function" in entry:
+            input_item.validate(resolve(entry["function"]))
+        elif validator is None:
+            raise ValueError("Input items only have function checks")
+        else:
+            method = getattr(type(validator), entry["check"], None)
+
+            if not is_validator_method(method):
+                raise ValueError(
+                    f"Unknown check {entry['check']} of "
+                    f"{type(validator).__name__}"
+                )
+
+            method(
+                validator,
+                *[decode(arg) for arg in entry.get("args", [])],
+                **{
+                    key: decode(arg)
+                    for key, arg in entry.get("kwargs", {}).items()
+                },
+            )
+
+        if "condition" in entry:
+            input_item.condition(resolve(entry["condition"]))
+
+    input_item.modifier(resolve_optional(spec.get("modifier")))
+    input_item.on_success = resolve_optional(spec.get("on_success"))
+    input_item.on_fail = resolve_optional(spec.get("on_fail"))
+
+
+def needs_input_item(spec: Spec) -> bool:
+    keys = ("checks", "modifier", "on_success", "on_fail")
+
+    return any(spec.get(key) for key in keys)
+
+
+def is_validator_method(method: Any) -> bool:
+    # the methods adding checks are the ones wrapped by validator_method,
+    # so the other methods of the validators can't be called by a spec
+    return callable(method) and hasattr(method, "__wrapped__")
+
+
+def encode(arg: Any) -> Any:
+    """
+    Convert an argument of a check into JSON types
+
+    Parameters
+    ----------
+    arg : Any
+            the argument received by the check
+
+    Raises
+    ------
+    TypeError: if the argument can't be stored in the spec
+
+    Returns
+    -------
+    result (Any): the encoded argument
+    """
+
+    if arg is None or isinstance(arg, (bool, int, float, str)):
+        return arg
+
+    if isinstance(arg, PyYep.validators.validator.Validator):
+        return {"$validator": validator_to_spec(arg)}
+
+    if isinstance(arg, MembershipLookup):
+        return {"$in": [encode(item) for item in arg.items]}
+
+    if isinstance(arg, list):
+        return [encode(item) for item in arg]
+
+    if isinstance(arg, tuple):
+        return {"$tuple": [encode(item) for item in arg]}
+
+    if isinstance(arg, (set, frozenset)):
+        return {"$set": [encode(item) for item in arg]}
+
+    if isinstance(arg, range):
+        return {"$range": [arg.start, arg.stop, arg.step]}
+
+    if isinstance(arg, re.Pattern):
+        return {"$pattern": [arg.pattern, arg.flags]}
+
+    if isinstance(arg, dict) and all(isinstance(key, str) for key in arg):
+        return {"$dict": {key: encode(value) for key, value in arg.items()}}
+
+    if callable(arg):
+        return {"$ref": reference(arg)}
+
+    raise TypeError(f"The argument {arg!r} can't be stored in a spec")
+
+
+def decode(arg: Any) -> Any:
+    """
+    Convert an encoded argument of a check back into its value
+
+    Parameters
+    ----------
+    arg : Any
+            the encoded argument
+
+    Raises
+    ------
+    ValueError: if the argument has an unknown tag or an invalid value
+
+    Returns
+    -------
+    result (Any): the argument received by the check
+    """
+
+    if isinstance(arg, list):
+        return [decode(item) for item in arg]
+
+    if not isinstance(arg, dict):
+        return arg
+
+    if len(arg) != 1:
+        raise ValueError(f"Unknown argument {arg!r} in a spec")
+
+    [(tag, value)] = arg.items()
+
+    if tag == "$validator":
+        return validator_from_spec(value)
+
+    if tag == "$ref":
+        return resolve(value)
+
+    try:
+        if tag == "$in":
+            return MembershipLookup(decode(value))
+
+        if tag == "$tuple":
+            return tuple(decode(value))
+
+        if tag == "$set":
+            return frozenset(decode(value))
+
+        if tag == "$range":
+            return range(*value)
+
+        if tag == "$pattern":
+            return re.compile(*value)
+
+        if tag == "$dict":
+            return {key: decode(item) for key, item in value.items()}
+    except (AttributeError, TypeError, re.error) as error:
+        raise ValueError(f"Invalid argument {arg!r} in a spec") from error
+
+    raise ValueError(f"Unknown argument {arg!r} in a spec")
+
+
+def type_name(cls: type) -> str:
+    if getattr(PyYep, cls.__name__, None) is cls:
+        return cls.__name__
+
+    return reference(cls)
+
+
+def resolve_type(name: str) -> type:
+    cls = getattr(PyYep, name, None) if ":" not in name else resolve(name)
+
+    if not isinstance(cls, type) or not issubclass(
+        cls, PyYep.validators.validator.Validator
+    ):
+        raise ValueError(f"Unknown validator type {name!r} in a spec")
+
+    return cls
+
+
+def reference(func: Callable[..., Any]) -> str:
+    """
+    Return the "module:qualified name" reference of a function or class
+
+    Parameters
+    ----------
+    func : Callable
+            the module level function or class
+
+    Raises
+    ------
+    TypeError: if the function can't be imported by its reference, like
+    lambdas, nested functions and bound methods of instances
+
+    Returns
+    -------
+    reference (str): the reference of the function
+    """
+
+    module = getattr(func, "__module__", None)
+    name = getattr(func, "__qualname__", None)
+
+    if module is not None and name is not None and "<" not in name:
+        ref = f"{module}:{name}"
+
+        try:
+            if resolve(ref) == func:
+                return ref
+        except (ImportError, AttributeError):
+            pass
+
+    raise TypeError(
+        f"{func!r} can't be stored in a spec, it must be a module level "
+        "function or class"
+    )
+
+
+def resolve(ref: str) -> Any:
+    """
+    Import the function or class of a "module:qualified name" reference
+
+    Parameters
+    ----------
+    ref : str
+            the reference of the function
+
+    Raises
+    ------
+    ValueError: if the reference is not allowed by the current spec
+    ImportError: if the module can't be imported
+    AttributeError: if the module doesn't have the function
+
+    Returns
+    -------
+    result (Any): the function or class
+    """
+
+    module, _, name = ref.partition(":")
+    allowed = ALLOWED_REFERENCES.get()
+
+    # checked before importing, importing a module executes its code
+    if allowed is not None and ref not in allowed and module not in allowed:
+        raise ValueError(f"The reference {ref!r} is not allowed")
+
+    result = importlib.import_module(module)
+
+    for attribute in name.split("."):
+        result = getattr(result, attribute)
+
+    return result
+
+
+def resolve_optional(ref: str | None) -> Any:
+    return None if ref is None else resolve(ref)
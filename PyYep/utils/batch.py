@@ -0,0 +1,241 @@
+"""
+Validates batches of records, sequentially or across processes.
+
+The functions below produce an iterator with the outcome of each record,
+a tuple containing the validated record and the errors of the record,
+in the order the records were received.
+
+The records validated on the current process use the compiled function
+of the schema, except while the profiler is active, the schema caches
+its outcomes or an input item observes the order of its checks, which
+only the interpreted validation does.
+
+Functions:
+    is_compilable
+    iter_with_function
+    iter_outcomes
+    iter_outcomes_in_processes
+"""
+
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    TypeVar,
+)
+import PyYep
+from PyYep.exceptions import ValidationError
+from PyYep.profiler import PROFILER
+
+if TYPE_CHECKING:
+    from PyYep import InputItem, Schema
+    from PyYep.validators.validator import Validator
+
+
+Outcome = Tuple[Any, List[ValidationError] | None]
+ItemT = TypeVar("ItemT")
+
+# the compiled schema of a worker process, set by init_worker
+_worker_validate: Callable[[Mapping[str, Any]], Any] | None = None
+
+
+def validate_record(
+    validate: Callable[[Mapping[str, Any]], Any], record: Mapping[str, Any]
+) -> Outcome:
+    try:
+        return validate(record), None
+    except ValidationError as error:
+        return None, error.inner or [error]
+
+
+def iter_chunks(
+    records: Iterable[ItemT], chunk_size: int
+) -> Iterator[List[ItemT]]:
+    iterator = iter(records)
+
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def iter_input_items(target: Any) -> Iterator[InputItem]:
+    # the input items of a schema or validator and of the validators
+    # nested in their checks
+    if isinstance(target, PyYep.Schema):
+        for item in target._inputs:
+            yield from iter_input_items(item)
+
+        return
+
+    item = target
+    if not isinstance(target, PyYep.InputItem):
+        item = target.input_item
+
+    if item is None:
+        return
+
+    yield item
+
+    for check in item._validators:
+        for arg in getattr(check, "args", ()):
+            nested = arg.values() if isinstance(arg, dict) else (arg,)
+
+            for value in nested:
+                if isinstance(value, PyYep.validators.validator.Validator):
+                    yield from iter_input_items(value)
+
+
+def is_compilable(target: Schema | Validator) -> bool:
+    """
+    Verify if the compiled function of a schema or validator can be used
+    instead of its validate method. The profiler, the result cache of
+    the target and the observation of the order of the checks are only
+    done by the interpreted validation
+
+    Parameters
+    ----------
+    target : Union[Schema, Validator]
+            the schema or validator validating the batch
+
+    Returns
+    -------
+    result (bool)
+    """
+
+    if PROFILER.active or getattr(target, "_cache", None) is not None:
+        return False
+
+    return all(item._optimizer is None for item in iter_input_items(target))
+
+
+def iter_with_function(
+    target: Schema | Validator, chunks: Iterable[List[ItemT]], chunk_size: int
+) -> Iterator[Tuple[Callable[[Any], Any], List[ItemT]]]:
+    """
+    Pair each chunk of a batch with the function validating it. Once a
+    full chunk is received the target is compiled, so the cost of the
+    compilation is amortized along the batch, and the compiled function
+    is reused by the next chunks. The chunks received while the target
+    is not compilable are validated by its validate method
+
+    Parameters
+    ----------
+    target : Union[Schema, Validator]
+            the schema or validator validating the batch
+    chunks : Iterable[List[ItemT]]
+            the chunks of the batch
+    chunk_size : int
+            the number of items of a full chunk
+
+    Returns
+    -------
+    chunks (Iterator[Tuple[Callable[[Any], Any], List[ItemT]]]): the
+    validation function and the items of each chunk
+    """
+
+    compiled: Callable[[Any], Any] | None = None
+
+    for chunk in chunks:
+        if not is_compilable(target):
+            yield target.validate, chunk
+            continue
+
+        if compiled is None and len(chunk) == chunk_size:
+            compiled = target.compile()
+
+        yield compiled or target.validate, chunk
+
+
+def iter_outcomes(
+    schema: Schema, records: Iterable[Mapping[str, Any]], chunk_size: int
+) -> Iterator[Outcome]:
+    """
+    Validate the records on the current process, with the function
+    chosen by iter_with_function for each chunk
+
+    Parameters
+    ----------
+    schema : Schema
+            the schema used to validate the records
+    records : Iterable[Mapping[str, Any]]
+            the records that will be validated
+    chunk_size : int
+            the number of records consumed from the iterable at a time
+
+    Returns
+    -------
+    outcomes (Iterator[Outcome]): the outcome of each record
+    """
+
+    chunks = iter_chunks(records, chunk_size)
+
+    for validate, chunk in iter_with_function(schema, chunks, chunk_size):
+        for record in chunk:
+            yield validate_record(validate, record)
+
+
+def init_worker(schema: Schema) -> None:
+    global _worker_validate
+    _worker_validate = schema.compile()
+
+
+def run_chunk(records: List[Mapping[str, Any]]) -> List[Outcome]:
+    if _worker_validate is None:
+        raise RuntimeError("The worker process was not initialized")
+
+    return [validate_record(_worker_validate, record) for record in records]
+
+
+def iter_outcomes_in_processes(
+    schema: Schema,
+    records: Iterable[Mapping[str, Any]],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[Outcome]:
+    """
+    Validate the records across a pool of processes. The schema is sent
+    once to each process, where it's compiled, and the records are sent
+    in chunks, with at most two chunks per process waiting to be handled,
+    so the records are consumed as the processes are able to handle them
+
+    Parameters
+    ----------
+    schema : Schema
+            the schema used to validate the records, it must be picklable
+    records : Iterable[Mapping[str, Any]]
+            the records that will be validated
+    workers : int
+            the number of processes used
+    chunk_size : int
+            the number of records sent to a process at a time
+
+    Returns
+    -------
+    outcomes (Iterator[Outcome]): the outcome of each record
+    """
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(schema,)
+    )
+    pending: Deque[Future[List[Outcome]]] = deque()
+
+    try:
+        for chunk in iter_chunks(records, chunk_size):
+            pending.append(executor.submit(run_chunk, chunk))
+
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,183 @@
+"""
+Caches validation outcomes of repeated values.
+
+The values are serialized with pickle into the keys of the cache, so
+values of different types, like 1 and True, don't share an entry, and
+the outcomes are stored serialized as well, so each lookup returns a new
+copy that can't change the cached one. Both operations run in C, which
+keeps a lookup much cheaper than the validation of a nested payload.
+
+Functions:
+    snapshot
+
+Classes:
+    CacheInfo
+    ResultCache
+"""
+
+from __future__ import annotations
+import pickle
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, NamedTuple, Tuple
+from PyYep.exceptions import ValidationError
+
+
+Outcome = Tuple[Any, ValidationError | None]
+
+# the errors raised when a value can't be serialized
+UNPICKLABLE_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+
+def snapshot(value: Any) -> bytes | None:
+    """
+    Serialize a value, so it can be compared to later values or used as
+    a key
+
+    Parameters
+    ----------
+    value : Any
+            the value that will be serialized
+
+    Returns
+    -------
+    snapshot (Optional[bytes]): the pickled value, or None if the value
+    can't be pickled
+    """
+
+    try:
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    except UNPICKLABLE_ERRORS:
+        return None
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ResultCache:
+    """
+    A class to represent a thread safe LRU cache of validation outcomes.
+
+    ...
+
+    Attributes
+    ----------
+    maxsize : int
+            the maximum number of outcomes stored, the least recently used
+            outcome is discarded when the limit is reached
+    hits : int
+            the number of lookups that found a stored outcome
+    misses : int
+            the number of lookups that validated the value
+
+    Methods
+    -------
+    lookup(value, run):
+            Return the stored outcome of the value, or run the validation
+            and store its outcome
+
+    info():
+            Return the statistics of the cache
+
+    clear():
+            Discard the stored outcomes and reset the statistics
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Constructs all the necessary attributes for the cache object.
+
+        Parameters
+        ----------
+                maxsize (int): the maximum number of outcomes stored
+        """
+
+        if maxsize < 1:
+            raise ValueError("The size of the cache must be at least 1")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._lock = Lock()
+
+    def lookup(
+        self, value: Any, run: Callable[[Any], Outcome], variant: Any = None
+    ) -> Outcome:
+        """
+        Return the stored outcome of the value, or run the validation and
+        store its outcome. Values that can't be pickled are always
+        validated and are not counted in the statistics, as well as the
+        values whose outcomes can't be pickled are never stored
+
+        Parameters
+        ----------
+        value : Any
+                the value that will be validated
+        run : Callable[[Any], Outcome]
+                the function that validates the value without raising
+        variant : Any
+                a picklable value that changes the outcome of the
+                validation, like the limit of errors, stored along with
+                the value on the key
+
+        Returns
+        -------
+        outcome (Tuple[Any, Optional[ValidationError]]): the validated
+        value and the validation error, if any
+        """
+
+        # the key is built before the validation, which may change the
+        # received value
+        key = snapshot(value if variant is None else (variant, value))
+
+        if key is None:
+            return run(value)
+
+        with self._lock:
+            stored = self._entries.get(key)
+
+            if stored is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if stored is not None:
+            return pickle.loads(stored)
+
+        outcome = run(value)
+
+        stored = snapshot(outcome)
+
+        if stored is None:
+            return outcome
+
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return outcome
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __reduce__(self):
+        # the outcomes and the lock are not sent to other processes
+        return (ResultCache, (self.maxsize,))
@@ -0,0 +1,641 @@
+"""
+Compiles schemas and validators into specialized python functions.
+
+The compiler walks the inputs of a schema (or a validator tree) and
+generates the source code of a single function that performs the same
+work done by the interpreted validation: the type coercion, the checks
+with their conditions, the hooks, the modifiers and the nested
+validation of arrays and dicts. Known checks have their failure
+predicate inlined, when a predicate fails the original check is called
+to raise the error, so the messages and paths are always the same as the
+ones produced by the interpreted validation. Unknown checks and
+validators are called as they are.
+
+Functions:
+    compile_schema
+    compile_validator
+"""
+
+from __future__ import annotations
+import linecache
+from itertools import count
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+import PyYep
+from PyYep.exceptions import ValidationError
+from PyYep.utils.decorators import (
+    AsyncFunctionCall,
+    FunctionCall,
+    ValidatorCall,
+)
+from PyYep.utils.limits import MAX_ERRORS
+from PyYep.utils.patterns import EMAIL_PATTERN, UUID_PATTERN
+from PyYep.utils.vectorize import has_bulk_path, has_fixed_dtype
+
+if TYPE_CHECKING:
+    from PyYep import InputItem, Schema
+    from PyYep.validators.validator import Validator
+
+
+# failure predicates of the known checks, {v} is the checked value and
+# {0}, {1}, ... are the arguments received by the check
+INLINE_CHECKS = {
+    "Validator.required": "{v} is None or (not {v} and {v} != 0)",
+    "Validator.in_": "{v} not in {0}",
+    "StringValidator.email": "email_pattern.fullmatch({v}) is None",
+    "StringValidator.matches": "{0}.fullmatch({v}) is None",
+    "StringValidator.uuid": "uuid_pattern.fullmatch({v}) is None",
+    "StringValidator.min": "len({v}) < {0}",
+    "StringValidator.max": "len({v}) > {0}",
+    "NumericValidator.min": "{v} < {0}",
+    "NumericValidator.max": "{v} > {0}",
+    "BooleanValidator.to_be": "{v} is not {0}",
+    "ArrayValidator.len": "len({v}) != {0}",
+    "ArrayValidator.min": "len({v}) < {0}",
+    "ArrayValidator.max": "len({v}) > {0}",
+    "ArrayValidator.includes": "{0} not in {v}",
+}
+
+# predicates that tell when a value must pass through the validator
+# coerce method, values of the exact types below are already coerced,
+# the keys are the safe_coerce methods of the validators
+INLINE_COERCIONS = {
+    "StringValidator.safe_coerce": "{v}.__class__ is not str",
+    "NumericValidator.safe_coerce": (
+        "{v}.__class__ is not int and {v}.__class__ is not float"
+    ),
+    "BooleanValidator.safe_coerce": "{v}.__class__ is not bool",
+    "ArrayValidator.safe_coerce": "{v}.__class__ is not list",
+    "DictValidator.safe_coerce": "{v}.__class__ is not dict",
+}
+
+# the checks calling nested validators, which read the limit of errors
+# from the context when they are not inlined
+NESTING_CHECKS = (
+    "ArrayValidator.of",
+    "DictValidator.shape",
+    "DictValidator.columns",
+)
+
+_compilations = count()
+
+
+class Compiler:
+    """
+    A class to represent the code generator of a compiled function.
+
+    ...
+
+    Attributes
+    ----------
+    lines: List[str]
+            the lines of the generated source code
+    namespace: Dict[str, Any]
+            the global names used by the generated code
+    max_errors: Optional[int]
+            the maximum number of errors collected by the generated code
+    delegates: bool
+            if the generated code calls validators that were not inlined,
+            which read the limit of errors from the context
+
+    Methods
+    -------
+    constant(value):
+            Stores a value on the namespace and return its name
+
+    emit_input(item, var, indent, schema):
+            Generates the code of the checks of an input item
+
+    emit_validator(validator, var, indent, nested, schema):
+            Generates the code of a validator coercion and checks
+
+    build(name):
+            Compiles the generated code and return the resulting function
+    """
+
+    def __init__(self, max_errors: int | None = None) -> None:
+        self.lines: List[str] = []
+        self.max_errors = max_errors
+        self.delegates = False
+        self.namespace: Dict[str, Any] = {
+            "MAX_ERRORS": MAX_ERRORS,
+            "ValidationError": ValidationError,
+            "has_fixed_dtype": has_fixed_dtype,
+            "email_pattern": EMAIL_PATTERN,
+            "uuid_pattern": UUID_PATTERN,
+        }
+        self._constants: Dict[int, str] = {}
+        self._names = count()
+
+    def constant(self, value: Any) -> str:
+        """
+        Stores a value on the namespace of the generated code
+
+        Parameters
+        ----------
+        value : Any
+                the value used by the generated code
+
+        Returns
+        -------
+        name (str): the name that references the value
+        """
+
+        key = id(value)
+
+        if key not in self._constants:
+            name = f"_k{len(self._constants)}"
+            self._constants[key] = name
+            self.namespace[name] = value
+
+        return self._constants[key]
+
+    def variable(self, prefix: str = "v") -> str:
+        return f"{prefix}{next(self._names)}"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def emit_read(self, item: InputItem, var: str, indent: int) -> None:
+        """
+        Generates the code that reads the value of an input item
+        from its data container
+
+        Parameters
+        ----------
+        item : InputItem
+                the input item being read
+        var : str
+                the name of the variable that receives the value
+        indent : int
+                the indentation level of the generated code
+        """
+
+        container = self.constant(item.data_container)
+        self.emit(indent, f"{var} = getattr({container}, {item._path!r})")
+        self.emit(indent, f"if callable({var}):")
+        self.emit(indent + 1, f"{var} = {var}()")
+
+    def emit_input(
+        self,
+        item: InputItem,
+        var: str,
+        indent: int,
+        schema: Schema | None = None,
+    ) -> None:
+        """
+        Generates the code of the checks of an input item, including the
+        conditions, hooks and modifier
+
+        Parameters
+        ----------
+        item : InputItem
+                the input item being compiled
+        var : str
+                the name of the variable holding the value
+        indent : int
+                the indentation level of the generated code
+        schema : Optional[Schema]
+                the schema of the input item, used for the error hook
+        """
+
+        on_fail = item.on_fail
+
+        if on_fail is None and schema is not None:
+            on_fail = schema.on_fail
+
+        for check in item._validators:
+            level = indent
+
+            if check.condition is not None:
+                condition = self.constant(check.condition)
+                self.emit(level, f"if {condition}({var}):")
+                level += 1
+
+            if on_fail is not None:
+                self.emit(level, "try:")
+                self.emit_check(check, var, level + 1)
+                self.emit(level, "except ValidationError:")
+                self.emit(level + 1, f"{self.constant(on_fail)}()")
+                self.emit(level + 1, "raise")
+            else:
+                self.emit_check(check, var, level)
+
+        if item.on_success is not None:
+            self.emit(indent, f"{self.constant(item.on_success)}()")
+
+        if item._modifier is not None:
+            modifier = self.constant(item._modifier)
+            self.emit(indent, f"{var} = {modifier}({var})")
+
+    def emit_check(
+        self,
+        check: ValidatorCall | FunctionCall | AsyncFunctionCall,
+        var: str,
+        indent: int,
+    ) -> None:
+        """
+        Generates the code of a single check
+
+        Parameters
+        ----------
+        check : Union[ValidatorCall, FunctionCall, AsyncFunctionCall]
+                the check stored on the input item
+        var : str
+                the name of the variable holding the value
+        indent : int
+                the indentation level of the generated code
+        """
+
+        if isinstance(check, FunctionCall):
+            self.emit(indent, f"{self.constant(check.func)}({var})")
+            return
+
+        # coroutine validators can't be awaited by the compiled function,
+        # calling them raises the same TypeError raised by validate
+        if isinstance(check, AsyncFunctionCall):
+            self.emit(indent, f"{self.constant(check)}({var})")
+            return
+
+        qualname = getattr(check.func, "__qualname__", None)
+        nesting = qualname in NESTING_CHECKS
+
+        if check.kwargs:
+            qualname = None
+
+        if qualname == "ArrayValidator.of" and self.emit_of(
+            check.validator, check.args[0], var, indent
+        ):
+            return
+
+        if qualname == "DictValidator.shape" and self.emit_shape(
+            check.validator, check.args[0], var, indent
+        ):
+            return
+
+        name = self.constant(check)
+
+        if qualname not in INLINE_CHECKS:
+            if nesting:
+                self.delegates = True
+
+            self.emit(indent, f"{name}({var})")
+            return
+
+        predicate = INLINE_CHECKS[qualname].format(
+            *[self.constant(arg) for arg in check.args], v=var
+        )
+        self.emit(indent, f"if {predicate}:")
+        self.emit(indent + 1, f"{name}({var})")
+
+    def emit_validator(
+        self,
+        validator: Validator,
+        var: str,
+        indent: int,
+        nested: bool = False,
+        schema: Schema | None = None,
+    ) -> None:
+        """
+        Generates the code of a validator, the coercion of the value
+        followed by the checks of its input item
+
+        Parameters
+        ----------
+        validator : Validator
+                the validator being compiled
+        var : str
+                the name of the variable holding the value
+        indent : int
+                the indentation level of the generated code
+        nested : bool
+                if the validator is used by an array or dict validator
+        schema : Optional[Schema]
+                the schema of the validator, used for the error hook
+        """
+
+        name = self.constant(validator)
+
+        if not self.is_inlinable(validator):
+            self.delegates = True
+
+            if nested:
+                self.emit(indent, f"{var} = {name}.validate({var})")
+            else:
+                self.emit(indent, f"{var} = {name}.verify()")
+            return
+
+        coercion = INLINE_COERCIONS[type(validator).safe_coerce.__qualname__]
+        self.emit(indent, f"if {coercion.format(v=var)}:")
+        self.emit(indent + 1, f"{var} = {name}.coerce({var})")
+        self.emit_input(validator.input_item, var, indent, schema)
+
+    def emit_of(
+        self, parent: Validator, validator: Validator, var: str, indent: int
+    ) -> bool:
+        """
+        Generates the loop that validates the items of a sequence
+
+        Returns
+        -------
+        result (bool): False if the validator could not be inlined
+        """
+
+        # bound checks of numeric items and length checks of strings are
+        # evaluated in bulk by the of method, which is faster than the
+        # generated loop
+        if not self.is_inlinable(validator) or has_bulk_path(validator):
+            return False
+
+        index = self.variable("i")
+        item = self.variable("v")
+        errors = self.variable("e")
+        setter = self.variable("s")
+        base = self.constant(parent.name)
+
+        self.emit(indent, f"{errors} = []")
+        self.emit(indent, f"{setter} = None")
+        self.emit(indent, f"if not has_fixed_dtype({var}):")
+        self.emit(
+            indent + 1, f"{setter} = getattr({var}, '__setitem__', None)"
+        )
+        self.emit(indent, f"for {index}, {item} in enumerate({var}):")
+        self.emit(indent + 1, "try:")
+        self.emit_validator(validator, item, indent + 2, nested=True)
+        self.emit(indent + 2, f"if {setter} is not None:")
+        self.emit(indent + 3, f"{setter}({index}, {item})")
+        self.emit(indent + 1, "except ValidationError as error:")
+        self.emit_error_merge(
+            f"error.nest_path({base}, {index})",
+            errors,
+            indent + 2,
+            "Internal validation erros",
+        )
+        self.emit(indent, f"if {errors}:")
+        self.emit(
+            indent + 1,
+            f'raise ValidationError("", "Internal validation erros", '
+            f"{errors})",
+        )
+
+        return True
+
+    def emit_shape(
+        self,
+        parent: Validator,
+        schema: Dict[Any, Validator],
+        var: str,
+        indent: int,
+    ) -> bool:
+        """
+        Generates the code that validates the items of a dict,
+        the keys of the shape are unrolled
+
+        Returns
+        -------
+        result (bool): False if any of the validators could not be inlined
+        """
+
+        if not all(
+            self.is_inlinable(validator) for validator in schema.values()
+        ):
+            return False
+
+        errors = self.variable("e")
+        base = self.constant(parent.name)
+
+        self.emit(indent, f"{errors} = []")
+
+        for key, validator in schema.items():
+            item = self.variable("v")
+            key_name = self.constant(key)
+
+            self.emit(indent, f"{item} = {var}.get({key_name})")
+            self.emit(indent, "try:")
+            self.emit_validator(validator, item, indent + 1, nested=True)
+            self.emit(indent + 1, f"{var}[{key_name}] = {item}")
+            self.emit(indent, "except ValidationError as error:")
+            self.emit_error_merge(
+                f"error.nest_path({base}, {key_name})",
+                errors,
+                indent + 1,
+                "Internal validation errors",
+            )
+
+        self.emit(indent, f"if {errors}:")
+        self.emit(
+            indent + 1,
+            f'raise ValidationError("", "Internal validation errors", '
+            f"{errors})",
+        )
+
+        return True
+
+    def emit_error_merge(
+        self, format: str, errors: str, indent: int, message: str
+    ) -> None:
+        """
+        Generates the code that collects a caught error, when the limit
+        of errors is reached the collected errors are raised
+
+        Parameters
+        ----------
+        format : str
+                the code that formats the path of the error, if any
+        errors : str
+                the name of the variable holding the collected errors
+        indent : int
+                the indentation level of the generated code
+        message : str
+                the message of the error raised when the limit is reached
+        """
+
+        if format:
+            self.emit(indent, format)
+
+        self.emit(indent, "if error.inner:")
+        self.emit(indent + 1, f"{errors}.extend(error.inner)")
+        self.emit(indent, "else:")
+        self.emit(indent + 1, f"{errors}.append(error)")
+
+        if self.max_errors is not None:
+            limit = self.max_errors
+            self.emit(indent, f"if len({errors}) >= {limit}:")
+            self.emit(
+                indent + 1,
+                f'raise ValidationError("", "{message}", {errors}[:{limit}])',
+            )
+
+    def is_inlinable(self, validator: Any) -> bool:
+        """
+        Verify if the coercion and checks of a validator can be inlined
+
+        Parameters
+        ----------
+        validator : Any
+                the validator being compiled
+
+        Returns
+        -------
+        result (bool)
+        """
+
+        coerce = getattr(type(validator), "safe_coerce", None)
+        max_errors = getattr(validator, "_max_errors", None)
+
+        # cached validators, validators with their own limit of errors and
+        # validators overriding verify are called, so the cache, the limit
+        # and verify are used
+        return (
+            getattr(coerce, "__qualname__", None) in INLINE_COERCIONS
+            and validator.input_item is not None
+            and not getattr(validator, "_overrides_verify", False)
+            and getattr(validator, "_cache", None) is None
+            and (max_errors is None or max_errors == self.max_errors)
+        )
+
+    def build(self, name: str, signature: str = "") -> Callable:
+        """
+        Compiles the generated code and return the resulting function
+
+        Parameters
+        ----------
+        name : str
+                the name of the generated function
+        signature : str
+                the parameters of the generated function
+
+        Returns
+        -------
+        function (Callable): the compiled function
+        """
+
+        lines = self.lines
+
+        # the validators that were not inlined read the limit of errors
+        # from the context
+        if self.max_errors is not None and self.delegates:
+            lines = [
+                f"    token = MAX_ERRORS.set({self.max_errors})",
+                "    try:",
+                *["    " + line for line in lines],
+                "    finally:",
+                "        MAX_ERRORS.reset(token)",
+            ]
+
+        source = "\n".join([f"def {name}({signature}):", *lines, ""])
+        filename = f"<PyYep compiled {name} #{next(_compilations)}>"
+
+        # registering the source allows tracebacks to show the generated code
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(keepends=True),
+            filename,
+        )
+
+        exec(compile(source, filename, "exec"), self.namespace)
+        function = self.namespace[name]
+        function.__source__ = source
+
+        return function
+
+
+def compile_schema(schema: Schema) -> Callable[..., Any]:
+    """
+    Compiles a schema into a function equivalent to its validate method,
+    the function optionally receives the data that will be validated
+
+    Parameters
+    ----------
+    schema : Schema
+            the schema that will be compiled
+
+    Returns
+    -------
+    function (Callable): the compiled function
+    """
+
+    compiler = Compiler(schema._error_limit())
+    compiler.emit(1, "result = {}")
+
+    if not schema.abort_early:
+        compiler.emit(1, "errors = []")
+
+    for item in schema._inputs:
+        var = compiler.variable()
+        key = compiler.constant(item.name)
+        indent = 1
+
+        if not schema.abort_early:
+            compiler.emit(indent, "try:")
+            indent += 1
+
+        if isinstance(item, PyYep.InputItem):
+            compiler.emit(indent, "if data is None:")
+            compiler.emit_read(item, var, indent + 1)
+            compiler.emit(indent, "else:")
+            compiler.emit(indent + 1, f"{var} = data.get({key})")
+            compiler.emit_input(item, var, indent, schema)
+        elif compiler.is_inlinable(item):
+            compiler.emit(indent, "if data is None:")
+            compiler.emit_read(item.input_item, var, indent + 1)
+            compiler.emit(indent, "else:")
+            compiler.emit(indent + 1, f"{var} = data.get({key})")
+            compiler.emit_validator(item, var, indent, schema=schema)
+        else:
+            compiler.delegates = True
+            name = compiler.constant(item)
+            compiler.emit(indent, "if data is None:")
+            compiler.emit(indent + 1, f"{var} = {name}.verify()")
+            compiler.emit(indent, "else:")
+            compiler.emit(
+                indent + 1, f"{var} = {name}.validate(data.get({key}))"
+            )
+
+        compiler.emit(indent, f"result[{key}] = {var}")
+
+        if not schema.abort_early:
+            compiler.emit(1, "except ValidationError as error:")
+            compiler.emit_error_merge(
+                "", "errors", 2, "One or more inputs failed during validation"
+            )
+
+    if not schema.abort_early:
+        compiler.emit(1, "if errors:")
+        compiler.emit(
+            2,
+            'raise ValidationError("", "One or more inputs failed during '
+            'validation", inner=errors)',
+        )
+
+    compiler.emit(1, "return result")
+
+    return compiler.build("compiled_schema", "data=None")
+
+
+def compile_validator(validator: Validator) -> Callable[[Any], Any]:
+    """
+    Compiles a validator into a function that receives the value
+    that will be validated and return the validated value
+
+    Parameters
+    ----------
+    validator : Validator
+            the validator that will be compiled
+
+    Returns
+    -------
+    function (Callable): the compiled function
+    """
+
+    compiler = Compiler(validator._max_errors)
+
+    if compiler.is_inlinable(validator):
+        compiler.emit_validator(validator, "value", 1)
+        compiler.emit(1, "return value")
+    else:
+        compiler.delegates = True
+        name = compiler.constant(validator)
+        compiler.emit(1, f"return {name}.validate(value)")
+
+    return compiler.build("compiled_validator", "value")
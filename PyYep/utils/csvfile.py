@@ -0,0 +1,364 @@
+"""
+Validates large CSV files through a memory map.
+
+The file is memory-mapped and its lines are decoded in blocks, so at
+most one block of the file is held as Python objects. The first line is
+the header, its names map the columns to the inputs of the schema, and
+each row is validated as a dict of the values of those columns. The
+errors are written to the report as they are found, one CSV line per
+error with the line number of the row, the path of the input and the
+message, so the memory used doesn't grow with the size of the file or
+with the number of errors.
+
+The rows can be split into shards, contiguous ranges of the file that
+can be validated by separate processes. The shards are split at line
+breaks, so files with line breaks inside quoted values must be
+validated as a single shard. The line numbers of a shard are counted
+from the start of the file, plan_csv_shards locates all the shards in a
+single pass, so the processes don't count the lines before their shards
+again.
+
+Functions:
+    validate_csv
+    plan_csv_shards
+
+Classes:
+    CSVSummary
+    CSVShard
+"""
+
+from __future__ import annotations
+import csv
+import io
+import mmap
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+)
+from PyYep.exceptions import ValidationError
+from PyYep.utils.batch import is_compilable
+
+if TYPE_CHECKING:
+    from PyYep import Schema
+
+
+REPORT_HEADER = ("row", "column", "message")
+
+
+class CSVSummary(NamedTuple):
+    """
+    The counts of a CSV validation
+
+    Attributes
+    ----------
+    rows : int
+            the number of rows validated, blank lines are not counted
+    invalid : int
+            the number of invalid rows
+    errors : int
+            the number of errors written to the report
+    """
+
+    rows: int
+    invalid: int
+    errors: int
+
+
+class CSVShard(NamedTuple):
+    """
+    A contiguous range of rows of a CSV file
+
+    Attributes
+    ----------
+    index : int
+            the index of the shard
+    start : int
+            the position of the first line of the shard
+    end : int
+            the position after which no line of the shard starts
+    lines : int
+            the number of lines before the shard
+    """
+
+    index: int
+    start: int
+    end: int
+    lines: int
+
+
+def validate_csv(
+    schema: Schema,
+    path: str,
+    report: IO[str] | None = None,
+    shard: Tuple[int, int] | CSVShard | None = None,
+    encoding: str = "utf-8",
+    block_size: int = 1 << 20,
+    **fmtparams: Any,
+) -> CSVSummary:
+    """
+    Validate the rows of a CSV file, the columns are mapped to the
+    inputs of the schema by the names in the header
+
+    Parameters
+    ----------
+    schema : Schema
+            the schema used to validate each row
+    path : str
+            the path of the CSV file
+    report : Optional[IO[str]]
+            a text file object receiving the errors as CSV lines, opened
+            with newline="". The header of the report is written by the
+            first shard only, so the reports of the shards can be
+            concatenated in order
+    shard : Optional[Union[Tuple[int, int], CSVShard]]
+            the index of the shard and the number of shards, only the
+            rows starting in the shard are validated, or a shard returned
+            by plan_csv_shards, which skips counting the lines before it
+    encoding : str
+            the encoding of the file, it must be compatible with ASCII
+    block_size : int
+            the number of bytes decoded at a time
+    **fmtparams : Any
+            the formatting parameters of the csv reader, like delimiter
+
+    Raises
+    ------
+    ValueError: if the shard index is not within the number of shards
+
+    Returns
+    -------
+    summary (CSVSummary): the number of rows, invalid rows and errors
+    """
+
+    if isinstance(shard, CSVShard):
+        index, count = shard.index, None
+    else:
+        index, count = shard or (0, 1)
+
+        if not 0 <= index < count:
+            raise ValueError(
+                "The shard index must be within the shard count"
+            )
+
+    writer = None
+
+    if report is not None:
+        writer = csv.writer(report)
+
+        if index == 0:
+            writer.writerow(REPORT_HEADER)
+
+    with open(path, "rb") as file:
+        if file.seek(0, io.SEEK_END) == 0:
+            return CSVSummary(0, 0, 0)
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if count is not None:
+                # only the lines before the requested shard are counted
+                shard = locate_shards(data, count, index + 1, block_size)[-1]
+
+            return validate_shard(
+                schema, data, writer, shard, encoding, block_size, fmtparams
+            )
+
+
+def plan_csv_shards(
+    path: str, count: int, block_size: int = 1 << 20
+) -> List[CSVShard]:
+    """
+    Split the rows of a CSV file in shards, counting the lines before
+    each shard in a single pass over the file. The shards are passed to
+    validate_csv, by the processes validating them, while the file is
+    not changed
+
+    Parameters
+    ----------
+    path : str
+            the path of the CSV file
+    count : int
+            the number of shards
+    block_size : int
+            the number of bytes scanned at a time
+
+    Raises
+    ------
+    ValueError: if the number of shards is lower than 1
+
+    Returns
+    -------
+    shards (List[CSVShard]): the shards, in the order of the file
+    """
+
+    if count < 1:
+        raise ValueError("The shard count must be at least 1")
+
+    with open(path, "rb") as file:
+        if file.seek(0, io.SEEK_END) == 0:
+            return [CSVShard(index, 0, 0, 0) for index in range(count)]
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return locate_shards(data, count, count, block_size)
+
+
+def locate_shards(
+    data: mmap.mmap, count: int, stop: int, block_size: int
+) -> List[CSVShard]:
+    header_end = next_line(data, 0)
+    size = len(data) - header_end
+    shards = []
+    position = lines = 0
+
+    for index in range(stop):
+        start = header_end + size * index // count
+        end = header_end + size * (index + 1) // count
+
+        # a shard starts on the first line starting within its range
+        if index > 0:
+            start = next_line(data, start - 1)
+
+        # the lines are counted from the previous shard, so the file is
+        # scanned once
+        lines += count_lines(data, position, start, block_size)
+        position = start
+        shards.append(CSVShard(index, start, end, lines))
+
+    return shards
+
+
+def validate_shard(
+    schema: Schema,
+    data: mmap.mmap,
+    writer: Any,
+    shard: CSVShard,
+    encoding: str,
+    block_size: int,
+    fmtparams: Any,
+) -> CSVSummary:
+    header_end = next_line(data, 0)
+    # the byte order mark of UTF-8 files is decoded as part of the first
+    # name of the header
+    header_line = data[:header_end].decode(encoding).removeprefix("\ufeff")
+    header = next(csv.reader([header_line], **fmtparams), [])
+    positions = {name: position for position, name in enumerate(header)}
+    columns = [
+        (item.name, positions[item.name])
+        for item in schema._inputs
+        if item.name in positions
+    ]
+
+    validate: Callable[[Any], Any] = schema.validate
+
+    if is_compilable(schema):
+        validate = schema.compile()
+    lines_before = shard.lines
+    reader = csv.reader(
+        iter_lines(data, shard.start, shard.end, block_size, encoding),
+        **fmtparams,
+    )
+    rows = invalid = errors = 0
+    consumed = 0
+
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            break
+        except csv.Error as error:
+            row_errors = [ValidationError("", f"Invalid CSV row: {error}")]
+        else:
+            if not row:
+                consumed = reader.line_num
+                continue
+
+            values = {
+                name: row[position] if position < len(row) else None
+                for name, position in columns
+            }
+
+            try:
+                validate(values)
+                row_errors = []
+            except ValidationError as error:
+                row_errors = error.inner or [error]
+
+        rows += 1
+        line = lines_before + consumed + 1
+        consumed = reader.line_num
+
+        if not row_errors:
+            continue
+
+        invalid += 1
+        errors += len(row_errors)
+
+        if writer is not None:
+            write_errors(writer, line, row_errors)
+
+    return CSVSummary(rows, invalid, errors)
+
+
+def write_errors(
+    writer: Any, line: int, row_errors: List[ValidationError]
+) -> None:
+    writer.writerows((line, error.path, str(error)) for error in row_errors)
+
+
+def next_line(data: mmap.mmap, position: int) -> int:
+    # the position of the line following the one containing the position
+    newline = data.find(b"\n", position)
+
+    return len(data) if newline == -1 else newline + 1
+
+
+def count_lines(
+    data: mmap.mmap, start: int, end: int, block_size: int
+) -> int:
+    lines = 0
+
+    for position in range(start, end, block_size):
+        stop = min(position + block_size, end)
+        lines += data[position:stop].count(b"\n")
+
+    return lines
+
+
+def iter_lines(
+    data: mmap.mmap, start: int, end: int, block_size: int, encoding: str
+) -> Iterator[str]:
+    """
+    Decode the lines starting between the received positions, a block
+    of lines at a time
+
+    Parameters
+    ----------
+    data : mmap.mmap
+            the memory map of the file
+    start : int
+            the position of the first line
+    end : int
+            the position after which no line is started
+    block_size : int
+            the number of bytes decoded at a time
+    encoding : str
+            the encoding of the file
+
+    Returns
+    -------
+    lines (Iterator[str]): the lines, including their line breaks
+    """
+
+    position = start
+
+    while position < end:
+        stop = next_line(data, min(position + block_size, end) - 1)
+        block = data[position:stop].decode(encoding)
+        position = stop
+
+        # only "\n" breaks the lines, like the positions of the shards
+        yield from io.StringIO(block, newline="\n")
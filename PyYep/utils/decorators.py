@@ -1,5 +1,21 @@
-from typing import Callable, Generic, TypeVar, TypeVarTuple, TYPE_CHECKING
+import asyncio
+import inspect
+import re
+from functools import lru_cache, wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Tuple,
+    TypeVar,
+    TypeVarTuple,
+    TYPE_CHECKING,
+)
 import PyYep
+from PyYep.exceptions import ValidationError
+from PyYep.utils.membership import MembershipLookup
 
 if TYPE_CHECKING:
     from PyYep.validators.validator import Validator
@@ -9,16 +25,21 @@ ArgsT = TypeVarTuple("ArgsT")
 T = TypeVar("T", bound="Validator")
 V = TypeVar("V")
 
+# shared by the calls without keyword arguments, so they don't allocate
+# empty dicts, it must not be mutated
+NO_KWARGS: Dict[str, Any] = {}
+
 
 def validator_method(
-    func: Callable[[T, *ArgsT, V], None]
+    func: Callable[[T, *ArgsT, V], ValidationError | None]
 ) -> Callable[[T, *ArgsT], T]:
     """Wraps a Validator method to be used as a validator function
 
     Parameters
     ----------
     func : Callable
-        the function that will be used as validator
+        the function that will be used as validator, it must return a
+        ValidationError instead of raising it
 
     Returns
     ----------
@@ -26,7 +47,8 @@ def validator_method(
         the wrapper function of the decorator
     """
 
-    def wrapper(validator: T, *args: *ArgsT) -> T:
+    @wraps(func)
+    def wrapper(validator: T, *args: *ArgsT, **kwargs: Any) -> T:
         """A wrapper function that appends a validator
         in the input's validators list
 
@@ -36,6 +58,8 @@ def validator_method(
             the instance of validator using the decorator
         *args
             the positional arguments received by the wrapped method
+        **kwargs
+            the keyword arguments received by the wrapped method
 
         Returns
         ----------
@@ -55,8 +79,8 @@ def validator_method(
                 "without an input item."
             )
 
-        validation_method: Callable[[V], None] = lambda v: func(
-            validator, *args, v
+        validation_method = ValidatorCall(
+            func, validator, args, kwargs or NO_KWARGS
         )
         validator.input_item = validator.input_item.validate(validation_method)
 
@@ -65,7 +89,385 @@ def validator_method(
     return wrapper
 
 
+def convert_arguments(
+    *converters: Callable[[Any], Any]
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Wraps a validator method to convert its positional arguments once,
+    when the check is added, instead of on every validation
+
+    Parameters
+    ----------
+    *converters : Callable
+        the functions converting each positional argument, in order
+
+    Returns
+    ----------
+    decorator (Callable)
+        the decorator applied over the validator_method decorator
+    """
+
+    def decorator(method: Callable[..., T]) -> Callable[..., T]:
+        @wraps(method)
+        def wrapper(validator: T, *args: Any, **kwargs: Any) -> T:
+            size = len(converters)
+            converted = [
+                convert(arg) for convert, arg in zip(converters, args)
+            ]
+            converted.extend(args[size:])
+
+            return method(validator, *converted, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class ValidatorCall(Generic[V]):
+    """
+    A class to represent a validator method bound to its validator
+    and arguments.
+
+    ...
+
+    Attributes
+    ----------
+    func : Callable
+            the wrapped validator method
+    validator : Validator
+            the validator that owns the method
+    args : tuple
+            the positional arguments received by the method
+    kwargs : dict
+            the keyword arguments received by the method
+    condition : Optional[Callable]
+            a callable that defines if the method must be executed
+    name : str
+            the name of the validator class and of the method
+
+    Methods
+    -------
+    check(value):
+            Execute the method and return the error, if any
+
+    describe():
+            Return a description of the method and its arguments
+
+    check_async(value, limiter):
+            Execute the asynchronous version of the method and return
+            the error, if any
+
+    is_async():
+            Verify if any of the validators received as argument uses
+            asynchronous validation functions
+
+    __call__(value):
+            Execute the method and raise the error, if any
+    """
+
+    __slots__ = ("func", "validator", "args", "kwargs", "condition")
+
+    def __init__(
+        self,
+        func: Callable[..., ValidationError | None],
+        validator: "Validator",
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        condition: Callable[[Any], bool] | None = None,
+    ) -> None:
+        self.func = func
+        self.validator = validator
+        self.args = args
+        self.kwargs = kwargs
+        self.condition = condition
+
+    @property
+    def name(self) -> str:
+        return f"{type(self.validator).__name__}.{self.func.__name__}"
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "check": self.name,
+            "args": [describe_argument(arg) for arg in self.args],
+            "kwargs": {
+                key: describe_argument(arg)
+                for key, arg in self.kwargs.items()
+            },
+            "conditional": self.condition is not None,
+        }
+
+    def check(self, value: V) -> ValidationError | None:
+        # the methods written for the verify API raise their errors
+        try:
+            return self.func(self.validator, *self.args, value, **self.kwargs)
+        except ValidationError as error:
+            return error
+
+    async def check_async(
+        self, value: V, limiter: asyncio.Semaphore | None = None
+    ) -> ValidationError | None:
+        # methods receiving nested validators implement their asynchronous
+        # version as _<method name>_async
+        method = getattr(self.validator, f"_{self.func.__name__}_async", None)
+
+        if method is None:
+            return self.check(value)
+
+        return await method(*self.args, value, limiter, **self.kwargs)
+
+    def is_async(self) -> bool:
+        for arg in self.args:
+            nested = arg.values() if isinstance(arg, dict) else (arg,)
+
+            for item in nested:
+                if (
+                    isinstance(item, PyYep.validators.validator.Validator)
+                    and item.is_async()
+                ):
+                    return True
+
+        return False
+
+    def __call__(self, value: V) -> None:
+        error = self.func(self.validator, *self.args, value, **self.kwargs)
+
+        if error is not None:
+            raise error
+
+    def __reduce__(self):
+        # the wrapped method is shadowed by the decorator on its class,
+        # so it's pickled by the name of the method
+        return (
+            load_validator_call,
+            (
+                type(self.validator),
+                self.func.__name__,
+                self.validator,
+                self.args,
+                self.kwargs,
+                self.condition,
+            ),
+        )
+
+
+def load_validator_call(
+    cls: type,
+    name: str,
+    validator: "Validator",
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    condition: Callable[[Any], bool] | None = None,
+) -> ValidatorCall:
+    """Rebuilds a pickled ValidatorCall
+
+    Parameters
+    ----------
+    cls : type
+        the class of the validator
+    name : str
+        the name of the validator method
+    validator : Validator
+        the validator that owns the method
+    args : tuple
+        the positional arguments received by the method
+    kwargs : dict
+        the keyword arguments received by the method
+    condition : Optional[Callable]
+        the condition of the method
+
+    Returns
+    ----------
+    ValidatorCall:
+        the rebuilt validator call
+    """
+
+    func = unwrap_method(cls, name)
+
+    return ValidatorCall(func, validator, args, kwargs or NO_KWARGS, condition)
+
+
+@lru_cache(maxsize=None)
+def unwrap_method(cls: type, name: str) -> Callable[..., Any]:
+    # schemas are unpickled with one call per check, so the methods are
+    # unwrapped once per class
+    return inspect.unwrap(getattr(cls, name))
+
+
+def describe_argument(arg: Any) -> Any:
+    """Describes an argument of a validator method, nested validators
+    are replaced by their description
+
+    Parameters
+    ----------
+    arg : Any
+        the argument received by the method
+
+    Returns
+    ----------
+    Any:
+        the description of the argument
+    """
+
+    if isinstance(arg, PyYep.validators.validator.Validator):
+        return arg.describe()
+
+    if isinstance(arg, MembershipLookup):
+        return list(arg.items)
+
+    if isinstance(arg, re.Pattern):
+        return arg.pattern
+
+    if isinstance(arg, dict):
+        return {key: describe_argument(value) for key, value in arg.items()}
+
+    if isinstance(arg, (list, tuple)):
+        return [describe_argument(value) for value in arg]
+
+    return arg
+
+
+def describe_function(
+    func: Callable[..., Any], condition: Callable[[Any], bool] | None
+) -> Dict[str, Any]:
+    return {
+        "check": getattr(func, "__qualname__", repr(func)),
+        "args": [],
+        "kwargs": {},
+        "conditional": condition is not None,
+    }
+
+
+class FunctionCall(Generic[V]):
+    """
+    A class to represent a custom validation function, that reports
+    errors by raising a ValidationError.
+
+    ...
+
+    Attributes
+    ----------
+    func : Callable
+            the validation function
+    condition : Optional[Callable]
+            a callable that defines if the function must be executed
+    name : str
+            the qualified name of the function
+
+    Methods
+    -------
+    check(value):
+            Execute the function and return the error, if any
+
+    describe():
+            Return a description of the function
+
+    __call__(value):
+            Execute the function
+    """
+
+    __slots__ = ("func", "condition")
+
+    def __init__(
+        self,
+        func: Callable[[V], Any],
+        condition: Callable[[V], bool] | None = None,
+    ) -> None:
+        self.func = func
+        self.condition = condition
+
+    @property
+    def name(self) -> str:
+        return getattr(self.func, "__qualname__", repr(self.func))
+
+    def describe(self) -> Dict[str, Any]:
+        return describe_function(self.func, self.condition)
+
+    def check(self, value: V) -> ValidationError | None:
+        try:
+            self.func(value)
+        except ValidationError as error:
+            return error
+
+        return None
+
+    def is_async(self) -> bool:
+        return False
+
+    def __call__(self, value: V) -> None:
+        self.func(value)
+
+
+class AsyncFunctionCall(Generic[V]):
+    """
+    A class to represent a custom coroutine validation function, that
+    reports errors by raising a ValidationError.
+
+    ...
+
+    Attributes
+    ----------
+    func : Callable
+            the coroutine validation function
+    condition : Optional[Callable]
+            a callable that defines if the function must be awaited
+    name : str
+            the qualified name of the function
+
+    Methods
+    -------
+    check_async(value, limiter):
+            Await the function and return the error, if any
+
+    describe():
+            Return a description of the function
+    """
+
+    __slots__ = ("func", "condition")
+
+    def __init__(
+        self,
+        func: Callable[[V], Awaitable[Any]],
+        condition: Callable[[V], bool] | None = None,
+    ) -> None:
+        self.func = func
+        self.condition = condition
+
+    @property
+    def name(self) -> str:
+        return getattr(self.func, "__qualname__", repr(self.func))
+
+    def describe(self) -> Dict[str, Any]:
+        return describe_function(self.func, self.condition)
+
+    def check(self, value: V) -> ValidationError | None:
+        raise TypeError(
+            "Coroutine validators require the usage of the asynchronous "
+            "validation methods"
+        )
+
+    async def check_async(
+        self, value: V, limiter: asyncio.Semaphore | None = None
+    ) -> ValidationError | None:
+        try:
+            if limiter is None:
+                await self.func(value)
+            else:
+                async with limiter:
+                    await self.func(value)
+        except ValidationError as error:
+            return error
+
+        return None
+
+    def is_async(self) -> bool:
+        return True
+
+    def __call__(self, value: V) -> None:
+        self.check(value)
+
+
 class ProxyContainer(Generic[V]):
+    __slots__ = ("value",)
+
     def __init__(self):
         self.value = None
 
@@ -0,0 +1,120 @@
+"""
+Propagates the maximum number of errors collected by a validation.
+
+The schemas aborting early, the schemas with max_errors and the
+validators with max_errors set the limit while they are validated. The
+array and dict validators nested in them stop validating their items
+once the limit of errors is collected, so invalid payloads are rejected
+in time proportional to the position of their first errors. The limit
+is stored in a context variable, so it's local to each thread and task,
+the chunks validated by thread or process pools receive the limit set
+when they are submitted.
+
+Functions:
+    collect_error
+    collect_outcomes
+    raise_error
+"""
+
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, List, Tuple, TypeVar
+from PyYep.exceptions import ValidationError
+
+
+K = TypeVar("K")
+
+
+# None when the errors are not limited
+MAX_ERRORS: ContextVar[int | None] = ContextVar("max_errors", default=None)
+
+
+def collect_error(
+    errors: List[ValidationError], error: ValidationError, limit: int | None
+) -> bool:
+    """
+    Append the error, or its inner errors, to the collected errors
+
+    Parameters
+    ----------
+    errors : List[ValidationError]
+            the collected errors
+    error : ValidationError
+            the error being collected
+    limit : Optional[int]
+            the maximum number of errors collected
+
+    Returns
+    -------
+    result (bool): True if the limit was reached, in which case the
+    collected errors are truncated to the limit
+    """
+
+    if error.inner:
+        errors.extend(error.inner)
+    else:
+        errors.append(error)
+
+    if limit is not None and len(errors) >= limit:
+        del errors[limit:]
+        return True
+
+    return False
+
+
+def collect_outcomes(
+    outcomes: Iterable[Tuple[K, Tuple[Any, ValidationError | None]]],
+    limit: int | None,
+    on_success: Callable[[K, Any], Any],
+    on_error: Callable[[K, ValidationError], Any] | None = None,
+) -> List[ValidationError]:
+    """
+    Collect the errors of the outcomes of a validation, the limit of
+    errors is set while the outcomes are produced and lowered by each
+    error collected, so lazily produced outcomes after the limit are not
+    validated and the ones before it share the remaining limit
+
+    Parameters
+    ----------
+    outcomes : Iterable[Tuple[K, Tuple[Any, Optional[ValidationError]]]]
+            the key, like an index or a name, and the result and error of
+            each validated item
+    limit : Optional[int]
+            the maximum number of errors collected
+    on_success : Callable[[K, Any], Any]
+            called with the key and the result of each valid item
+    on_error : Optional[Callable[[K, ValidationError], Any]]
+            called with the key and the error of each invalid item before
+            it's collected, it can raise to stop the collection
+
+    Returns
+    -------
+    errors (List[ValidationError]): the errors collected
+    """
+
+    errors: List[ValidationError] = []
+    token = MAX_ERRORS.set(limit)
+
+    try:
+        for key, (result, error) in outcomes:
+            if error is None:
+                on_success(key, result)
+                continue
+
+            if on_error is not None:
+                on_error(key, error)
+
+            if collect_error(errors, error, limit):
+                break
+
+            if limit is not None:
+                # the next items share the remaining limit
+                MAX_ERRORS.set(limit - len(errors))
+    finally:
+        MAX_ERRORS.reset(token)
+
+    return errors
+
+
+def raise_error(key: Any, error: ValidationError) -> None:
+    # the on_error of the validations aborting early
+    raise error
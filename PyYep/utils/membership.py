@@ -0,0 +1,148 @@
+"""
+Builds the lookups used by the membership checks.
+
+Lists, tuples and iterators received by the membership checks are
+converted once, when the check is added, into a lookup that avoids the
+linear scan of the values: a frozenset when the values are hashable, a
+sorted list searched with bisect when they are lists or bytearrays of
+a single type, or a tuple scanned linearly otherwise. Other containers,
+like sets, dicts, ranges and strings, already have a fast or a specific
+membership test, so they are used as they are.
+
+Functions:
+    build_lookup
+
+Classes:
+    MembershipLookup
+"""
+
+from __future__ import annotations
+from bisect import bisect_left
+from collections.abc import Iterator
+from typing import Any, Collection, Iterable, Literal, Tuple
+
+# the types of unhashable values whose ordering is consistent with the
+# equality, so a sorted list of them can be searched with bisect
+ORDERABLE_TYPES = (list, bytearray)
+
+
+class MembershipLookup:
+    """
+    A class to represent the allowed values of a membership check.
+
+    ...
+
+    Attributes
+    ----------
+    kind : Literal["hash", "sorted", "scan"]
+            the strategy used to find the values
+    values : Collection
+            the frozenset, the sorted list or the tuple holding the values
+    items : Tuple
+            the values, in the order they were received
+
+    Methods
+    -------
+    missing(values):
+            Return the received values that are not allowed
+    """
+
+    __slots__ = ("kind", "values", "items")
+
+    def __init__(self, data_structure: Iterable) -> None:
+        """
+        Constructs all the necessary attributes for the lookup object.
+
+        Parameters
+        ----------
+                data_structure (Iterable): the allowed values
+        """
+
+        self.items: Tuple[Any, ...] = tuple(data_structure)
+        self.kind: Literal["hash", "sorted", "scan"] = "scan"
+        self.values: Collection = self.items
+
+        try:
+            self.values = frozenset(self.items)
+            self.kind = "hash"
+            return
+        except TypeError:
+            pass
+
+        types = {type(item) for item in self.items}
+
+        if len(types) == 1 and types.pop() in ORDERABLE_TYPES:
+            self.values = sorted(self.items)
+            self.kind = "sorted"
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            if self.kind == "hash":
+                return value in self.values
+
+            if self.kind == "sorted":
+                index = bisect_left(self.values, value)
+
+                return (
+                    index < len(self.values) and self.values[index] == value
+                )
+        except TypeError:
+            # unhashable or uncomparable values can still be equal to
+            # one of the allowed values
+            pass
+
+        return value in self.items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        return f"MembershipLookup({list(self.items)!r})"
+
+    def missing(self, values: Iterable[Any]) -> Collection[Any]:
+        """
+        Return the received values that are not allowed, comparing them
+        in bulk when they and the allowed values are hashable
+
+        Parameters
+        ----------
+        values : Iterable[Any]
+                the values that will be checked
+
+        Returns
+        -------
+        missing (Collection[Any]): the values not allowed
+        """
+
+        if self.kind == "hash":
+            try:
+                return set(values).difference(self.values)
+            except TypeError:
+                pass
+
+        return [value for value in values if value not in self]
+
+
+def build_lookup(data_structure: Iterable) -> Iterable:
+    """
+    Convert the allowed values of a membership check into a lookup, if
+    the membership test of the received data structure is a linear scan
+
+    Parameters
+    ----------
+    data_structure : Iterable
+            the allowed values
+
+    Returns
+    -------
+    lookup (Iterable): a MembershipLookup for lists, tuples and
+    iterators, the received data structure otherwise
+    """
+
+    if isinstance(data_structure, (list, tuple, Iterator)):
+        return MembershipLookup(data_structure)
+
+    return data_structure
@@ -0,0 +1,71 @@
+"""
+Validates NDJSON (JSON Lines) streams with bounded memory.
+
+The lines are consumed from the file object in chunks, so at most one
+chunk of lines is held in memory, and the result of each line is
+yielded as soon as its chunk is validated.
+
+Functions:
+    iter_ndjson
+"""
+
+from __future__ import annotations
+import json
+from typing import TYPE_CHECKING, Any, Callable, IO, Iterator, Tuple
+from PyYep.exceptions import ValidationError
+from PyYep.result import ValidationResult
+from PyYep.utils.batch import iter_chunks, iter_with_function
+
+if TYPE_CHECKING:
+    from PyYep.validators.validator import Validator
+
+
+def validate_line(
+    validate: Callable[[Any], Any], line: str | bytes
+) -> ValidationResult[Any]:
+    try:
+        value = json.loads(line)
+    except ValueError as error:
+        return ValidationResult(
+            None, [ValidationError("", f"Invalid JSON line: {error}")]
+        )
+
+    try:
+        return ValidationResult(validate(value), [])
+    except ValidationError as error:
+        return ValidationResult(None, error.inner or [error])
+
+
+def iter_ndjson(
+    validator: Validator, file: IO[str] | IO[bytes], chunk_size: int
+) -> Iterator[Tuple[int, ValidationResult[Any]]]:
+    """
+    Validate each line of a NDJSON file object, with the function chosen
+    by iter_with_function for each chunk. Blank lines are skipped
+
+    Parameters
+    ----------
+    validator : Validator
+            the validator used to check the value of each line
+    file : IO
+            the file object, opened in text or binary mode
+    chunk_size : int
+            the number of lines read from the file at a time
+
+    Returns
+    -------
+    results (Iterator[Tuple[int, ValidationResult]]): the line number,
+    starting at 1, and the validation result of each line
+    """
+
+    chunks = iter_chunks(file, chunk_size)
+    line_number = 0
+
+    for validate, chunk in iter_with_function(validator, chunks, chunk_size):
+        for line in chunk:
+            line_number += 1
+
+            if line.isspace() or not line:
+                continue
+
+            yield line_number, validate_line(validate, line)
@@ -0,0 +1,214 @@
+"""
+Reorders the checks of an input item by their expected cost.
+
+The checks of an input item are executed in order and the first failure
+stops the validation, so running the cheap checks and the ones that
+fail often first lowers the average cost, mostly for invalid values.
+When an input item is marked as order-independent its checks are sorted
+by static cost hints, then the checks executed during a warm-up window
+are timed and their failures counted, and once the window ends the
+checks are sorted by their observed cost divided by their failure rate,
+the optimal order of a chain of independent checks stopping at the
+first failure.
+
+The checks calling nested validators, like of and shape, change the
+items of the value in place, so the other checks only move across them
+when they don't read the items, like the length checks. Coroutine
+checks are never moved.
+
+Functions:
+    order_checks
+    static_rank
+
+Classes:
+    CheckOrderOptimizer
+"""
+
+from __future__ import annotations
+from math import inf
+from typing import Any, Callable, List
+from PyYep.utils.compiler import NESTING_CHECKS
+from PyYep.utils.decorators import AsyncFunctionCall, ValidatorCall
+
+
+# the relative cost of the built-in checks, the unknown checks and the
+# custom functions are assumed to be expensive
+COST_HINTS = {
+    "Validator.required": 1.0,
+    "Validator.in_": 2.0,
+    "StringValidator.min": 1.0,
+    "StringValidator.max": 1.0,
+    "StringValidator.uuid": 8.0,
+    "StringValidator.ipv4": 10.0,
+    "StringValidator.iso_date": 10.0,
+    "StringValidator.ipv6": 15.0,
+    "StringValidator.email": 20.0,
+    "StringValidator.matches": 20.0,
+    "StringValidator.url": 30.0,
+    "NumericValidator.min": 1.0,
+    "NumericValidator.max": 1.0,
+    "BooleanValidator.to_be": 1.0,
+    "ArrayValidator.len": 1.0,
+    "ArrayValidator.min": 1.0,
+    "ArrayValidator.max": 1.0,
+    "ArrayValidator.includes": 10.0,
+    "ArrayValidator.in_many": 50.0,
+    "ArrayValidator.of": 100.0,
+    "DictValidator.shape": 100.0,
+    "DictValidator.columns": 100.0,
+}
+
+DEFAULT_COST = 50.0
+
+# the checks that don't read the items of the value, so they can move
+# across the nesting checks
+ITEM_AGNOSTIC_CHECKS = {
+    "Validator.required",
+    "ArrayValidator.len",
+    "ArrayValidator.min",
+    "ArrayValidator.max",
+}
+
+
+def check_name(check: Any) -> str | None:
+    if isinstance(check, ValidatorCall):
+        return check.func.__qualname__
+
+    return None
+
+
+def is_barrier(check: Any) -> bool:
+    return (
+        isinstance(check, AsyncFunctionCall)
+        or check_name(check) in NESTING_CHECKS
+    )
+
+
+def can_swap(first: Any, second: Any) -> bool:
+    if isinstance(first, AsyncFunctionCall) or isinstance(
+        second, AsyncFunctionCall
+    ):
+        return False
+
+    if is_barrier(first):
+        return check_name(second) in ITEM_AGNOSTIC_CHECKS
+
+    if is_barrier(second):
+        return check_name(first) in ITEM_AGNOSTIC_CHECKS
+
+    return True
+
+
+def static_rank(check: Any) -> float:
+    return COST_HINTS.get(check_name(check) or "", DEFAULT_COST)
+
+
+def order_checks(
+    checks: List[Any], rank: Callable[[Any], float]
+) -> List[Any]:
+    """
+    Return the checks sorted by their rank, a check only moves before
+    the checks it can be swapped with and the checks with the same rank
+    keep their order
+
+    Parameters
+    ----------
+    checks : List[Any]
+            the checks of the input item, in order
+    rank : Callable[[Any], float]
+            the function returning the rank of a check, the lower ranks
+            are executed first
+
+    Returns
+    -------
+    checks (List[Any]): a new list with the sorted checks
+    """
+
+    ordered: List[Any] = []
+    ranks: List[float] = []
+
+    for check in checks:
+        value = rank(check)
+        position = len(ordered)
+
+        while (
+            position > 0
+            and ranks[position - 1] > value
+            and can_swap(ordered[position - 1], check)
+        ):
+            position -= 1
+
+        ordered.insert(position, check)
+        ranks.insert(position, value)
+
+    return ordered
+
+
+class CheckOrderOptimizer:
+    """
+    A class to represent the measures of the checks of an input item
+    during the warm-up window.
+
+    ...
+
+    Attributes
+    ----------
+    remaining : int
+            the number of validations left in the warm-up window
+    measures : List[List[float]]
+            the calls, the cumulative time and the failures of each check,
+            by the position of the check
+
+    Methods
+    -------
+    record(position, elapsed, failed):
+            Add a measure of a check
+
+    finish_run():
+            Count a validation, returns True when the window ends
+
+    order(checks):
+            Return the checks sorted by their observed cost
+    """
+
+    __slots__ = ("remaining", "measures")
+
+    def __init__(self, warmup: int) -> None:
+        """
+        Constructs all the necessary attributes for the optimizer object.
+
+        Parameters
+        ----------
+                warmup (int): the number of validations measured
+        """
+
+        self.remaining = warmup
+        self.measures: List[List[float]] = []
+
+    def record(self, position: int, elapsed: float, failed: bool) -> None:
+        while len(self.measures) <= position:
+            self.measures.append([0, 0.0, 0])
+
+        measure = self.measures[position]
+        measure[0] += 1
+        measure[1] += elapsed
+        measure[2] += failed
+
+    def finish_run(self) -> bool:
+        self.remaining -= 1
+
+        return self.remaining <= 0
+
+    def order(self, checks: List[Any]) -> List[Any]:
+        ranks = {}
+
+        for position, check in enumerate(checks):
+            ranks[id(check)] = inf
+
+            if position < len(self.measures) and self.measures[position][0]:
+                calls, total, failures = self.measures[position]
+                # smoothed, so the checks that never failed keep a rank
+                failure_rate = (failures + 1) / (calls + 2)
+                ranks[id(check)] = total / calls / failure_rate
+
+        return order_checks(checks, lambda check: ranks[id(check)])
@@ -0,0 +1,114 @@
+"""
+Shared registry of compiled regular expressions.
+
+The patterns used by the validators are compiled once, when their
+checks are added, and shared through a least recently used cache larger
+than the small internal cache of the re module, which is thrashed when
+applications use many patterns. The cache is bounded, so patterns built
+dynamically don't grow it without limit. Built-in formats are registered
+by name, kept for the lifetime of the process, and can be retrieved with
+get_pattern.
+
+Functions:
+    compile_pattern
+    register_pattern
+    get_pattern
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict
+
+
+PATTERN_CACHE_SIZE = 1024
+
+_named: Dict[str, re.Pattern] = {}
+
+
+def compile_pattern(pattern: str | re.Pattern, flags: int = 0) -> re.Pattern:
+    """
+    Compile a pattern, or return the already compiled one
+
+    Parameters
+    ----------
+    pattern : Union[str, re.Pattern]
+            the regular expression, compiled patterns are returned
+            unchanged
+    flags : int
+            the flags used to compile the pattern
+
+    Returns
+    -------
+    pattern (re.Pattern): the compiled pattern
+    """
+
+    if isinstance(pattern, re.Pattern):
+        return pattern
+
+    return _compile(pattern, flags)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile(pattern: str, flags: int) -> re.Pattern:
+    return re.compile(pattern, flags)
+
+
+def register_pattern(
+    name: str, pattern: str | re.Pattern, flags: int = 0
+) -> re.Pattern:
+    """
+    Compile a pattern and register it under a name
+
+    Parameters
+    ----------
+    name : str
+            the name of the pattern, registering a name again replaces
+            the previous pattern
+    pattern : Union[str, re.Pattern]
+            the regular expression
+    flags : int
+            the flags used to compile the pattern
+
+    Returns
+    -------
+    pattern (re.Pattern): the compiled pattern
+    """
+
+    compiled = compile_pattern(pattern, flags)
+    _named[name] = compiled
+
+    return compiled
+
+
+def get_pattern(name: str) -> re.Pattern:
+    """
+    Get a registered pattern
+
+    Parameters
+    ----------
+    name : str
+            the name of the pattern
+
+    Raises
+    ------
+    KeyError: if no pattern is registered under the name
+
+    Returns
+    -------
+    pattern (re.Pattern): the compiled pattern
+    """
+
+    try:
+        return _named[name]
+    except KeyError:
+        raise KeyError(f"No pattern registered as '{name}'") from None
+
+
+EMAIL_PATTERN = register_pattern("email", r"[^@]+@[^@]+\.[^@]+")
+UUID_PATTERN = register_pattern(
+    "uuid",
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+ISO_DATE_PATTERN = register_pattern("iso_date", r"\d{4}-\d{2}-\d{2}", re.ASCII)
+WHITESPACE_PATTERN = register_pattern("whitespace", r"\s")
@@ -0,0 +1,280 @@
+"""
+Finds the invalid items of numeric and string sequences in bulk.
+
+When the items of an array are checked by a numeric validator using
+only bound checks, the bounds are evaluated over the whole sequence at
+once, with NumPy when the sequence is a NumPy array or with the min and
+max builtins when it's a list or tuple of ints and floats. The same is
+done for the lengths of lists and tuples of strings checked by a string
+validator using only length checks. Only the invalid items are then
+validated one by one, to build their errors.
+
+Functions:
+    is_ndarray
+    has_fixed_dtype
+    get_numeric_bounds
+    get_length_bounds
+    find_out_of_bounds
+    find_out_of_length
+    find_invalid_items
+    has_bulk_path
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, List, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+if TYPE_CHECKING:
+    from PyYep.validators.validator import Validator
+
+
+# the checks that never fail for ints and floats
+NEUTRAL_CHECKS = {"Validator.required"}
+
+NUMERIC_ITEM_TYPES = {int, float}
+
+# the kinds of the NumPy dtypes of signed, unsigned and float numbers
+NUMERIC_DTYPE_KINDS = "iuf"
+
+
+def is_ndarray(value: Any) -> bool:
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def has_fixed_dtype(value: Any) -> bool:
+    # the items assigned to NumPy arrays are converted to their dtype,
+    # only the arrays of objects keep them as they are
+    return is_ndarray(value) and value.dtype.kind != "O"
+
+
+def get_numeric_bounds(
+    validator: Validator,
+) -> Tuple[Any | None, Any | None] | None:
+    """
+    Get the combined bounds of a numeric validator, if the validator can
+    be evaluated in bulk
+
+    Parameters
+    ----------
+    validator : Validator
+            the validator used to check the items of the sequence
+
+    Returns
+    -------
+    bounds (Optional[Tuple[Optional[Any], Optional[Any]]]): the highest
+    min and the lowest max of the validator, None for a bound not set, or
+    None if the validator uses other checks, conditions, success hooks or
+    a modifier
+    """
+
+    return get_bounds(validator, "NumericValidator", None)
+
+
+def get_length_bounds(
+    validator: Validator,
+) -> Tuple[int | None, int | None] | None:
+    """
+    Get the combined length bounds of a string validator, if the
+    validator can be evaluated in bulk
+
+    Parameters
+    ----------
+    validator : Validator
+            the validator used to check the items of the sequence
+
+    Returns
+    -------
+    bounds (Optional[Tuple[Optional[int], Optional[int]]]): the highest
+    min and the lowest max length of the validator, None for a bound not
+    set, or None if the validator uses other checks, conditions, success
+    hooks or a modifier. The required check is a min length of 1
+    """
+
+    return get_bounds(validator, "StringValidator", 1)
+
+
+def get_bounds(
+    validator: Validator, prefix: str, required: Any | None
+) -> Tuple[Any | None, Any | None] | None:
+    input_item = validator.input_item
+    coercion = type(validator).safe_coerce.__qualname__
+
+    if (
+        input_item is None
+        or coercion != f"{prefix}.safe_coerce"
+        or any(check.condition is not None for check in input_item._validators)
+        or input_item._modifier is not None
+        or input_item.on_success is not None
+    ):
+        return None
+
+    low = high = None
+
+    for check in input_item._validators:
+        qualname = getattr(getattr(check, "func", None), "__qualname__", None)
+
+        if qualname in NEUTRAL_CHECKS:
+            # the required check rejects the empty strings
+            if required is not None:
+                low = required if low is None else max(low, required)
+
+            continue
+
+        if getattr(check, "kwargs", True) or qualname not in (
+            f"{prefix}.min",
+            f"{prefix}.max",
+        ):
+            return None
+
+        bound = check.args[0]
+
+        if qualname == f"{prefix}.min":
+            low = bound if low is None else max(low, bound)
+        else:
+            high = bound if high is None else min(high, bound)
+
+    return low, high
+
+
+def find_out_of_bounds(
+    value: Any, low: Any | None, high: Any | None
+) -> List[int] | None:
+    """
+    Find the indexes of the items of a sequence outside of the bounds
+
+    Parameters
+    ----------
+    value : Any
+            the sequence that will be checked
+    low : Optional[Any]
+            the minimum value allowed
+    high : Optional[Any]
+            the maximum value allowed
+
+    Returns
+    -------
+    indexes (Optional[List[int]]): the indexes of the invalid items, or
+    None if the sequence is not a one-dimensional numeric NumPy array or
+    a list or tuple containing only ints and floats
+    """
+
+    if is_ndarray(value):
+        if value.ndim != 1 or value.dtype.kind not in NUMERIC_DTYPE_KINDS:
+            return None
+
+        mask = numpy.zeros(len(value), dtype=bool)
+
+        if low is not None:
+            mask |= value < low
+
+        if high is not None:
+            mask |= value > high
+
+        return numpy.flatnonzero(mask).tolist()
+
+    if value.__class__ is not list and value.__class__ is not tuple:
+        return None
+
+    if not value or not set(map(type, value)) <= NUMERIC_ITEM_TYPES:
+        return None
+
+    # the builtins scan the sequence in C, so the indexes are only
+    # searched when an invalid item exists
+    if (low is None or min(value) >= low) and (
+        high is None or max(value) <= high
+    ):
+        return []
+
+    return [
+        index
+        for index, item in enumerate(value)
+        if (low is not None and item < low)
+        or (high is not None and item > high)
+    ]
+
+
+def find_out_of_length(
+    value: Any, low: int | None, high: int | None
+) -> List[int] | None:
+    """
+    Find the indexes of the strings of a sequence whose length is outside
+    of the bounds
+
+    Parameters
+    ----------
+    value : Any
+            the sequence that will be checked
+    low : Optional[int]
+            the minimum length allowed
+    high : Optional[int]
+            the maximum length allowed
+
+    Returns
+    -------
+    indexes (Optional[List[int]]): the indexes of the invalid items, or
+    None if the sequence is not a list or tuple containing only strings
+    """
+
+    if value.__class__ is not list and value.__class__ is not tuple:
+        return None
+
+    if not value or set(map(type, value)) != {str}:
+        return None
+
+    lengths = list(map(len, value))
+
+    if (low is None or min(lengths) >= low) and (
+        high is None or max(lengths) <= high
+    ):
+        return []
+
+    return [
+        index
+        for index, length in enumerate(lengths)
+        if (low is not None and length < low)
+        or (high is not None and length > high)
+    ]
+
+
+def find_invalid_items(
+    validator: Validator, value: Sequence
+) -> List[int] | None:
+    """
+    Find the indexes of the invalid items of a sequence in bulk, using
+    the numeric bounds or the length bounds of the validator
+
+    Parameters
+    ----------
+    validator : Validator
+            the validator used to check the items of the sequence
+    value : Sequence
+            the sequence that will be checked
+
+    Returns
+    -------
+    indexes (Optional[List[int]]): the indexes of the invalid items, or
+    None if the items must be validated one by one
+    """
+
+    bounds = get_numeric_bounds(validator)
+
+    if bounds is not None:
+        return find_out_of_bounds(value, *bounds)
+
+    lengths = get_length_bounds(validator)
+
+    if lengths is not None:
+        return find_out_of_length(value, *lengths)
+
+    return None
+
+
+def has_bulk_path(validator: Validator) -> bool:
+    return (
+        get_numeric_bounds(validator) is not None
+        or get_length_bounds(validator) is not None
+    )
@@ -1,12 +1,51 @@
-from typing import Any, TypeVar, TypeGuard
+import asyncio
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import closing
+from contextvars import ContextVar
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    TypeVar,
+    Tuple,
+)
 from collections.abc import Sequence
 from PyYep.validators.validator import Validator
 from PyYep.exceptions import ValidationError
-from PyYep.utils.decorators import ProxyContainer, validator_method
+from PyYep.utils.decorators import convert_arguments, validator_method
+from PyYep.utils.limits import MAX_ERRORS, collect_outcomes
+from PyYep.utils.membership import MembershipLookup, build_lookup
+from PyYep.utils.vectorize import (
+    find_invalid_items,
+    has_fixed_dtype,
+    is_ndarray,
+)
 
 
 T = TypeVar("T", bound=Sequence)
 
+# the types of the items that are always hashable, the keys of other
+# items are hashed to find the unhashable ones
+HASHABLE_TYPES = {str, int, float, bool, bytes, type(None)}
+
+# the pools validating the chunks of the sequences, created on the first
+# use and reused by the next validations with the same options
+POOLS: Dict[Tuple[str, int], Executor] = {}
+POOLS_LOCK = Lock()
+
+# set while a chunk is validated by a worker, the nested sequences are
+# validated on the worker, so the tasks never wait for the same pool
+IN_WORKER: ContextVar[bool] = ContextVar("in_worker", default=False)
+
 
 class ArrayValidator(Validator[T]):
     """
@@ -25,13 +64,31 @@ class ArrayValidator(Validator[T]):
     max(max, value):
         Verify if the size of the received list is equal or lower than the max
 
+    in_many(data_structure, value):
+        Verify if all the items of the received list are present in the
+        data structure
+
+    safe_coerce(value):
+        Verify if the received value is a sequence or a NumPy array
+
     verify():
         Get the validator's input value. If the value is not None converts
         it to a string and pass it to the input verify method
     """
 
+    __slots__ = ()
+
     @validator_method
-    def of(self, validator: Validator, value: Sequence) -> None:
+    def of(
+        self,
+        validator: Validator,
+        value: Sequence,
+        *,
+        workers: int | None = None,
+        chunk_size: int = 1000,
+        executor: Literal["thread", "process"] = "thread",
+        dedupe: bool = False,
+    ) -> ValidationError | None:
         """
         Validate the items of a list
 
@@ -41,15 +98,36 @@ class ArrayValidator(Validator[T]):
             the list that will be checked
         validator : (Validator)
             the validation used to check the list items
-
-        Raises
-        ----------
-        ValidationError:
-            if any of the items fails validation
+        workers : (int, optional)
+            the number of threads used to validate the items, if passed
+            lists larger than the chunk_size are split in chunks validated
+            concurrently. The hooks of the item validator may be called
+            from the worker threads
+        chunk_size : (int)
+            the number of items validated by each task
+        executor : (str)
+            "thread" to use a thread pool or "process" to use a process
+            pool, in which case the item validator and the items must be
+            picklable and the items are replaced by validated copies
+        dedupe : (bool)
+            validate each distinct item once per call and reuse its
+            outcome for the repeated items, the errors are copied with
+            the path of each index. Hashable items are distinct when
+            their types or values differ, other items when they are
+            different objects. The repeated items don't call the hooks
+            of the item validator and the pool options are ignored
+
+        When the item validator is a numeric validator using only the
+        min, max and required checks, NumPy arrays and lists of ints and
+        floats are checked in bulk and only the invalid items are
+        validated one by one. The same is done for lists of strings
+        checked by a string validator using only the min, max and
+        required checks
 
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if any of the items fails validation
         """
 
         if validator.input_item is None:
@@ -58,40 +136,60 @@ class ArrayValidator(Validator[T]):
                 "before setting an input_item."
             )
 
-        errors = []
+        return validate_items(
+            self.name, validator, value, workers, chunk_size, executor, dedupe
+        )
+
+    async def _of_async(
+        self,
+        validator: Validator,
+        value: Sequence,
+        limiter: asyncio.Semaphore | None = None,
+        *,
+        workers: int | None = None,
+        chunk_size: int = 1000,
+        executor: Literal["thread", "process"] = "thread",
+        dedupe: bool = False,
+    ) -> ValidationError | None:
+        # used by the asynchronous validation methods when the item
+        # validator uses coroutine validators, the items are awaited
+        # concurrently and the pool options are ignored
+        if validator.input_item is None:
+            raise AttributeError(
+                "It's not possible to set a schema of a validator "
+                "before setting an input_item."
+            )
 
-        for index, item in enumerate(value):
-            if not is_valid_data_container(
-                validator.input_item.data_container
-            ):
-                raise TypeError(
-                    "Inplicit schemas require the usage "
-                    "of ProxyContainer as data_container"
-                )
+        if not dedupe:
+            outcomes = await asyncio.gather(
+                *[validator.run_async(item, limiter) for item in value]
+            )
+
+            return merge_outcomes(self.name, value, enumerate(outcomes))
 
-            validator.input_item.data_container.set_value(item)
+        positions: Dict[Any, int] = {}
+        distinct = []
+        indexes = []
 
-            try:
-                result = validator.verify()
-                setter = getattr(value, "__setitem__", None)
+        for item in value:
+            key = dedupe_key(item)
 
-                # necessary because some sequencies are not mutable
-                if setter is not None:
-                    setter(index, result)
+            if key not in positions:
+                positions[key] = len(distinct)
+                distinct.append(item)
 
-            except ValidationError as error:
-                format_error_path(self.name, index, error)
+            indexes.append(positions[key])
 
-                if not error.inner:
-                    errors.append(error)
-                else:
-                    errors.extend(error.inner)
+        outcomes = await asyncio.gather(
+            *[validator.run_async(item, limiter) for item in distinct]
+        )
 
-        if errors:
-            raise ValidationError("", "Internal validation erros", errors)
+        return merge_outcomes(
+            self.name, value, enumerate(reuse_outcomes(outcomes, indexes))
+        )
 
     @validator_method
-    def len(self, size: int, value: Sequence) -> None:
+    def len(self, size: int, value: Sequence) -> ValidationError | None:
         """
         Verify if size of the received list
 
@@ -102,24 +200,21 @@ class ArrayValidator(Validator[T]):
         size : (int)
             the expected size of the list
 
-        Raises
-        ----------
-        ValidationError:
-            if the size of the list is not equal to the expected
-
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if the size of the list is not equal to
+            the expected
         """
 
         if len(value) != size:
-            raise ValidationError(
+            return ValidationError(
                 self.name,
                 f"Invalid size, expected the list to have {size} items",
             )
 
     @validator_method
-    def min(self, min: int, value: Sequence) -> None:
+    def min(self, min: int, value: Sequence) -> ValidationError | None:
         """
         Verify if size of the received list is equal or higher than the min
 
@@ -130,25 +225,21 @@ class ArrayValidator(Validator[T]):
         min : (int)
             the minimun length allowed
 
-        Raises
-        ----------
-        ValidationError:
-            if the length is smaller than the min
-
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if the length is smaller than the min
         """
 
         if len(value) < min:
-            raise ValidationError(
+            return ValidationError(
                 self.name,
                 "received list is to small, expected a minimum of"
                 f" {min} items",
             )
 
     @validator_method
-    def max(self, max: int, value: Sequence) -> None:
+    def max(self, max: int, value: Sequence) -> ValidationError | None:
         """
         Verify if the size of the received list is equal or lower than the max
 
@@ -159,21 +250,17 @@ class ArrayValidator(Validator[T]):
         max : (int)
             the maximun length allowed
 
-        Raises
-        ----------
-        ValidationError:
-            if the length is larger than the max
-
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if the length is larger than the max
         """
 
         if len(value) > max:
-            raise ValidationError(self.name, "Value too large received")
+            return ValidationError(self.name, "Value too large received")
 
     @validator_method
-    def includes(self, item: Any, value: Sequence) -> None:
+    def includes(self, item: Any, value: Sequence) -> ValidationError | None:
         """
         Verify if iterable contains a given item
 
@@ -184,21 +271,86 @@ class ArrayValidator(Validator[T]):
         item : (int)
             the value expected to be found on the iterable
 
-        Raises
-        ----------
-        ValidationError:
-            if the item is not contained on the value
-
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if the item is not contained on the value
         """
 
         if item not in value:
-            raise ValidationError(
+            return ValidationError(
                 self.name, f"Value '{item}' not included on iterable"
             )
 
+    @convert_arguments(build_lookup)
+    @validator_method
+    def in_many(
+        self, data_structure: Iterable, value: Sequence
+    ) -> ValidationError | None:
+        """
+        Verify if all the items of the received list are present in the
+        received data structure, the equivalent of of(validator.in_(...))
+        checked in bulk. Lists, tuples and iterators are converted once
+        into a lookup, and when the items are hashable the missing ones
+        are found with a single set difference
+
+        Parameters
+        ----------
+        value : (Sequence)
+            the list that will be checked
+        data_structure : (Iterable)
+            a iterable in wich the items are supposed to be present
+
+        Returns
+        ----------
+        error (Optional[ValidationError]):
+            a validation error containing an error for each item not
+            present in the data structure
+        """
+
+        if isinstance(data_structure, MembershipLookup):
+            if not data_structure.missing(value):
+                return None
+
+        outcomes = (
+            (
+                index,
+                (
+                    item,
+                    ValidationError(
+                        "", "Value not present in the received data structure"
+                    ),
+                ),
+            )
+            for index, item in enumerate(value)
+            if item not in data_structure
+        )
+
+        return merge_outcomes(self.name, value, outcomes)
+
+    def safe_coerce(self, value: Any) -> Tuple[T, ValidationError | None]:
+        """
+        Verify if the received value is a sequence
+
+        Parameters
+        ----------
+        value : (Any)
+            the value that will be checked
+
+        Returns
+        ----------
+        result (Tuple[Sequence, Optional[ValidationError]]):
+            the received value and a validation error
+            if the received value is not a sequence
+        """
+
+        if not isinstance(value, Sequence) and not is_ndarray(value):
+            return value, ValidationError(
+                self.name, "Invalid value received, expected an iterable"
+            )
+
+        return value, None
+
     def verify(self) -> Sequence | None:
         """
         Get the validator's input value, verify if its a sequence and pass
@@ -215,39 +367,273 @@ class ArrayValidator(Validator[T]):
             the value returned by the input
         """
 
-        result = self.get_input_item_value()
+        return self.validate(self.get_input_item_value())
 
-        if not isinstance(result, Sequence):
-            raise ValidationError(
-                self.name, "Invalid value received, expected an iterable"
-            )
 
-        if self.input_item is None:
-            raise AttributeError(
-                "It's not possible to set a schema of a validator "
-                "before setting an input_item."
-            )
+def validate_items(
+    base: str,
+    validator: Validator,
+    value: Sequence,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+    executor: Literal["thread", "process"] = "thread",
+    dedupe: bool = False,
+) -> ValidationError | None:
+    """
+    Validate the items of a sequence, checking them in bulk when the
+    validator allows it
+
+    Parameters
+    ----------
+    base : (str)
+        the path of the sequence, prepended to the indexes of the errors
+    validator : (Validator)
+        the validator used to check the items
+    value : (Sequence)
+        the items that will be checked
+    workers : (int, optional)
+        the number of workers used to validate the items, if passed
+        sequences larger than the chunk_size are split in chunks
+    chunk_size : (int)
+        the number of items validated by each task
+    executor : (str)
+        "thread" to use a thread pool or "process" to use a process pool
+    dedupe : (bool)
+        validate each distinct item once and reuse its outcome for the
+        repeated items
+
+    Returns
+    ----------
+    error (Optional[ValidationError]):
+        a validation error if any of the items fails validation
+    """
+
+    indexes = find_invalid_items(validator, value)
+
+    if indexes is not None:
+        outcomes = ((index, validator.run(value[index])) for index in indexes)
+        return merge_outcomes(base, value, outcomes)
+
+    if dedupe:
+        outcomes = iter_deduped(validator, value)
+    elif (
+        workers is not None
+        and len(value) > chunk_size
+        and not IN_WORKER.get()
+    ):
+        # closed when the limit of errors is reached, which cancels the
+        # chunks not started yet
+        with closing(
+            run_in_chunks(validator, value, workers, chunk_size, executor)
+        ) as chunks:
+            return merge_outcomes(base, value, enumerate(chunks))
+    else:
+        outcomes = map(validator.run, value)
 
-        return self.input_item.verify(result)
+    return merge_outcomes(base, value, enumerate(outcomes))
 
 
-def is_valid_data_container(x: object) -> TypeGuard[ProxyContainer]:
-    return hasattr(x, "set_value")
+def dedupe_key(item: Any) -> Any:
+    # equal values of different types, like 1 and True, may have
+    # different outcomes, unhashable items are distinct objects
+    key = (item.__class__, item)
 
+    if item.__class__ in HASHABLE_TYPES:
+        return key
 
-def format_error_path(base: str, index: int, error: ValidationError) -> None:
-    message = ""
+    try:
+        hash(key)
+    except TypeError:
+        return id(item)
 
-    if base:
-        message += base
-    else:
-        message += "_PyYepBlank"
+    return key
+
+
+def iter_deduped(
+    validator: Validator, value: Sequence
+) -> Iterator[Tuple[Any, ValidationError | None]]:
+    """
+    Validate each distinct item of a sequence once, the outcomes of the
+    repeated items are reused, with copies of the errors
+
+    Parameters
+    ----------
+    validator : (Validator)
+        the validator used to check the items
+    value : (Sequence)
+        the items that will be checked
+
+    Returns
+    ----------
+    outcomes (Iterator[Tuple[Any, Optional[ValidationError]]]):
+        the result and error of each item, in the order of the sequence
+    """
+
+    outcomes: Dict[Any, Tuple[Any, ValidationError | None]] = {}
+
+    for item in value:
+        key = dedupe_key(item)
+        outcome = outcomes.get(key)
 
-    message += f"[{index}]"
+        if outcome is None:
+            result, error = validator.run(item)
+            # the paths of the errors yielded are changed by the merge,
+            # so a pristine copy is kept
+            outcomes[key] = (result, None if error is None else error.copy())
 
-    if not error.inner:
-        error.path = message
-        return
+            yield result, error
+            continue
+
+        result, error = outcome
+        yield result, None if error is None else error.copy()
+
+
+def reuse_outcomes(
+    outcomes: List[Tuple[Any, ValidationError | None]], indexes: List[int]
+) -> Iterator[Tuple[Any, ValidationError | None]]:
+    pristine: Dict[int, ValidationError] = {}
+
+    for index in indexes:
+        result, error = outcomes[index]
+
+        if error is not None:
+            if index in pristine:
+                error = pristine[index].copy()
+            else:
+                pristine[index] = error.copy()
+
+        yield result, error
+
+
+def run_chunk(
+    validator: Validator, items: Sequence, limit: int | None
+) -> List[Tuple[Any, ValidationError | None]]:
+    # the workers don't share the context of the validation, so the
+    # limit of errors is received with the chunk
+    in_worker, max_errors = IN_WORKER.set(True), MAX_ERRORS.set(limit)
+
+    try:
+        return [validator.run(item) for item in items]
+    finally:
+        MAX_ERRORS.reset(max_errors)
+        IN_WORKER.reset(in_worker)
+
+
+def get_pool(
+    executor: Literal["thread", "process"], workers: int
+) -> Executor:
+    """
+    Return the pool used by the validations with the received options,
+    creating it on the first use
+
+    Parameters
+    ----------
+    executor : (str)
+        "thread" to use a thread pool or "process" to use a process pool
+    workers : (int)
+        the number of workers of the pool
+
+    Returns
+    ----------
+    pool (Executor): the shared pool
+    """
+
+    with POOLS_LOCK:
+        pool = POOLS.get((executor, workers))
+
+        if pool is None:
+            if executor == "process":
+                pool = ProcessPoolExecutor(max_workers=workers)
+            else:
+                pool = ThreadPoolExecutor(max_workers=workers)
+
+            POOLS[(executor, workers)] = pool
+
+        return pool
+
+
+def run_in_chunks(
+    validator: Validator,
+    value: Sequence,
+    workers: int,
+    chunk_size: int,
+    executor: Literal["thread", "process"] = "thread",
+) -> Iterator[Tuple[Any, ValidationError | None]]:
+    """
+    Validate the items of a sequence in chunks using a shared thread
+    or process pool. The chunks not started yet are cancelled when the
+    iterator is closed before the last outcome
+
+    Parameters
+    ----------
+    validator : (Validator)
+        the validator used to check the items
+    value : (Sequence)
+        the items that will be checked
+    workers : (int)
+        the number of workers of the pool
+    chunk_size : (int)
+        the number of items validated by each task
+    executor : (str)
+        "thread" to use a thread pool or "process" to use a process pool
+
+    Returns
+    ----------
+    outcomes (Iterator[Tuple[Any, Optional[ValidationError]]]):
+        the result and error of each item, in the order of the sequence
+    """
 
-    for e in error.inner:
-        e.path = f"{message}.{e.path}"
+    pool = get_pool(executor, workers)
+    limit = MAX_ERRORS.get()
+    futures = []
+
+    for start in range(0, len(value), chunk_size):
+        stop = start + chunk_size
+        futures.append(
+            pool.submit(run_chunk, validator, value[start:stop], limit)
+        )
+
+    try:
+        for future in futures:
+            yield from future.result()
+    except BrokenExecutor:
+        # a pool whose workers died can't run new tasks, so it's replaced
+        # by the next validation
+        with POOLS_LOCK:
+            if POOLS.get((executor, workers)) is pool:
+                del POOLS[(executor, workers)]
+
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def merge_outcomes(
+    base: str,
+    value: Sequence,
+    outcomes: Iterable[Tuple[int, Tuple[Any, ValidationError | None]]],
+) -> ValidationError | None:
+    # necessary because some sequencies are not mutable, and the NumPy
+    # arrays with a fixed dtype would convert the results back, like the
+    # floats coerced from a string array stored as strings again
+    setter = None
+
+    if not has_fixed_dtype(value):
+        setter = getattr(value, "__setitem__", None)
+
+    errors = collect_outcomes(
+        outcomes,
+        MAX_ERRORS.get(),
+        setter or keep_item,
+        lambda index, error: error.nest_path(base, index),
+    )
+
+    if errors:
+        return ValidationError("", "Internal validation erros", errors)
+
+    return None
+
+
+def keep_item(index: int, result: Any) -> None:
+    pass
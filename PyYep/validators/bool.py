@@ -1,4 +1,4 @@
-from typing import TypeVar, cast
+from typing import Any, TypeVar, cast, Tuple
 from PyYep.validators.validator import Validator
 from PyYep.exceptions import ValidationError
 from PyYep.utils.decorators import validator_method
@@ -18,12 +18,17 @@ class BooleanValidator(Validator[T]):
     to_be(expected_value, value):
         Verify if the received value is equal or higher than the min
 
+    safe_coerce(value):
+        Converts the received value to a boolean
+
     verify():
         Get the validator's input value.
         If the value is not None converts it to a string
         and pass it to the input verify method
     """
 
+    __slots__ = ("strict",)
+
     def __init__(self, strict: bool = False, *args):
         """
         Constructs a BooleanValidator object.
@@ -37,7 +42,9 @@ class BooleanValidator(Validator[T]):
         self.strict = strict
 
     @validator_method
-    def to_be(self, expected_value: bool, value: bool) -> None:
+    def to_be(
+        self, expected_value: bool, value: bool
+    ) -> ValidationError | None:
         """
         Verify if the received value is equal to expected
 
@@ -48,23 +55,43 @@ class BooleanValidator(Validator[T]):
         expected_value : (bool)
             the expected value
 
-        Raises
-        ----------
-        ValidationError:
-            if the value does not equal to expected
-
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if the value does not equal to expected
         """
 
         if value is not expected_value:
-            raise ValidationError(
+            return ValidationError(
                 self.name,
                 f"{value} received on a boolean validator expecting"
                 f" {expected_value}",
             )
 
+    def safe_coerce(self, value: Any) -> Tuple[T, ValidationError | None]:
+        """
+        Converts the received value to a boolean
+
+        Parameters
+        ----------
+        value : (Any)
+            the value that will be converted
+
+        Returns
+        ----------
+        result (Tuple[bool, Optional[ValidationError]]):
+            the converted value and a validation error
+            if the validator is strict and the value is not a boolean
+        """
+
+        if self.strict and not isinstance(value, bool):
+            return value, ValidationError(
+                self.name,
+                "Non-boolean value received in a strict boolean input",
+            )
+
+        return cast(T, bool(value)), None
+
     def verify(self) -> T | None:
         """
         Get the validator's input value, converts it to a boolean
@@ -80,21 +107,4 @@ class BooleanValidator(Validator[T]):
         result (bool): The value returned by the input verify method
         """
 
-        result = self.get_input_item_value()
-
-        if self.strict and not isinstance(result, bool):
-            raise ValidationError(
-                self.name,
-                "Non-boolean value received in a strict boolean input",
-            )
-
-        if self.input_item is None:
-            raise AttributeError(
-                "It's not possible to set a schema of a validator "
-                "before setting an input_item."
-            )
-
-        result = bool(result)
-        result = cast(T, result)
-
-        return self.input_item.verify(result)
+        return self.validate(self.get_input_item_value())
@@ -1,9 +1,15 @@
 from __future__ import annotations
-from typing import Dict, Any, TypeGuard, TypeVar, cast
+import asyncio
+from collections.abc import Sequence
+from typing import Dict, Any, Iterable, Iterator, List, TypeVar, Tuple
 import PyYep
 from PyYep.validators.validator import Validator
+from PyYep.validators.array import merge_outcomes as merge_item_outcomes
+from PyYep.validators.array import validate_items
 from PyYep.exceptions import ValidationError
 from PyYep.utils.decorators import validator_method, ProxyContainer
+from PyYep.utils.limits import MAX_ERRORS, collect_outcomes
+from PyYep.utils.vectorize import is_ndarray
 
 
 ShapeValidatorT = TypeVar("ShapeValidatorT", bound=Validator)
@@ -11,8 +17,12 @@ T = TypeVar("T", bound=dict)
 
 
 class DictValidator(Validator[T]):
+    __slots__ = ()
+
     @validator_method
-    def shape(self, schema: Dict[Any, ShapeValidatorT], value: T) -> None:
+    def shape(
+        self, schema: Dict[Any, ShapeValidatorT], value: T
+    ) -> ValidationError | None:
         """
         Validate the items of a dict
 
@@ -23,51 +33,153 @@ class DictValidator(Validator[T]):
         schema : (dict)
             the validators used to check the dict items
 
-        Raises
+        Returns
         ----------
-        ValidationError:
-            if any of the items fails validation
+        error (Optional[ValidationError]):
+            a validation error if any of the items fails validation
+        """
+
+        for validator in schema.values():
+            if validator.input_item is None:
+                raise AttributeError(
+                    "It's not possible to set a schema of a validator "
+                    "before setting an input_item."
+                )
+
+        return merge_outcomes(
+            self.name,
+            value,
+            ((key, schema[key].run(value.get(key))) for key in schema),
+        )
+
+    async def _shape_async(
+        self,
+        schema: Dict[Any, ShapeValidatorT],
+        value: T,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> ValidationError | None:
+        # used by the asynchronous validation methods when any of the
+        # validators uses coroutine validators, those are awaited
+        # concurrently while the others are executed inline
+        for validator in schema.values():
+            if validator.input_item is None:
+                raise AttributeError(
+                    "It's not possible to set a schema of a validator "
+                    "before setting an input_item."
+                )
+
+        outcomes: List[Any] = []
+        pending = []
+
+        for key, validator in schema.items():
+            if not validator.is_async():
+                outcomes.append((key, validator.run(value.get(key))))
+                continue
+
+            pending.append(validator.run_async(value.get(key), limiter))
+            outcomes.append((key, None))
+
+        results = iter(await asyncio.gather(*pending))
+
+        return merge_outcomes(
+            self.name,
+            value,
+            (
+                (key, outcome if outcome is not None else next(results))
+                for key, outcome in outcomes
+            ),
+        )
+
+    @validator_method
+    def columns(
+        self, schema: Dict[Any, ShapeValidatorT], value: T
+    ) -> ValidationError | None:
+        """
+        Validate a table stored as a dict of columns, each column is a
+        sequence validated item by item by the validator of its key, so
+        the rows are never built. The columns must have the same length,
+        the errors are reported with paths like column[row]. Columns of
+        numbers or strings are checked in bulk when their validators
+        allow it, like the items of the ArrayValidator.of method
+
+        Parameters
+        ----------
+        value : (dict)
+            the dict of columns that will be checked
+        schema : (dict)
+            the validators used to check the items of each column
 
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if any of the columns is missing or has a
+            different length, or if any of their items fails validation
         """
 
-        errors = []
-
-        for key in schema:
-            validator = schema[key]
+        for validator in schema.values():
+            if validator.input_item is None:
+                raise AttributeError(
+                    "It's not possible to set a schema of a validator "
+                    "before setting an input_item."
+                )
 
+        return merge_outcomes(self.name, value, iter_columns(schema, value))
+
+    async def _columns_async(
+        self,
+        schema: Dict[Any, ShapeValidatorT],
+        value: T,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> ValidationError | None:
+        # used by the asynchronous validation methods when any of the
+        # validators uses coroutine validators, the items of their
+        # columns are awaited concurrently
+        for validator in schema.values():
             if validator.input_item is None:
                 raise AttributeError(
                     "It's not possible to set a schema of a validator "
                     "before setting an input_item."
                 )
 
-            if not is_valid_data_container(
-                validator.input_item.data_container
-            ):
-                raise TypeError(
-                    "Inplicit schemas require the usage of ProxyContainer "
-                    "as data_container"
+        outcomes: List[Any] = []
+
+        for key, outcome in iter_columns(schema, value, skip_async=True):
+            validator = schema[key]
+
+            if outcome is None:
+                column = value[key]
+                items = await asyncio.gather(
+                    *[validator.run_async(item, limiter) for item in column]
                 )
+                error = merge_item_outcomes("", column, enumerate(items))
+                outcome = (column, error)
 
-            validator.input_item.data_container.set_value(value.get(key))
+            outcomes.append((key, outcome))
 
-            try:
-                result = validator.verify()
-                value[key] = result
+        return merge_outcomes(self.name, value, outcomes)
 
-            except ValidationError as error:
-                format_error_path(self.name, key, error)
+    def safe_coerce(self, value: Any) -> Tuple[T, ValidationError | None]:
+        """
+        Verify if the received value is a dict
+
+        Parameters
+        ----------
+        value : (Any)
+            the value that will be checked
+
+        Returns
+        ----------
+        result (Tuple[dict, Optional[ValidationError]]):
+                the received value and a validation error
+                if the received value is not a dict
+        """
 
-                if not error.inner:
-                    errors.append(error)
-                else:
-                    errors.extend(error.inner)
+        if not isinstance(value, dict):
+            return value, ValidationError(
+                self.name, "Invalid value received, expected a dictionary"
+            )
 
-        if errors:
-            raise ValidationError("", "Internal validation errors", errors)
+        return value, None
 
     def verify(self, data: T | None = None) -> T:
         """
@@ -78,7 +190,8 @@ class DictValidator(Validator[T]):
         ----------
         value(dict, optional) : (dict)
             the dict that will be checked, this parameter must only be passed
-            when not using the Schema and InputItem objects
+            when not using the Schema and InputItem objects, the input's data
+            container is not changed when it is received
 
         Raises
         ----------
@@ -90,50 +203,121 @@ class DictValidator(Validator[T]):
         result (dict): The value returned by the input verify method
         """
 
+        self._ensure_input_item(data)
+
+        if data is not None:
+            return self.validate(data)
+
+        return self.validate(self.get_input_item_value())
+
+    async def verify_async(
+        self, data: T | None = None, concurrency: int | None = None
+    ) -> T:
+        """
+        Get the validator's input value, verify if its a dict and pass
+        it to the input validators, awaiting the coroutine validators
+
+        Parameters
+        ----------
+        data : (dict, optional)
+            the dict that will be checked, this parameter must only be passed
+            when not using the Schema and InputItem objects
+        concurrency : (int, optional)
+            the maximum number of coroutine validators awaited at the
+            same time
+
+        Raises
+        ----------
+        ValidationError:
+                if the received value is not a dict or any of its items
+                fails validation
+
+        Returns
+        ----------
+        result (dict): The validated dict
+        """
+
+        self._ensure_input_item(data)
+        return await super().verify_async(data, concurrency)
+
+    def _ensure_input_item(self, data: T | None) -> None:
         if self.input_item is None:
             proxy_container = ProxyContainer()
             proxy_container.set_value(data)
             self.set_input_item(
                 PyYep.InputItem("", proxy_container, "get_value")
             )
-        elif data is not None:
-            proxy_container = ProxyContainer()
-            proxy_container.set_value(data)
-            self.input_item.set_data_container(
-                "", proxy_container, "get_value"
-            )
-
-        result = self.get_input_item_value()
 
-        if not isinstance(result, dict):
-            raise ValidationError(
-                self.name, "Invalid value received, expected a dictionary"
-            )
 
-        if self.input_item is None:
-            raise AttributeError(
-                "It's not possible to set a schema of a validator "
-                "before setting an input_item."
+def iter_columns(
+    schema: Dict[Any, Validator],
+    value: Dict[Any, Any],
+    skip_async: bool = False,
+) -> Iterator[Tuple[Any, Tuple[Any, ValidationError | None] | None]]:
+    """
+    Validate the columns of a table lazily, so the columns after the
+    limit of errors are not validated
+
+    Parameters
+    ----------
+    schema : (dict)
+        the validators used to check the items of each column
+    value : (dict)
+        the dict of columns that will be checked
+    skip_async : (bool)
+        if the outcome of the valid columns checked by validators using
+        coroutine validators is None, so they are awaited by the caller
+
+    Returns
+    ----------
+    outcomes (Iterator[Tuple[Any, Optional[Tuple]]]):
+        the key, and the column and error of each column
+    """
+
+    rows = None
+
+    for key, validator in schema.items():
+        column = value.get(key)
+
+        if isinstance(column, str) or not (
+            isinstance(column, Sequence) or is_ndarray(column)
+        ):
+            error = ValidationError(
+                "", "Invalid column received, expected a sequence"
             )
+            yield key, (column, error)
+            continue
 
-        return cast(T, self.input_item.verify(result))
+        if rows is None:
+            rows = len(column)
 
+        if len(column) != rows:
+            error = ValidationError(
+                "", f"Column with {len(column)} rows, expected {rows}"
+            )
+            yield key, (column, error)
+            continue
 
-def is_valid_data_container(x: object) -> TypeGuard[ProxyContainer]:
-    return hasattr(x, "set_value")
-
+        if skip_async and validator.is_async():
+            yield key, None
+            continue
 
-def format_error_path(base: str, key: str, error: ValidationError) -> None:
-    message = ""
+        yield key, (column, validate_items("", validator, column))
 
-    if base:
-        message += base + "."
 
-    message += key
+def merge_outcomes(
+    base: str,
+    value: T,
+    outcomes: Iterable[Tuple[Any, Tuple[Any, ValidationError | None]]],
+) -> ValidationError | None:
+    errors = collect_outcomes(
+        outcomes,
+        MAX_ERRORS.get(),
+        value.__setitem__,
+        lambda key, error: error.nest_path(base, key),
+    )
 
-    if not error.inner:
-        error.path = message
-        return
+    if errors:
+        return ValidationError("", "Internal validation errors", errors)
 
-    for e in error.inner:
-        e.path = f"{message}.{e.path}"
+    return None
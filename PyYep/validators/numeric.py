@@ -1,6 +1,6 @@
 from __future__ import annotations
 from numbers import Number
-from typing import TypeVar, cast
+from typing import Any, TypeVar, cast, Tuple
 from PyYep.validators.validator import Validator
 from PyYep.exceptions import ValidationError
 from PyYep.utils.decorators import validator_method
@@ -23,13 +23,18 @@ class NumericValidator(Validator[T]):
     max(max, value):
         verify if the received value is equal or lower than the max
 
+    safe_coerce(value):
+        converts the received value to a number
+
     verify():
         get the validator's input value. If the value is not None converts
         it to a string and pass it to the input verify method
     """
 
+    __slots__ = ()
+
     @validator_method
-    def min(self, min: int, value: T) -> None:
+    def min(self, min: int, value: T) -> ValidationError | None:
         """
         Verify if the received value is equal or higher than the min
 
@@ -40,21 +45,17 @@ class NumericValidator(Validator[T]):
         min : (int)
             the minimun value allowed
 
-        Raises
-        ----------
-        ValidationError:
-            if the value smaller than the min
-
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if the value smaller than the min
         """
 
         if value < min:
-            raise ValidationError(self.name, "Value too small received")
+            return ValidationError(self.name, "Value too small received")
 
     @validator_method
-    def max(self, max: int, value: T) -> None:
+    def max(self, max: int, value: T) -> ValidationError | None:
         """
         Verify if the the received value is equal or lower than the max
 
@@ -65,18 +66,41 @@ class NumericValidator(Validator[T]):
         max : (int)
             the maximun length allowed
 
-        Raises
+        Returns
         ----------
-        ValidationError:
-            if the value is larger than the max
+        error (Optional[ValidationError]):
+            a validation error if the value is larger than the max
+        """
+
+        if value > max:
+            return ValidationError(self.name, "Value too large received")
+
+    def safe_coerce(self, value: Any) -> Tuple[T, ValidationError | None]:
+        """
+        Converts the received value to a number, values that already are
+        numbers are returned unchanged
+
+        Parameters
+        ----------
+        value : (Any)
+            the value that will be converted
 
         Returns
         ----------
-        None
+        result (Tuple[float, Optional[ValidationError]]):
+            the converted value and a validation error
+            if the conversion operation to float is invalid
         """
 
-        if value > max:
-            raise ValidationError(self.name, "Value too large received")
+        if isinstance(value, Number):
+            return cast(T, value), None
+
+        try:
+            return cast(T, float(value)), None
+        except (TypeError, ValueError):
+            return value, ValidationError(
+                self.name, "Non-numeric value received in a numeric input"
+            )
 
     def verify(self) -> T | None:
         """
@@ -94,21 +118,4 @@ class NumericValidator(Validator[T]):
             the value returned by the input verify method
         """
 
-        result = self.get_input_item_value()
-
-        if not isinstance(result, Number):
-            try:
-                result = float(result)
-                result = cast(T, result)
-            except (TypeError, ValueError):
-                raise ValidationError(
-                    self.name, "Non-numeric value received in a numeric input"
-                )
-
-        if self.input_item is None:
-            raise AttributeError(
-                "It's not possible to use validation on a Validator "
-                "without an input item."
-            )
-
-        return self.input_item.verify(result)
+        return self.validate(self.get_input_item_value())
@@ -1,8 +1,18 @@
+import ipaddress
 import re
-from typing import TypeVar, cast
+from datetime import date
+from typing import Any, Iterable, TypeVar, cast, Tuple
+from urllib.parse import urlsplit
 from PyYep.validators.validator import Validator
 from PyYep.exceptions import ValidationError
-from PyYep.utils.decorators import validator_method
+from PyYep.utils.decorators import convert_arguments, validator_method
+from PyYep.utils.patterns import (
+    EMAIL_PATTERN,
+    ISO_DATE_PATTERN,
+    UUID_PATTERN,
+    WHITESPACE_PATTERN,
+    compile_pattern,
+)
 
 
 T = TypeVar("T", bound=str)
@@ -19,6 +29,24 @@ class StringValidator(Validator[T]):
     email(value):
         Verify if the received value is a valid email address
 
+    matches(pattern, value):
+        Verify if the received value matches a regular expression
+
+    uuid(value):
+        Verify if the received value is a valid uuid
+
+    url(value, schemes):
+        Verify if the received value is a valid url
+
+    ipv4(value):
+        Verify if the received value is a valid IPv4 address
+
+    ipv6(value):
+        Verify if the received value is a valid IPv6 address
+
+    iso_date(value):
+        Verify if the received value is a valid ISO 8601 date
+
     min(min, value):
         Verify if the length of the received value
         is equal or higher than the min
@@ -27,13 +55,18 @@ class StringValidator(Validator[T]):
         Verify if the length of the received value
         is equal or lower than the max
 
+    safe_coerce(value):
+        Converts the received value to a string
+
     verify():
         Get the validator's input value. If the value is not None converts
         it to a string and pass it to the input verify method
     """
 
+    __slots__ = ()
+
     @validator_method
-    def email(self, value: str) -> None:
+    def email(self, value: str) -> ValidationError | None:
         """
         Verify if the received value is a valid email address
 
@@ -42,24 +75,185 @@ class StringValidator(Validator[T]):
         value : (str)
             the value that will be checked
 
-        Raises
+        Returns
         ----------
-        ValidationError:
-            if the value is not a valid email address
+        error (Optional[ValidationError]):
+            a validation error if the value is not a valid email address
+
+        """
+
+        if EMAIL_PATTERN.fullmatch(value) is None:
+            return ValidationError(
+                self.name, "Value for email type does not match a valid format"
+            )
+
+    @convert_arguments(compile_pattern)
+    @validator_method
+    def matches(
+        self, pattern: str | re.Pattern, value: str
+    ) -> ValidationError | None:
+        """
+        Verify if the whole received value matches a regular expression,
+        the pattern is compiled once, when the check is added, and shared
+        through the pattern registry
 
+        Parameters
+        ----------
+        value : (str)
+            the value that will be checked
+        pattern : (Union[str, re.Pattern])
+            the regular expression, as a string or compiled
 
         Returns
         ----------
-        None
+        error (Optional[ValidationError]):
+            a validation error if the value does not match the pattern
         """
 
-        if re.fullmatch(r"[^@]+@[^@]+\.[^@]+", value) is None:
-            raise ValidationError(
-                self.name, "Value for email type does not match a valid format"
+        if pattern.fullmatch(value) is None:
+            return ValidationError(
+                self.name, "Value does not match the expected pattern"
+            )
+
+    @validator_method
+    def uuid(self, value: str) -> ValidationError | None:
+        """
+        Verify if the received value is a uuid in its canonical form,
+        32 hexadecimal digits separated by hyphens in groups of 8-4-4-4-12
+
+        Parameters
+        ----------
+        value : (str)
+            the value that will be checked
+
+        Returns
+        ----------
+        error (Optional[ValidationError]):
+            a validation error if the value is not a valid uuid
+        """
+
+        if UUID_PATTERN.fullmatch(value) is None:
+            return ValidationError(
+                self.name, "Value for uuid type does not match a valid format"
+            )
+
+    @validator_method
+    def url(
+        self, value: str, *, schemes: Iterable[str] = ("http", "https")
+    ) -> ValidationError | None:
+        """
+        Verify if the received value is an absolute url, with one of the
+        allowed schemes and a host, without whitespaces
+
+        Parameters
+        ----------
+        value : (str)
+            the value that will be checked
+        schemes : (Iterable[str])
+            the allowed schemes, in lower case, received as a keyword
+            argument
+
+        Returns
+        ----------
+        error (Optional[ValidationError]):
+            a validation error if the value is not a valid url
+        """
+
+        try:
+            parts = urlsplit(value)
+            valid = (
+                parts.scheme in schemes
+                and bool(parts.hostname)
+                and WHITESPACE_PATTERN.search(value) is None
+            )
+
+            # the port is only parsed when accessed
+            parts.port
+        except ValueError:
+            valid = False
+
+        if not valid:
+            return ValidationError(
+                self.name, "Value for url type does not match a valid format"
             )
 
     @validator_method
-    def min(self, min: int, value: T) -> None:
+    def ipv4(self, value: str) -> ValidationError | None:
+        """
+        Verify if the received value is an IPv4 address in dotted
+        decimal notation
+
+        Parameters
+        ----------
+        value : (str)
+            the value that will be checked
+
+        Returns
+        ----------
+        error (Optional[ValidationError]):
+            a validation error if the value is not a valid IPv4 address
+        """
+
+        try:
+            ipaddress.IPv4Address(value)
+        except ValueError:
+            return ValidationError(
+                self.name, "Value for ipv4 type does not match a valid format"
+            )
+
+    @validator_method
+    def ipv6(self, value: str) -> ValidationError | None:
+        """
+        Verify if the received value is an IPv6 address
+
+        Parameters
+        ----------
+        value : (str)
+            the value that will be checked
+
+        Returns
+        ----------
+        error (Optional[ValidationError]):
+            a validation error if the value is not a valid IPv6 address
+        """
+
+        try:
+            ipaddress.IPv6Address(value)
+        except ValueError:
+            return ValidationError(
+                self.name, "Value for ipv6 type does not match a valid format"
+            )
+
+    @validator_method
+    def iso_date(self, value: str) -> ValidationError | None:
+        """
+        Verify if the received value is an existing date in the ISO 8601
+        calendar format, YYYY-MM-DD
+
+        Parameters
+        ----------
+        value : (str)
+            the value that will be checked
+
+        Returns
+        ----------
+        error (Optional[ValidationError]):
+            a validation error if the value is not a valid date
+        """
+
+        if ISO_DATE_PATTERN.fullmatch(value) is not None:
+            try:
+                date.fromisoformat(value)
+                return None
+            except ValueError:
+                pass
+
+        return ValidationError(
+            self.name, "Value for date type does not match a valid format"
+        )
+
+    @validator_method
+    def min(self, min: int, value: T) -> ValidationError | None:
         """
         Verify if the length of the received value is equal
         or higher than the min
@@ -71,22 +265,17 @@ class StringValidator(Validator[T]):
         min : (int)
                 the minimun length allowed
 
-        Raises
-        ----------
-        ValidationError:
-                if the value length is smaller than the min
-
         Returns
         ________
-        validator (StringValidator):
-                the validator being used
+        error (Optional[ValidationError]):
+                a validation error if the value length is smaller than the min
         """
 
         if len(value) < min:
-            raise ValidationError(self.name, "Value too short received")
+            return ValidationError(self.name, "Value too short received")
 
     @validator_method
-    def max(self, max: int, value: T) -> None:
+    def max(self, max: int, value: T) -> ValidationError | None:
         """
         Verify if the length of the received value is equal
         or lower than the max
@@ -98,19 +287,37 @@ class StringValidator(Validator[T]):
         max : (int)
                 the maximun length allowed
 
-        Raises
-        ----------
-        ValidationError:
-                if the value length is larger than the max
-
         Returns
         ________
-        validator (StringValidator):
-                the validator being used
+        error (Optional[ValidationError]):
+                a validation error if the value length is larger than the max
         """
 
         if len(value) > max:
-            raise ValidationError(self.name, "Value too long received")
+            return ValidationError(self.name, "Value too long received")
+
+    def safe_coerce(self, value: Any) -> Tuple[T, ValidationError | None]:
+        """
+        Converts the received value to a string
+
+        Parameters
+        ----------
+        value : (Any)
+            the value that will be converted
+
+        Returns
+        ----------
+        result (Tuple[str, Optional[ValidationError]]):
+            the converted value and a validation error
+            if the value is None
+        """
+
+        if value is None:
+            return value, ValidationError(
+                self.name, "Non-string value received in a string input"
+            )
+
+        return cast(T, str(value)), None
 
     def verify(self) -> T | None:
         """
@@ -123,21 +330,4 @@ class StringValidator(Validator[T]):
         result (str): The value returned by the input verify method
         """
 
-        result = self.get_input_item_value()
-
-        if result is not None:
-            result = cast(T, str(result))
-        else:
-            raise ValidationError(
-                self.name, "Non-string value received in a string input"
-            )
-
-        if self.input_item is None:
-            raise AttributeError(
-                "It's not possible to use validation on a Validator "
-                "without an input item."
-            )
-
-        result = self.input_item.verify(result)
-
-        return result
+        return self.validate(self.get_input_item_value())
@@ -1,8 +1,34 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Generic, TypeVar
+import asyncio
+from contextvars import ContextVar
+from time import perf_counter
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    Self,
+    Tuple,
+    TypeVar,
+)
 from collections.abc import Iterable
 from PyYep.exceptions import ValidationError
-from PyYep.utils.decorators import validator_method
+from PyYep.profiler import PROFILER
+from PyYep.result import ValidationResult
+from PyYep.utils.cache import CacheInfo, ResultCache
+from PyYep.utils.compiler import compile_validator
+from PyYep.utils.decorators import convert_arguments, validator_method
+from PyYep.utils.limits import MAX_ERRORS
+from PyYep.utils.membership import build_lookup
+from PyYep.utils.ndjson import iter_ndjson
+from PyYep.spec import (
+    allow_references,
+    validator_from_spec,
+    validator_to_spec,
+)
 
 
 if TYPE_CHECKING:
@@ -11,6 +37,12 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# the validator whose overridden verify is running and the value it
+# received, read by get_input_item_value instead of the data container
+VERIFYING: ContextVar[Tuple[Any, Any] | None] = ContextVar(
+    "verifying", default=None
+)
+
 
 class Validator(Generic[T]):
     """
@@ -27,6 +59,9 @@ class Validator(Generic[T]):
 
     Methods
     -------
+    max_errors(limit):
+            Limit the number of errors collected by the validation
+
     set_schema(form):
             Set the parent schema
 
@@ -41,8 +76,83 @@ class Validator(Generic[T]):
 
     in_(data_structure, value):
             verifies the presence of a value into a data structure
+
+    safe_coerce(value):
+            Converts the received value to the validator's type and return
+            the error instead of raising
+
+    coerce(value):
+            Converts the received value to the validator's type
+
+    validate(value):
+            Validate the received value without using the data container
+
+    run(value):
+            Validate the received value and return the error, if any,
+            instead of raising
+
+    run_async(value, limiter):
+            Validate the received value, awaiting the coroutine validators,
+            and return the error, if any, instead of raising
+
+    is_async():
+            Verify if the validator uses coroutine validators
+
+    describe():
+            Return a description of the validator and its checks
+
+    to_spec():
+            Convert the validator into a declarative spec
+
+    from_spec(spec):
+            Build a validator from a declarative spec
+
+    safe_verify(data):
+            Validate the input value and return a result object
+
+    verify_async(data, concurrency):
+            Validate the input value, awaiting the coroutine validators
+
+    compile():
+            Compiles the validator into a specialized function
+
+    validate_ndjson(file, chunk_size):
+            Validate each line of a NDJSON file lazily
+
+    cached(maxsize):
+            Cache the outcomes of the validation of repeated values
+
+    cache_info():
+            Return the statistics of the cache
+
+    clear_cache():
+            Discard the cached outcomes
+
+    reorder(warmup):
+            Mark the checks as order-independent and run the cheaper ones
+            first
     """
 
+    __slots__ = ("input_item", "name", "_cache", "_max_errors")
+
+    # set on the subclasses overriding verify, run by _run_verify
+    _overrides_verify = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # the subclasses written for the verify API override verify, which
+        # coerces and checks the value, so they are run through it, the
+        # verify of the built-in validators only wraps validate
+        if "verify" in cls.__dict__ and not cls.__module__.startswith(
+            "PyYep."
+        ):
+            if not cls._overrides_verify:
+                cls._run_checks = cls._run
+
+            cls._run = Validator._run_verify
+            cls._overrides_verify = True
+
     def __init__(self, input_item: InputItem[T] | None = None) -> None:
         """
         Constructs all the necessary attributes for the base validator object.
@@ -54,6 +164,8 @@ class Validator(Generic[T]):
 
         self.input_item = None
         self.name = ""
+        self._cache = None
+        self._max_errors: int | None = None
 
         if input_item is not None:
             self.input_item = input_item
@@ -80,6 +192,11 @@ class Validator(Generic[T]):
         T
         """
 
+        verifying = VERIFYING.get()
+
+        if verifying is not None and verifying[0] is self:
+            return verifying[1]
+
         if self.input_item is None:
             raise AttributeError(
                 "It's not possible to use validation on a Validator "
@@ -116,7 +233,7 @@ class Validator(Generic[T]):
         self.input_item.set_schema(form)
 
     @validator_method
-    def required(self, value: T) -> None:
+    def required(self, value: T) -> ValidationError | None:
         """
         Verify if the received value is empty
 
@@ -125,26 +242,27 @@ class Validator(Generic[T]):
         value : (T)
                 the value that will be checked
 
-        Raises
-        ----------
-        ValidationError:
-                if the value is empty or None
-
         Returns
         ________
-        validator (Validator):
-                the validator being used
+        error (Optional[ValidationError]):
+                a validation error if the value is empty or None
         """
 
         if value is None or (not value and value != 0):
-            raise ValidationError(
+            return ValidationError(
                 self.name, "Empty value passed to a required input"
             )
 
+    @convert_arguments(build_lookup)
     @validator_method
-    def in_(self, data_structure: Iterable, value: "T") -> None:
+    def in_(
+        self, data_structure: Iterable, value: "T"
+    ) -> ValidationError | None:
         """
-        Verify if the received value is present in the received data structure
+        Verify if the received value is present in the received data
+        structure. Lists, tuples and iterators are converted once into a
+        lookup, a frozenset when their items are hashable, so the check
+        doesn't scan them on every validation
 
         Parameters
         ----------
@@ -153,21 +271,526 @@ class Validator(Generic[T]):
         data_structure : (Iterable)
                 a iterable in wich the received value is supposed to be present
 
+        Returns
+        ________
+        error (Optional[ValidationError]):
+                a validation error if the value is not present in the data
+                structure
+        """
+
+        if value not in data_structure:
+            return ValidationError(
+                self.name, "Value not present in the received data structure"
+            )
+
+    def safe_coerce(self, value: Any) -> Tuple[T, ValidationError | None]:
+        """
+        Converts the received value to the validator's type without raising
+
+        Parameters
+        ----------
+        value : (Any)
+                the value that will be converted
+
+        Returns
+        ________
+        result (Tuple[T, Optional[ValidationError]]):
+                the converted value and a validation error if the value
+                can't be converted
+        """
+
+        raise NotImplementedError
+
+    def coerce(self, value: Any) -> T:
+        """
+        Converts the received value to the validator's type
+
+        Parameters
+        ----------
+        value : (Any)
+                the value that will be converted
+
         Raises
         ----------
         ValidationError:
-                if the value is not present in the data structure
+                if the value can't be converted
 
         Returns
         ________
-        validator (Validator):
-                the validator being used
+        result (T): the converted value
         """
 
-        if value not in data_structure:
-            raise ValidationError(
-                self.name, "Value not present in the received data structure"
+        result, error = self.safe_coerce(value)
+
+        if error is not None:
+            raise error
+
+        return result
+
+    def compile(self) -> Callable[[Any], T]:
+        """
+        Compiles the validator, including nested validators, into a single
+        specialized function that receives the value to be validated and
+        return the validated value. Changes made to the validator after the
+        compilation are not reflected on the compiled function
+
+        Returns
+        ________
+        function (Callable[[Any], T]): the compiled validation function
+        """
+
+        return compile_validator(self)
+
+    def max_errors(self, limit: int | None) -> Self:
+        """
+        Limit the number of errors collected when the validator is
+        executed, the items of nested arrays and dicts are not validated
+        after the limit is reached. Validators nested in a schema
+        aborting early or with max_errors use the limit of the schema,
+        unless they set their own
+
+        Parameters
+        ----------
+        limit : (Optional[int])
+                the maximum number of errors, 1 stops at the first error
+                and None collects all the errors
+
+        Raises
+        ________
+        ValueError: if the limit is lower than 1
+
+        Returns
+        ________
+        self (Validator): the validator itself
+        """
+
+        if limit is not None and limit < 1:
+            raise ValueError("The limit of errors must be at least 1")
+
+        self._max_errors = limit
+        return self
+
+    def cached(self, maxsize: int = 1024) -> Self:
+        """
+        Cache the outcomes of the validation, keyed by the validated
+        values, so repeated values skip the validation. The outcomes,
+        including the failures, are stored and returned as copies, the
+        hooks are not called when an outcome is reused. The values are
+        compared by their pickled form, so equal values of different
+        types or dicts with a different key order don't share an outcome,
+        and values that can't be pickled are always validated
+
+        Parameters
+        ----------
+        maxsize : (int)
+                the maximum number of outcomes stored, the least recently
+                used outcome is discarded when the limit is reached
+
+        Returns
+        ________
+        self (Validator): the validator itself
+        """
+
+        self._cache = ResultCache(maxsize)
+        return self
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Return the statistics of the cache
+
+        Returns
+        ________
+        info (Optional[CacheInfo]): the hits, misses, maximum size and
+        current size of the cache, or None if the cache is not enabled
+        """
+
+        if self._cache is None:
+            return None
+
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """
+        Discard the cached outcomes and reset the statistics of the cache
+        """
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def reorder(self, warmup: int = 1000) -> Self:
+        """
+        Mark the checks as order-independent, so the cheaper checks and
+        the ones that fail more often are executed first, sorted by
+        static cost hints and then by the costs and failures observed in
+        a warm-up window. Only the error of the first failing check is
+        reported, so the error of a value failing several checks may
+        change with the order
+
+        Parameters
+        ----------
+        warmup : (int)
+                the number of validations measured before the observed
+                order is used, 0 keeps the static order
+
+        Raises
+        ________
+        ValueError: if the warm-up window is negative
+        AttributeError: if the validator has no input item, like the
+        validators without checks
+
+        Returns
+        ________
+        self (Validator): the validator itself
+        """
+
+        if self.input_item is None:
+            raise AttributeError(
+                "It's not possible to use validation on a Validator "
+                "without an input item."
             )
 
+        self.input_item.reorder(warmup)
+        return self
+
+    def validate_ndjson(
+        self, file: IO[str] | IO[bytes], chunk_size: int = 1000
+    ) -> Iterator[Tuple[int, ValidationResult[T]]]:
+        """
+        Validate each line of a NDJSON (JSON Lines) file object. The lines
+        are read in chunks and the results are yielded lazily, so the
+        memory used doesn't grow with the size of the file. Blank lines
+        are skipped and lines that are not valid JSON are reported as
+        validation errors. Once a full chunk is read the validator is
+        compiled, unless the profiler is active, the validator is cached
+        or an input item observes the order of its checks
+
+        Parameters
+        ----------
+        file : (IO)
+                the file object, opened in text or binary mode
+        chunk_size : (int)
+                the number of lines read from the file at a time
+
+        Returns
+        ________
+        results (Iterator[Tuple[int, ValidationResult[T]]]):
+                the line number, starting at 1, and the validation
+                result of each line
+        """
+
+        return iter_ndjson(self, file, chunk_size)
+
+    def validate(self, value: Any) -> T:
+        """
+        Validate the received value. Unlike the verify method the value
+        is received as an argument and the data container of the input
+        is neither read or changed, so a validator can be built once and
+        used concurrently
+
+        Parameters
+        ----------
+        value : (Any)
+                the value that will be validated
+
+        Raises
+        ----------
+        ValidationError:
+                if any error happens during the validation process
+
+        Returns
+        ________
+        result (T): the validated value
+        """
+
+        result, error = self.run(value)
+
+        if error is not None:
+            raise error
+
+        return result
+
+    def run(self, value: Any) -> Tuple[T | None, ValidationError | None]:
+        """
+        Validate the received value without raising, the data container
+        of the input is neither read or changed
+
+        Parameters
+        ----------
+        value : (Any)
+                the value that will be validated
+
+        Returns
+        ________
+        result (Tuple[Optional[T], Optional[ValidationError]]):
+                the validated value and the validation error, if any
+        """
+
+        if self._max_errors is not None:
+            return self._run_limited(value)
+
+        if self._cache is not None:
+            return self._cache.lookup(value, self._run, MAX_ERRORS.get())
+
+        return self._run(value)
+
+    def _run_limited(
+        self, value: Any
+    ) -> Tuple[T | None, ValidationError | None]:
+        token = MAX_ERRORS.set(self._max_errors)
+
+        try:
+            if self._cache is not None:
+                return self._cache.lookup(value, self._run, self._max_errors)
+
+            return self._run(value)
+        finally:
+            MAX_ERRORS.reset(token)
+
+    def _run(self, value: Any) -> Tuple[T | None, ValidationError | None]:
+        if PROFILER.active and self.input_item is not None:
+            start = perf_counter()
+            result, error = self.safe_coerce(value)
+            PROFILER.record(
+                self.input_item,
+                f"{type(self).__name__}.safe_coerce",
+                perf_counter() - start,
+                error is not None,
+            )
+        else:
+            result, error = self.safe_coerce(value)
+
+        if error is not None:
+            return result, error
+
+        if self.input_item is None:
+            raise AttributeError(
+                "It's not possible to use validation on a Validator "
+                "without an input item."
+            )
+
+        return self.input_item.run(result)
+
+    def _run_verify(
+        self, value: Any
+    ) -> Tuple[T | None, ValidationError | None]:
+        verifying = VERIFYING.get()
+
+        # the verify of a built-in base validator validates the value
+        # again, so the checks are run instead of verify
+        if verifying is not None and verifying[0] is self:
+            return self._run_checks(value)
+
+        # verify reads the value through get_input_item_value, so the
+        # value is passed in a context variable, leaving the input item
+        # untouched for the other threads
+        token = VERIFYING.set((self, value))
+
+        try:
+            return self.verify(), None
+        except ValidationError as error:
+            return value, error
+        finally:
+            VERIFYING.reset(token)
+
+    async def run_async(
+        self, value: Any, limiter: asyncio.Semaphore | None = None
+    ) -> Tuple[T | None, ValidationError | None]:
+        """
+        Validate the received value without raising, awaiting the
+        coroutine validators. Validators without coroutine validators
+        are executed synchronously
+
+        Parameters
+        ----------
+        value : (Any)
+                the value that will be validated
+        limiter : (asyncio.Semaphore, optional)
+                a semaphore limiting the number of coroutine validators
+                awaited at the same time
+
+        Returns
+        ________
+        result (Tuple[Optional[T], Optional[ValidationError]]):
+                the validated value and the validation error, if any
+        """
+
+        if not self.is_async():
+            return self.run(value)
+
+        result, error = self.safe_coerce(value)
+
+        if error is not None:
+            return result, error
+
+        if self._max_errors is None:
+            return await self.input_item.run_async(result, limiter)
+
+        # the tasks created by the nested validators inherit the limit
+        token = MAX_ERRORS.set(self._max_errors)
+
+        try:
+            return await self.input_item.run_async(result, limiter)
+        finally:
+            MAX_ERRORS.reset(token)
+
+    def is_async(self) -> bool:
+        """
+        Verify if the validator, or any of its nested validators, uses
+        coroutine validators
+
+        Returns
+        ________
+        result (bool): if the validator must be executed asynchronously
+        """
+
+        return self.input_item is not None and self.input_item.is_async()
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Return a description of the validator and its checks, in order,
+        nested validators are described within the arguments of the
+        checks receiving them
+
+        Returns
+        ________
+        description (Dict[str, Any]): the type and name of the validator,
+        and the name, arguments and presence of a condition of each check
+        """
+
+        checks = []
+
+        if self.input_item is not None:
+            checks = self.input_item.describe()["checks"]
+
+        return {
+            "type": type(self).__name__,
+            "name": self.name,
+            "checks": checks,
+        }
+
+    def to_spec(self) -> Dict[str, Any]:
+        """
+        Convert the validator, including nested validators, into a
+        declarative spec made of JSON types
+
+        Raises
+        ________
+        TypeError: if a check argument, a condition or a hook can't be
+        stored in the spec, like lambdas and nested functions
+
+        Returns
+        ________
+        spec (Dict[str, Any]): the spec of the validator
+        """
+
+        return validator_to_spec(self)
+
+    @classmethod
+    def from_spec(
+        cls, spec: Dict[str, Any], allowed: Iterable[str] | None = None
+    ) -> Self:
+        """
+        Build a validator from a declarative spec, the type of the
+        validator is read from the spec
+
+        Parameters
+        ----------
+        spec : (Dict[str, Any])
+                the spec returned by the to_spec method
+        allowed : (Optional[Iterable[str]])
+                the modules and "module:name" references the spec can
+                use. If not passed any module level function can be
+                imported and called, so the spec must be trusted
+
+        Raises
+        ________
+        ValueError: if the spec has an unknown type, check or argument, a
+        reference that is not allowed, or if the type is not the class
+        the method was called on or one of its subclasses
+
+        Returns
+        ________
+        validator (Validator): the validator built
+        """
+
+        with allow_references(allowed):
+            validator = validator_from_spec(spec)
+
+        if not isinstance(validator, cls):
+            raise ValueError(
+                f"The spec describes a {type(validator).__name__}, not a "
+                f"{cls.__name__}"
+            )
+
+        return validator
+
+    def safe_verify(self, data: Any = None) -> ValidationResult[T]:
+        """
+        Validate the input value without raising, the errors are reported
+        through the returned result
+
+        Parameters
+        ----------
+        data : (Any, optional)
+                the value that will be validated, if not passed the value
+                of the input's data container is used
+
+        Returns
+        ________
+        result (ValidationResult[T]): the validation result, containing
+        the validated value or the errors found
+        """
+
+        if data is None:
+            data = self.get_input_item_value()
+
+        result, error = self.run(data)
+
+        if error is not None:
+            return ValidationResult(None, error.inner or [error])
+
+        return ValidationResult(result, [])
+
+    async def verify_async(
+        self, data: Any = None, concurrency: int | None = None
+    ) -> T:
+        """
+        Validate the input value, awaiting the coroutine validators. The
+        items of nested array and dict validators are awaited concurrently
+
+        Parameters
+        ----------
+        data : (Any, optional)
+                the value that will be validated, if not passed the value
+                of the input's data container is used
+        concurrency : (int, optional)
+                the maximum number of coroutine validators awaited at
+                the same time
+
+        Raises
+        ----------
+        ValidationError:
+                if any error happens during the validation process
+
+        Returns
+        ________
+        result (T): the validated value
+        """
+
+        if data is None:
+            data = self.get_input_item_value()
+
+        limiter = None
+
+        if concurrency is not None:
+            limiter = asyncio.Semaphore(concurrency)
+
+        result, error = await self.run_async(data, limiter)
+
+        if error is not None:
+            raise error
+
+        return result
+
     def verify(self) -> T:
         raise NotImplementedError
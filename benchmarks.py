@@ -0,0 +1,431 @@
+"""
+Benchmarks of the validation hot paths.
+
+Each benchmark builds its schema and data once and then times individual
+calls for a fixed duration, reporting the throughput and the percentiles
+of the latency of the calls. The results can be saved and compared with
+a previous run to catch performance regressions between releases. The
+memory benchmarks report the bytes kept alive by each schema and error.
+
+Usage:
+    python benchmarks.py
+    python benchmarks.py -k array --duration 2
+    python benchmarks.py --save baseline.json
+    python benchmarks.py --compare baseline.json --tolerance 0.15
+    python benchmarks.py --memory
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+from PyYep import Schema, InputItem, ValidationError
+from PyYep.validators.string import StringValidator
+from PyYep.validators.numeric import NumericValidator
+from PyYep.validators.array import ArrayValidator
+from PyYep.validators.dict import DictValidator
+from PyYep.locale.pt_BR import DocumentsValidators
+
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+MEMORY_BENCHMARKS: Dict[str, Callable[[], Tuple[Callable[[], object], int]]]
+MEMORY_BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """Registers a function that builds the callable that will be timed"""
+
+    def register(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def memory_benchmark(name: str):
+    """
+    Registers a function that builds the callable whose result is
+    measured, and the number of objects in each result
+    """
+
+    def register(setup: Callable[[], Tuple[Callable[[], object], int]]):
+        MEMORY_BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def flat_inputs(size: int) -> List[InputItem]:
+    inputs = []
+
+    for index in range(size):
+        kind = index % 3
+        item = InputItem(f"field{index}", None, "")
+
+        if kind == 0:
+            inputs.append(item.string().min(1).max(50))
+        elif kind == 1:
+            inputs.append(item.number().min(0).max(1000))
+        else:
+            inputs.append(item.string().email())
+
+    return inputs
+
+
+def flat_data(size: int) -> Dict[str, object]:
+    values = ["value", 10, "test@test.com"]
+
+    return {f"field{index}": values[index % 3] for index in range(size)}
+
+
+@benchmark("schema_flat")
+def schema_flat():
+    schema = Schema(flat_inputs(10))
+    data = flat_data(10)
+
+    return lambda: schema.validate(data)
+
+
+@benchmark("schema_flat_compiled")
+def schema_flat_compiled():
+    compiled = Schema(flat_inputs(10)).compile()
+    data = flat_data(10)
+
+    return lambda: compiled(data)
+
+
+@benchmark("schema_wide")
+def schema_wide():
+    schema = Schema(flat_inputs(300))
+    data = flat_data(300)
+
+    return lambda: schema.validate(data)
+
+
+@benchmark("shape_nested")
+def shape_nested():
+    validator = StringValidator().required()
+    value = "leaf"
+
+    for depth in range(10):
+        validator = DictValidator().shape(
+            {"child": validator, "id": NumericValidator().min(0)}
+        )
+        value = {"child": value, "id": depth}
+
+    return lambda: validator.validate(value)
+
+
+@benchmark("array_of_dicts")
+def array_of_dicts():
+    validator = ArrayValidator().of(
+        DictValidator().shape(
+            {
+                "name": StringValidator().min(1),
+                "score": NumericValidator().min(0).max(100),
+            }
+        )
+    )
+    value = [{"name": "item", "score": index % 100} for index in range(1000)]
+
+    return lambda: validator.validate(value)
+
+
+@benchmark("table_columns")
+def table_columns():
+    validator = DictValidator().columns(
+        {
+            "name": StringValidator().min(1),
+            "score": NumericValidator().min(0).max(100),
+        }
+    )
+    value = {
+        "name": ["item"] * 1000,
+        "score": [index % 100 for index in range(1000)],
+    }
+
+    return lambda: validator.validate(value)
+
+
+@benchmark("array_of_numbers")
+def array_of_numbers():
+    validator = ArrayValidator().of(NumericValidator().min(0).max(1e6))
+    value = [float(index) for index in range(100_000)]
+
+    return lambda: validator.validate(value)
+
+
+@benchmark("array_of_strings")
+def array_of_strings():
+    validator = ArrayValidator().of(StringValidator().min(1).max(20))
+    value = [f"item{index}" for index in range(10_000)]
+
+    return lambda: validator.validate(value)
+
+
+@benchmark("reordered_checks")
+def reordered_checks():
+    validator = StringValidator().email().max(16).reorder(0)
+    values = [f"user{index}@example.com" for index in range(1_000)]
+
+    def validate():
+        for value in values:
+            validator.run(value)
+
+    return validate
+
+
+@benchmark("coercion_string")
+def coercion_string():
+    validator = StringValidator().required()
+
+    return lambda: validator.validate(12345)
+
+
+@benchmark("coercion_numeric")
+def coercion_numeric():
+    validator = NumericValidator().min(0)
+
+    return lambda: validator.validate("12345.5")
+
+
+@benchmark("errors_not_aborting")
+def errors_not_aborting():
+    schema = Schema(flat_inputs(60), abort_early=False)
+    data = {f"field{index}": None for index in range(60)}
+
+    def validate():
+        try:
+            schema.validate(data)
+        except ValidationError:
+            pass
+
+    return validate
+
+
+@benchmark("pt_BR_cpf")
+def pt_br_cpf():
+    documents = DocumentsValidators()
+
+    return lambda: documents.cpf("875.920.020-00")
+
+
+@benchmark("pt_BR_cnpj")
+def pt_br_cnpj():
+    documents = DocumentsValidators()
+
+    return lambda: documents.cnpj("88.724.415/0001-59")
+
+
+@benchmark("pt_BR_cpf_many")
+def pt_br_cpf_many():
+    documents = DocumentsValidators()
+    values = ["875.920.020-00", "875.920.020-01"] * 5000
+
+    return lambda: documents.cpf_many(values)
+
+
+@memory_benchmark("schema_resident")
+def schema_resident():
+    return lambda: Schema(flat_inputs(30)), 1
+
+
+@memory_benchmark("error_resident")
+def error_resident():
+    schema = Schema(flat_inputs(60), abort_early=False)
+    data = {f"field{index}": None for index in range(60)}
+
+    def errors():
+        try:
+            schema.validate(data)
+        except ValidationError as error:
+            return error
+
+    return errors, 61
+
+
+def measure(call: Callable[[], object], duration: float) -> Dict[str, float]:
+    """
+    Time individual calls for the given duration, after a warm up
+
+    Parameters
+    ----------
+    call : Callable[[], object]
+            the callable that will be timed
+    duration : float
+            the number of seconds spent timing the calls
+
+    Returns
+    -------
+    result (Dict[str, float]): the number of calls per second and the
+    percentiles of the latency, in microseconds
+    """
+
+    warm_up = perf_counter() + duration / 10
+
+    while perf_counter() < warm_up:
+        call()
+
+    samples = []
+    end = perf_counter() + duration
+
+    while True:
+        start = perf_counter()
+        call()
+        stop = perf_counter()
+        samples.append(stop - start)
+
+        # at least two samples are needed by the percentiles
+        if stop >= end and len(samples) > 1:
+            break
+
+    percentiles = statistics.quantiles(samples, n=100)
+
+    return {
+        "ops": len(samples) / sum(samples),
+        "p50": percentiles[49] * 1e6,
+        "p95": percentiles[94] * 1e6,
+        "p99": percentiles[98] * 1e6,
+        "calls": len(samples),
+    }
+
+
+def measure_memory(
+    call: Callable[[], object], objects: int, repeat: int = 100
+) -> float:
+    """
+    Measure the memory kept alive by the results of the callable
+
+    Parameters
+    ----------
+    call : Callable[[], object]
+            the callable whose results are kept
+    objects : int
+            the number of objects in each result
+    repeat : int
+            the number of results kept
+
+    Returns
+    -------
+    result (float): the number of bytes per object
+    """
+
+    call()
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results = [call() for _ in range(repeat)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del results
+
+    return (after - before) / (repeat * objects)
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        expected = baseline[name]["ops"]
+
+        if result["ops"] < expected * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['ops']:.1f} ops/s, "
+                f"{1 - result['ops'] / expected:.1%} slower than the "
+                f"baseline {expected:.1f} ops/s"
+            )
+
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "-k",
+        dest="filter",
+        default="",
+        help="only run the benchmarks containing the given text",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=1.0,
+        help="the seconds spent timing each benchmark",
+    )
+    parser.add_argument("--save", help="save the results to a json file")
+    parser.add_argument(
+        "--compare", help="compare the results with a saved json file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="the allowed throughput loss when comparing, 0.1 is 10%%",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="run the memory benchmarks instead",
+    )
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        print(f"{'benchmark':<24}{'bytes/object':>14}")
+
+        for name, setup in MEMORY_BENCHMARKS.items():
+            if args.filter in name:
+                print(f"{name:<24}{measure_memory(*setup()):>14,.1f}")
+
+        return 0
+
+    results = {}
+    print(
+        f"{'benchmark':<24}{'ops/s':>14}{'p50 us':>12}"
+        f"{'p95 us':>12}{'p99 us':>12}"
+    )
+
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+
+        result = measure(setup(), args.duration)
+        results[name] = result
+        print(
+            f"{name:<24}{result['ops']:>14,.1f}{result['p50']:>12,.2f}"
+            f"{result['p95']:>12,.2f}{result['p99']:>12,.2f}"
+        )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
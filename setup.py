@@ -17,6 +17,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     packages=["PyYep"],
     python_requires=">=3.11",
+    extras_require={"numpy": ["numpy"]},
     url="https://github.com/danielmbomfim/PyYep",
     project_urls={
         "Bug Tracker": "https://github.com/danielmbomfim/PyYep/issues",
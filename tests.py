@@ -1,12 +1,35 @@
+import asyncio
+import codecs
+import hashlib
+import io
+import json
+import os
+import pickle
+import re
+import tempfile
 import unittest
-from unittest.mock import Mock
-from PyYep import Schema, InputItem, ValidationError
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import Mock, patch
+from PyYep import Schema, InputItem, ValidationError, ValidationResult
 from PyYep.validators.bool import BooleanValidator
 from PyYep.validators.string import StringValidator
 from PyYep.validators.numeric import NumericValidator
-from PyYep.validators.array import ArrayValidator
+from PyYep.validators.array import POOLS, ArrayValidator
 from PyYep.validators.dict import DictValidator
+from PyYep.validators.validator import Validator
 from PyYep.locale.pt_BR import DocumentsValidators as DocumentsValidator_pt_BR
+from PyYep.profiler import profile
+from PyYep.utils.membership import MembershipLookup
+from PyYep.spec import from_spec, load_spec, to_spec
+from PyYep.utils.decorators import validator_method
+from PyYep.utils.csvfile import count_lines, plan_csv_shards
+from PyYep.utils.vectorize import find_out_of_bounds
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 class TestInputItem(unittest.TestCase):
@@ -200,6 +223,69 @@ class TestStringValidator(unittest.TestCase):
         with self.assertRaises(ValidationError):
             form.validate()
 
+    def test_formats(self):
+        cases = [
+            (StringValidator().matches(r"[a-z]+\d"), ["abc1"], ["abc", "1a"]),
+            (
+                StringValidator().uuid(),
+                ["123e4567-E89B-12d3-a456-426614174000"],
+                ["123e4567e89b12d3a456426614174000", "not-a-uuid"],
+            ),
+            (
+                StringValidator().url(),
+                ["https://example.com/a?b=1", "http://localhost:8000"],
+                ["example.com", "ftp://example.com", "http://a b.com"],
+            ),
+            (
+                StringValidator().url(schemes=("ftp",)),
+                ["ftp://example.com"],
+                ["https://example.com", "ftp://example.com:99999"],
+            ),
+            (
+                StringValidator().ipv4(),
+                ["192.168.0.1"],
+                ["256.1.1.1", "192.168.0", "::1"],
+            ),
+            (
+                StringValidator().ipv6(),
+                ["::1", "2001:db8::8a2e:370:7334"],
+                ["1", "192.168.0.1"],
+            ),
+            (
+                StringValidator().iso_date(),
+                ["2024-02-29"],
+                ["2023-02-29", "20240101", "2024-1-01"],
+            ),
+        ]
+
+        for validator, valid, invalid in cases:
+            compiled = validator.compile()
+
+            for value in valid:
+                self.assertEqual(validator.validate(value), value)
+                self.assertEqual(compiled(value), value)
+
+            for value in invalid:
+                with self.assertRaises(ValidationError):
+                    validator.validate(value)
+
+                with self.assertRaises(ValidationError):
+                    compiled(value)
+
+    def test_matches_compiled_once(self):
+        with patch("re.compile", wraps=re.compile) as compile:
+            validator = StringValidator().matches(r"[a-z]+\d{3}")
+
+            for value in ["abc123", "xy999"]:
+                validator.validate(value)
+
+        compile.assert_called_once()
+        [check] = validator.input_item._validators
+        self.assertIsInstance(check.args[0], re.Pattern)
+        self.assertEqual(
+            validator.describe()["checks"][0]["args"], [r"[a-z]+\d{3}"]
+        )
+
 
 class TestNumberValidator(unittest.TestCase):
     def test_min_and_max(self):
@@ -286,6 +372,37 @@ class TestDocumentValidator_pt_BR(unittest.TestCase):
         with self.assertRaises(ValidationError):
             form.validate()
 
+    def test_cpf_many(self):
+        values = [
+            "875.920.020-00",
+            "875.920.020-01",
+            "875.920.020",
+            "111.111.111-11",
+            None,
+            "875.920.020-00",
+        ]
+
+        self.assertEqual(
+            DocumentsValidator_pt_BR().cpf_many(values),
+            [False, True, True, True, True, False],
+        )
+
+    def test_cnpj_many(self):
+        values = [
+            "88.724.415/0001-59",
+            "88.724.415/0001-58",
+            "88.724.415+0001-58",
+            "88.888.888/8888-88",
+            "10.000.000/6540-67",
+            "10.000.000/3081-96",
+            "88x724x415/0001-59",
+        ]
+
+        self.assertEqual(
+            DocumentsValidator_pt_BR().cnpj_many(values),
+            [False, True, True, True, True, True, False],
+        )
+
 
 class TestArrayValidator(unittest.TestCase):
     def test_type_validation(self):
@@ -314,6 +431,60 @@ class TestArrayValidator(unittest.TestCase):
         with self.assertRaises(ValidationError):
             form.validate()
 
+    def test_of_workers(self):
+        values = [str(value) for value in range(95)] + ["a", "b"]
+        schema = ArrayValidator().of(
+            NumericValidator().max(90), workers=4, chunk_size=10
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            DictValidator().shape({"values": schema}).validate(
+                {"values": list(values)}
+            )
+
+        self.assertEqual(
+            [e.path for e in context.exception.inner],
+            [f"values[{index}]" for index in range(91, 97)],
+        )
+
+        result = schema.validate(values[:90])
+        self.assertEqual(result, [float(value) for value in range(90)])
+        self.assertEqual(
+            schema.validate(tuple(values[:50])), tuple(values[:50])
+        )
+
+        # the pool options are keyword-only
+        with self.assertRaises(TypeError):
+            ArrayValidator().of(NumericValidator(), 4).validate([1])
+
+    def test_of_shared_pool(self):
+        release = Event()
+        calls = []
+
+        def check(value):
+            calls.append(value)
+
+            if value == 0:
+                raise ValidationError("", "Zero received")
+
+            release.wait(5)
+
+        item = NumericValidator(InputItem("", None, ""))
+        item.input_item.validate(check)
+        validator = ArrayValidator().of(item, workers=1, chunk_size=2)
+
+        with self.assertRaises(ValidationError):
+            validator.max_errors(1).validate([0, 0] + [1] * 18)
+
+        # the chunks waiting for the worker are cancelled by the limit
+        release.set()
+        pool = POOLS[("thread", 1)]
+        pool.submit(int).result()
+        self.assertLessEqual(len(calls), 4)
+
+        self.assertEqual(validator.validate([1] * 6), [1] * 6)
+        self.assertIs(POOLS[("thread", 1)], pool)
+
     def test_length(self):
         input_ = DummyInput([1])
         form = Schema([InputItem("test", input_, "get_value").array().len(1)])
@@ -357,6 +528,89 @@ class TestArrayValidator(unittest.TestCase):
         with self.assertRaises(ValidationError):
             form.validate()
 
+    def test_of_numeric_bounds_in_bulk(self):
+        item = NumericValidator().min(0).max(10).required()
+        validator = DictValidator().shape(
+            {"values": ArrayValidator().of(item)}
+        )
+        values = [1, 2.5, -1, 10, 11, 3]
+
+        with patch.object(
+            NumericValidator,
+            "run",
+            autospec=True,
+            side_effect=NumericValidator.run,
+        ) as run:
+            with self.assertRaises(ValidationError) as context:
+                validator.verify({"values": values})
+
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(
+            [(e.path, str(e)) for e in context.exception.inner],
+            [
+                ("values[2]", "Value too small received"),
+                ("values[4]", "Value too large received"),
+            ],
+        )
+
+        # sequences that are not homogeneous are validated item by item
+        with self.assertRaises(ValidationError) as fallback:
+            validator.verify({"values": [*values, "5"]})
+
+        self.assertEqual(
+            [e.path for e in fallback.exception.inner],
+            [e.path for e in context.exception.inner],
+        )
+        self.assertEqual(
+            validator.verify({"values": (0, 10.0)}), {"values": (0, 10.0)}
+        )
+
+    @unittest.skipUnless(numpy, "NumPy is not installed")
+    def test_of_numpy_bounds_in_bulk(self):
+        validator = ArrayValidator().of(NumericValidator().min(0).max(10))
+        values = numpy.array([1.0, 12.5, -1.0, 10.0])
+
+        self.assertEqual(find_out_of_bounds(values, 0, 10), [1, 2])
+        self.assertEqual(find_out_of_bounds(values, None, None), [])
+        self.assertIsNone(find_out_of_bounds(values.reshape(2, 2), 0, 10))
+        self.assertIsNone(find_out_of_bounds(numpy.array(["1"]), 0, 10))
+
+        with patch.object(
+            NumericValidator,
+            "run",
+            autospec=True,
+            side_effect=NumericValidator.run,
+        ) as run:
+            valid = numpy.arange(11)
+            self.assertIs(validator.validate(valid), valid)
+
+            with self.assertRaises(ValidationError) as context:
+                validator.validate(values)
+
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(
+            [(e.path, str(e)) for e in context.exception.inner],
+            [
+                ("[1]", "Value too large received"),
+                ("[2]", "Value too small received"),
+            ],
+        )
+
+        # string arrays are validated item by item, their items can't
+        # hold the coerced floats, so they are kept
+        strings = numpy.array(["1", "20", "3"])
+
+        with self.assertRaises(ValidationError) as context:
+            validator.validate(strings)
+
+        self.assertEqual([e.path for e in context.exception.inner], ["[1]"])
+
+        strings = numpy.array(["1", "2"])
+        self.assertEqual(validator.validate(strings).tolist(), ["1", "2"])
+
+        objects = numpy.array(["1", "2"], dtype=object)
+        self.assertEqual(validator.validate(objects).tolist(), [1.0, 2.0])
+
 
 class TestDictValidator(unittest.TestCase):
     def test_type_validation(self):
@@ -439,9 +693,1682 @@ class TestBooleanValidator(unittest.TestCase):
                 form.verify({"test": value})
 
 
-class DummyInput:
-    def __init__(self, value):
-        self.value = value
+class TestStatelessValidation(unittest.TestCase):
+    def test_schema_data(self):
+        input_ = DummyInput("test@test.com")
+        form = Schema(
+            [
+                InputItem("email", input_, "get_value").string().email(),
+                InputItem("number", DummyInput(1), "get_value").number(),
+            ]
+        )
 
-    def get_value(self):
-        return self.value
+        self.assertEqual(
+            form.validate({"email": "other@test.com", "number": "2"}),
+            {"email": "other@test.com", "number": 2.0},
+        )
+        self.assertEqual(form.validate()["email"], "test@test.com")
+        self.assertEqual(
+            form.compile()({"email": "other@test.com", "number": 3}),
+            {"email": "other@test.com", "number": 3},
+        )
+
+        with self.assertRaises(ValidationError):
+            form.validate({"email": "test", "number": 2})
+
+    def test_concurrent_validation(self):
+        schema = DictValidator().shape(
+            {
+                "id": NumericValidator().required(),
+                "tags": ArrayValidator().of(StringValidator().min(2)),
+            }
+        )
+
+        def validate(index):
+            data = {"id": str(index), "tags": [f"t{index}"] * 50}
+
+            if index % 2:
+                data["tags"].append("x")
+
+            try:
+                return schema.validate(data)
+            except ValidationError as error:
+                return error.inner[0].path
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(validate, range(200)))
+
+        for index, result in enumerate(results):
+            if index % 2:
+                self.assertEqual(result, "tags[50]")
+            else:
+                self.assertEqual(
+                    result, {"id": index, "tags": [f"t{index}"] * 50}
+                )
+
+    def test_verify_subclass(self):
+        input_ = DummyInput("abc")
+        validator = UpperValidator(InputItem("code", input_, "get_value"))
+        schema = Schema([validator])
+
+        self.assertEqual(schema.validate(), {"code": "ABC"})
+        self.assertEqual(schema.validate({"code": "xy"}), {"code": "XY"})
+        self.assertEqual(schema.compile()({"code": "z"}), {"code": "Z"})
+        self.assertEqual(validator.validate("def"), "DEF")
+        self.assertEqual(input_.get_value(), "abc")
+
+        result = schema.safe_validate({"code": 1})
+        self.assertFalse(result.valid)
+        self.assertEqual(str(result.errors[0]), "Non-string code received")
+        self.assertEqual(validator.input_item.data_container, input_)
+
+    def test_verify_builtin_subclass(self):
+        input_ = DummyInput("  abc  ")
+        validator = TrimValidator(InputItem("code", input_, "get_value"))
+        schema = Schema([validator.max(8)])
+
+        self.assertEqual(schema.validate(), {"code": "abc"})
+        self.assertEqual(schema.validate({"code": "  hi  "}), {"code": "hi"})
+        self.assertEqual(schema.compile()({"code": " z "}), {"code": "z"})
+        self.assertEqual(validator.validate(" def "), "def")
+        self.assertEqual(validator.input_item.data_container, input_)
+
+        with self.assertRaises(ValidationError):
+            schema.validate({"code": " too long "})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda index: validator.validate(f" {index} "), range(200)
+                )
+            )
+
+        self.assertEqual(results, [str(index) for index in range(200)])
+
+    def test_raising_checks(self):
+        on_fail = Mock()
+        code = CodeValidator(InputItem("code", None, "", on_fail=on_fail))
+        schema = Schema(
+            [code.digits(), InputItem("name", None, "").string().min(1)],
+            abort_early=False,
+        )
+        data = {"code": "ab", "name": ""}
+
+        with self.assertRaises(ValidationError) as context:
+            schema.validate(data)
+
+        self.assertEqual(
+            [str(error) for error in context.exception.inner],
+            ["Non-digit code received", "Value too short received"],
+        )
+        self.assertEqual(on_fail.call_count, 1)
+
+        result = schema.safe_validate(data)
+        self.assertEqual(len(result.errors), 2)
+        self.assertEqual(
+            schema.validate({"code": "12", "name": "a"}),
+            {"code": "12", "name": "a"},
+        )
+
+
+class TestSafeValidation(unittest.TestCase):
+    def test_safe_validate(self):
+        error_hook = Mock()
+
+        def custom_validator(value):
+            if value != "test":
+                raise ValidationError("custom", "custom error")
+
+        input_ = DummyInput("test")
+        form = Schema(
+            [
+                InputItem("custom", input_, "get_value").validate(
+                    custom_validator
+                ),
+                InputItem("number", DummyInput("1"), "get_value")
+                .number()
+                .min(5),
+            ],
+            error_hook,
+            False,
+        )
+
+        result = form.safe_validate({"custom": "test", "number": 5})
+        self.assertIsInstance(result, ValidationResult)
+        self.assertTrue(result.valid)
+        self.assertEqual(result.value, {"custom": "test", "number": 5})
+
+        result = form.safe_validate()
+        self.assertFalse(result.valid)
+        self.assertIsNone(result.value)
+        self.assertEqual([e.path for e in result.errors], ["number"])
+
+        input_.value = "a"
+        result = form.safe_validate()
+        self.assertEqual(
+            [str(e) for e in result.errors],
+            ["custom error", "Value too small received"],
+        )
+        self.assertEqual(error_hook.call_count, 3)
+
+    def test_safe_verify(self):
+        schema = DictValidator().shape(
+            {
+                "number": NumericValidator().max(10).required(),
+                "list": ArrayValidator().of(StringValidator().min(2)),
+            }
+        )
+
+        result = schema.safe_verify({"number": "1", "list": ["ab"]})
+        self.assertEqual(result.value, {"number": 1.0, "list": ["ab"]})
+
+        result = schema.safe_verify({"number": 11, "list": ["ab", "a"]})
+        self.assertFalse(result.valid)
+        self.assertEqual(
+            [e.path for e in result.errors], ["number", "list[1]"]
+        )
+
+        result = NumericValidator().max(1).safe_verify("a")
+        self.assertEqual(
+            [str(e) for e in result.errors],
+            ["Non-numeric value received in a numeric input"],
+        )
+
+
+class TestValidateMany(unittest.TestCase):
+    def setUp(self):
+        self.form = Schema(
+            [
+                InputItem("name", DummyInput(""), "get_value")
+                .string()
+                .required(),
+                InputItem("age", DummyInput(0), "get_value").number().min(18),
+            ],
+            abort_early=False,
+        )
+
+    def test_validate_many(self):
+        records = [
+            {"name": "a", "age": 20},
+            {"name": "", "age": 10},
+            {"name": "b", "age": "30"},
+            {"name": "c"},
+        ]
+
+        for chunk_size in (1, 1000):
+            valid, errors = self.form.validate_many(
+                iter(records), chunk_size=chunk_size
+            )
+
+            self.assertEqual(
+                valid, [{"name": "a", "age": 20}, {"name": "b", "age": 30}]
+            )
+            self.assertEqual(list(errors), [1, 3])
+            self.assertEqual([e.path for e in errors[1]], ["name", "age"])
+            self.assertEqual([e.path for e in errors[3]], ["age"])
+
+    def test_stop_conditions(self):
+        records = [{"name": "", "age": 10}] * 10
+
+        _, errors = self.form.validate_many(records, abort_early=True)
+        self.assertEqual(list(errors), [0])
+
+        _, errors = self.form.validate_many(records, max_errors=3)
+        self.assertEqual(list(errors), [0, 1, 2])
+
+    def test_interpreted_features(self):
+        records = [{"name": "a", "age": 20}] * 4
+
+        def validate_many():
+            with patch.object(
+                Schema, "compile", autospec=True, side_effect=Schema.compile
+            ) as compile:
+                self.form.validate_many(iter(records), chunk_size=2)
+
+            return compile.call_count
+
+        self.assertEqual(validate_many(), 1)
+
+        with profile(self.form) as report:
+            self.assertEqual(validate_many(), 0)
+
+        entries = {entry.check: entry for entry in report.entries}
+        self.assertEqual(entries["NumericValidator.min"].calls, 4)
+
+        # the checks are observed by the first chunk, then compiled
+        self.form._inputs[1].reorder(2)
+        self.assertEqual(validate_many(), 1)
+        self.assertIsNone(self.form._inputs[1].input_item._optimizer)
+
+        self.form.cached()
+        self.assertEqual(validate_many(), 0)
+        self.assertEqual(self.form.cache_info().hits, 3)
+
+
+class TestPickling(unittest.TestCase):
+    def setUp(self):
+        self.schema = DictValidator().shape(
+            {
+                "name": StringValidator().min(2).required(),
+                "values": ArrayValidator().of(NumericValidator().max(3)),
+            }
+        )
+
+    def test_pickle_validator(self):
+        schema = pickle.loads(pickle.dumps(self.schema))
+
+        self.assertEqual(
+            schema.validate({"name": "ab", "values": ["1"]}),
+            {"name": "ab", "values": [1.0]},
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            schema.validate({"name": "a", "values": [4]})
+
+        error = pickle.loads(pickle.dumps(context.exception))
+        self.assertEqual(
+            [(e.path, str(e)) for e in error.inner],
+            [
+                ("name", "Value too short received"),
+                ("values[0]", "Value too large received"),
+            ],
+        )
+
+    def test_process_pool(self):
+        form = Schema(
+            [
+                InputItem("name", DummyInput(""), "get_value")
+                .string()
+                .min(2),
+                InputItem("age", DummyInput(0), "get_value").number(),
+            ]
+        )
+        records = [
+            {"name": "a" * (index % 3), "age": str(index)}
+            for index in range(50)
+        ]
+
+        valid, errors = form.validate_many(records, workers=2, chunk_size=7)
+        expected_valid, expected_errors = form.validate_many(records)
+
+        self.assertEqual(valid, expected_valid)
+        self.assertEqual(
+            {
+                index: [(e.path, str(e)) for e in record_errors]
+                for index, record_errors in errors.items()
+            },
+            {
+                index: [(e.path, str(e)) for e in record_errors]
+                for index, record_errors in expected_errors.items()
+            },
+        )
+
+        _, errors = form.validate_many(
+            records, max_errors=3, workers=2, chunk_size=7
+        )
+        self.assertEqual(list(errors), [0, 1, 3])
+
+        values = [str(index % 5) for index in range(20)]
+        result = ArrayValidator().of(
+            NumericValidator().max(3),
+            workers=2,
+            chunk_size=5,
+            executor="process",
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            DictValidator().shape({"values": result}).validate(
+                {"values": values}
+            )
+
+        self.assertEqual(
+            [e.path for e in context.exception.inner],
+            ["values[4]", "values[9]", "values[14]", "values[19]"],
+        )
+
+
+class TestCompile(unittest.TestCase):
+    def test_compiled_schema(self):
+        input_ = DummyInput("test@test.com")
+        number_input = DummyInput("7")
+        form = Schema(
+            [
+                InputItem("email", input_, "get_value")
+                .string()
+                .email()
+                .max(20),
+                InputItem("number", number_input, "get_value")
+                .number()
+                .in_([1, 7.0]),
+            ],
+            abort_early=False,
+        )
+        compiled = form.compile()
+
+        self.assertEqual(compiled(), form.validate())
+        self.assertEqual(compiled()["number"], 7.0)
+
+        input_.value = "test"
+        number_input.value = "a"
+
+        with self.assertRaises(ValidationError) as context:
+            compiled()
+
+        self.assertEqual(
+            [(e.path, str(e)) for e in context.exception.inner],
+            [
+                (
+                    "email",
+                    "Value for email type does not match a valid format",
+                ),
+                ("number", "Non-numeric value received in a numeric input"),
+            ],
+        )
+
+        number_input.value = 1
+        input_.value = "test@test.com"
+        self.assertEqual(compiled()["number"], 1)
+
+    def test_compiled_hooks_and_modifier(self):
+        success_hook = Mock()
+        error_hook = Mock()
+        input_ = DummyInput("test")
+
+        compiled = Schema(
+            [
+                InputItem(
+                    "test", input_, "get_value", on_success=success_hook
+                )
+                .validate(DocumentsValidator_pt_BR().cpf)
+                .condition(lambda v: v != "test")
+                .modifier(lambda v: v + "02")
+            ],
+            error_hook,
+        ).compile()
+
+        self.assertEqual(compiled()["test"], "test02")
+        success_hook.assert_called_once()
+
+        input_.value = "875.920.020-01"
+        with self.assertRaises(ValidationError):
+            compiled()
+
+        error_hook.assert_called_once()
+
+    def test_compiled_validator(self):
+        schema = DictValidator().shape(
+            {
+                "string": StringValidator().required(),
+                "number": NumericValidator().max(10).required(),
+                "list": ArrayValidator().of(
+                    DictValidator().shape(
+                        {"value": NumericValidator().max(3).required()}
+                    )
+                ),
+            }
+        )
+        compiled = schema.compile()
+
+        fake_data = {"string": "test", "number": "10", "list": [{"value": 1}]}
+        self.assertEqual(
+            compiled(fake_data),
+            {"string": "test", "number": 10.0, "list": [{"value": 1}]},
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            compiled(
+                {
+                    "string": "",
+                    "number": 11,
+                    "list": [{"value": 1}, {"value": 4}, 1],
+                }
+            )
+
+        self.assertEqual(
+            [e.path for e in context.exception.inner],
+            ["string", "number", "list[1].value", "list[2]"],
+        )
+
+
+class TestAsyncValidation(unittest.TestCase):
+    def test_validate_async(self):
+        async def unique_email(value):
+            await asyncio.sleep(0)
+
+            if value == "taken@test.com":
+                raise ValidationError("email", "Email already in use")
+
+        input_ = DummyInput("test@test.com")
+        form = Schema(
+            [
+                InputItem("email", input_, "get_value")
+                .validate(unique_email)
+                .string()
+                .email(),
+                InputItem("number", DummyInput("7"), "get_value").number(),
+            ]
+        )
+
+        self.assertEqual(
+            asyncio.run(form.validate_async()),
+            {"email": "test@test.com", "number": 7.0},
+        )
+
+        input_.value = "taken@test.com"
+        with self.assertRaises(ValidationError) as context:
+            asyncio.run(form.validate_async())
+
+        self.assertEqual(str(context.exception), "Email already in use")
+
+        with self.assertRaises(TypeError):
+            form.validate()
+
+        with self.assertRaises(TypeError):
+            form.compile()()
+
+    def test_nested_async_validators(self):
+        async def even(value):
+            await asyncio.sleep(0)
+
+            if value % 2:
+                raise ValidationError("", "Odd value received")
+
+        item = InputItem("", None, "").validate(even).number()
+        validator = DictValidator().shape(
+            {
+                "name": StringValidator().required(),
+                "values": ArrayValidator().of(item),
+            }
+        )
+
+        self.assertEqual(
+            asyncio.run(
+                validator.verify_async({"name": "a", "values": [2, "4"]})
+            ),
+            {"name": "a", "values": [2, 4.0]},
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            asyncio.run(
+                validator.verify_async({"name": "", "values": [1, 2, 3]})
+            )
+
+        self.assertEqual(
+            [e.path for e in context.exception.inner],
+            ["name", "values[0]", "values[2]"],
+        )
+
+    def test_concurrency_limit(self):
+        running = 0
+        peak = 0
+
+        async def slow(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        item = InputItem("", None, "").validate(slow).number()
+        validator = ArrayValidator().of(item)
+
+        asyncio.run(validator.verify_async(list(range(20)), concurrency=3))
+        self.assertEqual(peak, 3)
+
+        peak = 0
+        asyncio.run(validator.verify_async(list(range(20))))
+        self.assertEqual(peak, 20)
+
+
+class TestNDJSONValidation(unittest.TestCase):
+    def test_validate_ndjson(self):
+        validator = DictValidator().shape(
+            {"value": NumericValidator().max(3).required()}
+        )
+        lines = ['{"value": 1}', "", '{"value": 4}', "{", '{"value": "2"}']
+
+        for chunk_size in (2, 1000):
+            file = io.BytesIO("\n".join(lines).encode())
+            results = list(validator.validate_ndjson(file, chunk_size))
+
+            self.assertEqual(
+                [(number, result.valid) for number, result in results],
+                [(1, True), (3, False), (4, False), (5, True)],
+            )
+            self.assertEqual(results[0][1].value, {"value": 1})
+            self.assertEqual(results[3][1].value, {"value": 2.0})
+            self.assertEqual(
+                str(results[1][1].errors[0]), "Value too large received"
+            )
+
+    def test_validate_ndjson_lazily(self):
+        validator = StringValidator().required()
+        lines = iter(['"a"\n', '""\n', "never read\n"])
+        results = validator.validate_ndjson(lines, chunk_size=1)
+
+        self.assertTrue(next(results)[1].valid)
+        self.assertFalse(next(results)[1].valid)
+        self.assertEqual(next(lines), "never read\n")
+
+
+class TestResultCache(unittest.TestCase):
+    def test_cached_schema(self):
+        modifier = Mock(side_effect=lambda v: v.upper())
+        form = Schema(
+            [
+                InputItem("name", None, "")
+                .validate(lambda v: None)
+                .modifier(modifier),
+                InputItem("age", None, "").number().min(18),
+            ],
+            abort_early=False,
+        ).cached(maxsize=2)
+
+        result = form.validate({"name": "a", "age": 20})
+        result["name"] = "changed"
+
+        self.assertEqual(
+            form.validate({"name": "a", "age": 20}), {"name": "A", "age": 20}
+        )
+        modifier.assert_called_once()
+
+        for _ in range(2):
+            with self.assertRaises(ValidationError) as context:
+                form.validate({"name": "a", "age": 10})
+
+            self.assertEqual(
+                [(e.path, str(e)) for e in context.exception.inner],
+                [("age", "Value too small received")],
+            )
+
+        self.assertFalse(form.safe_validate({"name": "a", "age": 10}).valid)
+        self.assertEqual(form.cache_info(), (3, 2, 2, 2))
+
+        # the least recently used entry is discarded
+        form.validate({"name": "b", "age": 20})
+        form.validate({"name": "a", "age": 20})
+        self.assertEqual(form.cache_info().misses, 4)
+
+        form.clear_cache()
+        self.assertEqual(form.cache_info(), (0, 0, 2, 0))
+        form = Schema([InputItem("name", None, "").string()]).cached(2)
+        form.validate({"name": "a"})
+        copy = pickle.loads(pickle.dumps(form))
+        self.assertEqual(copy.cache_info(), (0, 0, 2, 0))
+
+    def test_cached_validator(self):
+        item = BooleanValidator(True).to_be(True).cached()
+        validator = DictValidator().shape(
+            {"values": ArrayValidator().of(item)}
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            validator.verify({"values": [True, 1, 1, True, [1]]})
+
+        self.assertEqual(
+            [e.path for e in context.exception.inner],
+            ["values[1]", "values[2]", "values[4]"],
+        )
+        self.assertEqual(item.cache_info()[:2], (2, 3))
+        self.assertIsNone(StringValidator().cache_info())
+
+
+class TestIncrementalValidation(unittest.TestCase):
+    def test_validate_incremental(self):
+        password = DummyInput("secret")
+        confirmation = DummyInput("secret")
+        name = DummyInput("name")
+        check = Mock()
+
+        def matches_password(value):
+            check(value)
+
+            if value != password.value:
+                raise ValidationError("confirmation", "Passwords differ")
+
+        form = Schema(
+            [
+                InputItem("name", name, "get_value").string().required(),
+                InputItem("password", password, "get_value").string(),
+                InputItem("confirmation", confirmation, "get_value").validate(
+                    matches_password
+                ),
+            ],
+            dependencies={"confirmation": ["password"]},
+        )
+
+        self.assertEqual(form.validate_incremental()["confirmation"], "secret")
+        self.assertEqual(check.call_count, 1)
+
+        name.value = "other"
+        self.assertEqual(form.validate_incremental()["name"], "other")
+        self.assertEqual(check.call_count, 1)
+
+        password.value = "changed"
+        with self.assertRaises(ValidationError):
+            form.validate_incremental()
+
+        self.assertEqual(check.call_count, 2)
+
+        # the stored failure is reused until the value changes
+        with self.assertRaises(ValidationError):
+            form.validate_incremental()
+
+        self.assertEqual(check.call_count, 2)
+
+        confirmation.value = "changed"
+        self.assertEqual(
+            form.validate_incremental(),
+            {
+                "name": "other",
+                "password": "changed",
+                "confirmation": "changed",
+            },
+        )
+        self.assertEqual(check.call_count, 3)
+
+        form.reset_incremental()
+        form.validate_incremental()
+        self.assertEqual(check.call_count, 4)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_profile(self):
+        form = Schema(
+            [
+                InputItem("user", None, "")
+                .dict()
+                .shape(
+                    {
+                        "email": StringValidator().email(),
+                        # the pattern check avoids the bulk length check,
+                        # so each item is profiled
+                        "tags": ArrayValidator().of(
+                            StringValidator().min(2).matches("[a-z]+")
+                        ),
+                    }
+                )
+            ],
+            abort_early=False,
+        )
+
+        with profile(form) as report:
+            for email in ("test@test.com", "test"):
+                try:
+                    form.validate(
+                        {"user": {"email": email, "tags": ["ab", "c"]}}
+                    )
+                except ValidationError:
+                    pass
+
+            with self.assertRaises(RuntimeError):
+                with profile():
+                    pass
+
+        entries = {
+            (entry.path, entry.check): entry for entry in report.entries
+        }
+
+        self.assertEqual(entries["user", "DictValidator.shape"].calls, 2)
+        self.assertEqual(
+            entries["user.email", "StringValidator.email"].failure_rate, 0.5
+        )
+
+        tags = entries["user.tags[]", "StringValidator.min"]
+        self.assertEqual((tags.calls, tags.failures), (4, 2))
+        self.assertIn(("user.tags", "ArrayValidator.safe_coerce"), entries)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            report.dump(path)
+
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(len(json.load(file)), len(report.entries))
+
+
+class TestMemoryLayout(unittest.TestCase):
+    def test_slots(self):
+        validator = StringValidator().min(2)
+        form = Schema([InputItem("name", DummyInput(""), "get_value")])
+        objects = [
+            form,
+            validator,
+            validator.input_item,
+            validator.input_item._validators[0],
+            validator.input_item.data_container,
+            BooleanValidator(True),
+            InputItem("", None, "").validate(lambda value: None),
+        ]
+
+        for item in objects:
+            self.assertFalse(hasattr(item, "__dict__"), type(item))
+
+        with self.assertRaises(AttributeError):
+            validator.unknown = True
+
+        error = ValidationError("name", "Value too short received")
+        self.assertEqual(vars(error), {})
+        self.assertEqual(error.path, "name")
+
+    def test_shared_empty_kwargs(self):
+        first = NumericValidator().min(0).input_item
+        second = StringValidator().max(2).input_item
+
+        self.assertIs(
+            first._validators[0].kwargs, second._validators[0].kwargs
+        )
+        self.assertEqual(first.run(0), (0, None))
+        self.assertIsNotNone(second.run("abc")[1])
+
+
+class TestDescribe(unittest.TestCase):
+    def test_describe(self):
+        tags = (
+            InputItem("tags", DummyInput([]), "get_value")
+            .array()
+            .of(StringValidator().required())
+        )
+        tags.input_item.condition(lambda value: value is not None)
+        form = Schema(
+            [
+                InputItem("name", DummyInput(""), "get_value")
+                .string()
+                .min(2)
+                .max(10),
+                tags,
+            ],
+            dependencies={"tags": ["name"]},
+        )
+
+        self.assertEqual(
+            form.describe(),
+            {
+                "inputs": [
+                    {
+                        "type": "StringValidator",
+                        "name": "name",
+                        "checks": [
+                            {
+                                "check": "StringValidator.min",
+                                "args": [2],
+                                "kwargs": {},
+                                "conditional": False,
+                            },
+                            {
+                                "check": "StringValidator.max",
+                                "args": [10],
+                                "kwargs": {},
+                                "conditional": False,
+                            },
+                        ],
+                    },
+                    {
+                        "type": "ArrayValidator",
+                        "name": "tags",
+                        "checks": [
+                            {
+                                "check": "ArrayValidator.of",
+                                "args": [
+                                    {
+                                        "type": "StringValidator",
+                                        "name": "",
+                                        "checks": [
+                                            {
+                                                "check": (
+                                                    "StringValidator."
+                                                    "required"
+                                                ),
+                                                "args": [],
+                                                "kwargs": {},
+                                                "conditional": False,
+                                            }
+                                        ],
+                                    }
+                                ],
+                                "kwargs": {},
+                                "conditional": True,
+                            }
+                        ],
+                    },
+                ],
+                "abort_early": True,
+                "dependencies": {"tags": ["name"]},
+            },
+        )
+
+    def test_conditions_are_stored_on_the_checks(self):
+        def positive(value):
+            if value < 0:
+                raise ValidationError("", "negative")
+
+        def is_set(value):
+            return value is not None
+
+        item = InputItem("", None, "").validate(positive).condition(is_set)
+        check = item._validators[0]
+
+        self.assertIs(check.condition, is_set)
+        self.assertEqual(check.name, positive.__qualname__)
+        self.assertTrue(item.describe()["checks"][0]["conditional"])
+        self.assertEqual(item.run(None), (None, None))
+        self.assertIsNotNone(item.run(-1)[1])
+
+        validator = NumericValidator().min(0)
+        validator.input_item.condition(bool)
+        restored = pickle.loads(pickle.dumps(validator))
+
+        self.assertIs(restored.input_item._validators[0].condition, bool)
+        self.assertEqual(restored.validate(0), 0)
+        self.assertRaises(ValidationError, restored.validate, -1)
+
+
+class TestMembership(unittest.TestCase):
+    def test_lookup_kinds(self):
+        cases = [
+            (["BRL", "USD", 1], "hash", ["USD", 1, 1.0], ["EUR", [1], 2]),
+            ([[2, 1], [1, 2]], "sorted", [[1, 2]], [[3], 1, "a", None]),
+            ([{"a": 1}, [1]], "scan", [{"a": 1}, [1]], [{"a": 2}, 1]),
+        ]
+
+        for allowed, kind, valid, invalid in cases:
+            lookup = MembershipLookup(allowed)
+            self.assertEqual(lookup.kind, kind)
+
+            for value in valid:
+                self.assertIn(value, lookup)
+
+            for value in invalid:
+                self.assertNotIn(value, lookup)
+
+    def test_in_builds_lookup_once(self):
+        validator = StringValidator().in_(code for code in ["a", "b"])
+        lookup = validator.input_item._validators[0].args[0]
+
+        self.assertIsInstance(lookup, MembershipLookup)
+        self.assertEqual(validator.validate("b"), "b")
+        self.assertEqual(validator.validate("b"), "b")
+        self.assertRaises(ValidationError, validator.validate, "c")
+        self.assertEqual(validator.compile()("a"), "a")
+
+        allowed = {"a", "b"}
+        validator = StringValidator().in_(allowed)
+        self.assertIs(validator.input_item._validators[0].args[0], allowed)
+
+        restored = pickle.loads(pickle.dumps(StringValidator().in_(["a"])))
+        self.assertEqual(restored.validate("a"), "a")
+        self.assertEqual(restored.describe()["checks"][0]["args"], [["a"]])
+
+    def test_in_many(self):
+        validator = DictValidator().shape(
+            {"codes": ArrayValidator().in_many(["a", "b", "c"])}
+        )
+
+        self.assertEqual(
+            validator.validate({"codes": ["a", "c", "a"]}),
+            {"codes": ["a", "c", "a"]},
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            validator.validate({"codes": ["a", "d", [1], "b", "d"]})
+
+        message = "Value not present in the received data structure"
+        self.assertEqual(
+            [(e.path, str(e)) for e in context.exception.inner],
+            [
+                ("codes[1]", message),
+                ("codes[2]", message),
+                ("codes[4]", message),
+            ],
+        )
+
+        validator = ArrayValidator().in_many(range(3))
+        self.assertEqual(validator.validate([0, 2]), [0, 2])
+        self.assertRaises(ValidationError, validator.validate, [3])
+
+
+class TestErrorLimits(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.item = StringValidator().min(2)
+        self.item.input_item.condition(
+            lambda value: self.calls.append(value) or True
+        )
+        self.values = ["a", "ok", "b"] + ["ok"] * 1000
+
+    def paths(self, error):
+        return [e.path for e in error.inner or [error]]
+
+    def test_abort_early_stops_nested_validation(self):
+        form = Schema(
+            [
+                InputItem("values", DummyInput(self.values), "get_value")
+                .array()
+                .of(self.item)
+            ]
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            form.validate()
+
+        self.assertEqual(self.paths(context.exception), ["values[0]"])
+        self.assertEqual(len(self.calls), 1)
+
+        result = form.safe_validate({"values": list(self.values)})
+        self.assertEqual([e.path for e in result.errors], ["values[0]"])
+
+        with self.assertRaises(ValidationError) as context:
+            form.compile()()
+
+        self.assertEqual(self.paths(context.exception), ["values[0]"])
+
+    def test_max_errors(self):
+        form = Schema(
+            [
+                InputItem("first", DummyInput(self.values), "get_value")
+                .array()
+                .of(self.item),
+                InputItem("second", DummyInput(self.values), "get_value")
+                .array()
+                .of(self.item),
+            ],
+            abort_early=False,
+            max_errors=3,
+        )
+        expected = ["first[0]", "first[2]", "second[0]"]
+
+        with self.assertRaises(ValidationError) as context:
+            form.validate()
+
+        self.assertEqual(self.paths(context.exception), expected)
+        self.assertEqual(len(self.calls), len(self.values) + 1)
+
+        result = form.safe_validate()
+        self.assertEqual([e.path for e in result.errors], expected)
+
+        with self.assertRaises(ValidationError) as context:
+            form.compile()()
+
+        self.assertEqual(self.paths(context.exception), expected)
+
+        with self.assertRaises(ValidationError) as context:
+            asyncio.run(form.validate_async())
+
+        self.assertEqual(self.paths(context.exception), expected)
+
+        form.max_errors = None
+
+        with self.assertRaises(ValidationError) as context:
+            form.validate()
+
+        self.assertEqual(len(context.exception.inner), 4)
+
+    def test_validator_max_errors(self):
+        values = ["a", "b", "c"]
+        validator = ArrayValidator().of(self.item).max_errors(2)
+
+        for validate in (validator.validate, validator.compile()):
+            with self.assertRaises(ValidationError) as context:
+                validate(list(values))
+
+            self.assertEqual(len(context.exception.inner), 2)
+
+        nested = DictValidator().shape({"values": validator})
+        compiled = nested.max_errors(1).compile()
+
+        for validate in (nested.validate, compiled):
+            with self.assertRaises(ValidationError) as context:
+                validate({"values": list(values)})
+
+            self.assertEqual(self.paths(context.exception), ["values[0]"])
+
+        self.assertRaises(ValueError, validator.max_errors, 0)
+        self.assertRaises(ValueError, Schema, [], max_errors=0)
+
+    def test_max_errors_in_workers(self):
+        values = [["a", "b"] + ["ok"] * 100, ["ok"]]
+        validator = ArrayValidator().of(
+            ArrayValidator().of(self.item), workers=2, chunk_size=1
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            validator.max_errors(1).validate(values)
+
+        self.assertEqual(self.paths(context.exception), ["[0][0]"])
+        self.assertLessEqual(len(self.calls), 2)
+
+    def test_cached_outcomes_depend_on_the_limit(self):
+        validator = ArrayValidator().of(StringValidator().min(2)).cached()
+        limited = DictValidator().shape({"values": validator}).max_errors(1)
+        data = {"values": ["a", "b"]}
+
+        with self.assertRaises(ValidationError) as context:
+            limited.validate(dict(data))
+
+        self.assertEqual(len(context.exception.inner), 1)
+
+        with self.assertRaises(ValidationError) as context:
+            validator.validate(list(data["values"]))
+
+        self.assertEqual(len(context.exception.inner), 2)
+
+
+class TestErrorPaths(unittest.TestCase):
+    def test_structured_paths(self):
+        validator = DictValidator().shape(
+            {
+                "items": ArrayValidator().of(
+                    DictValidator().shape(
+                        {
+                            "a/b": StringValidator().min(2),
+                            "tags": ArrayValidator().of(
+                                StringValidator().min(2)
+                            ),
+                        }
+                    )
+                )
+            }
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            validator.validate({"items": [{"a/b": "ok", "tags": ["x"]}]})
+
+        error = context.exception.inner[0]
+        self.assertEqual(error.path, "items[0].tags[0]")
+        self.assertEqual(error.path_segments, ("items", 0, "tags", 0))
+        self.assertEqual(error.json_pointer, "/items/0/tags/0")
+
+        with self.assertRaises(ValidationError) as context:
+            validator.validate({"items": [{"a/b": "x", "tags": []}]})
+
+        error = pickle.loads(pickle.dumps(context.exception.inner[0]))
+        self.assertEqual(error.path_segments, ("items", 0, "a/b"))
+        self.assertEqual(error.json_pointer, "/items/0/a~1b")
+
+        error.path = "name"
+        self.assertEqual(error.path_segments, ("name",))
+        error.prepend_path("form", 1)
+        self.assertEqual(error.path, "form[1].name")
+
+        nested = ValidationError("", "Invalid", [ValidationError("a", "x")])
+        nested.nest_path("items", 2)
+        self.assertEqual(nested.inner[0].path, "items[2].a")
+        error.nest_path("", "key")
+        self.assertEqual(error.path, "key")
+
+    def test_unnamed_arrays(self):
+        validator = ArrayValidator().of(
+            ArrayValidator().of(NumericValidator().min(0))
+        )
+
+        for validate in (validator.validate, validator.compile()):
+            with self.assertRaises(ValidationError) as context:
+                validate([[0], [1, -1]])
+
+            self.assertEqual(
+                [e.path for e in context.exception.inner], ["[1][1]"]
+            )
+
+        self.assertEqual(ValidationError("", "message").path, "")
+
+
+class TestColumns(unittest.TestCase):
+    def setUp(self):
+        self.validator = DictValidator().columns(
+            {
+                "price": NumericValidator().min(0),
+                "sku": StringValidator().min(2).max(4),
+                "size": StringValidator().in_(["s", "m"]),
+            }
+        )
+
+    def test_columns(self):
+        table = {
+            "price": [1, -1, "2.5"],
+            "sku": ["ab", "a", "abc"],
+            "size": ["s", "m", "l"],
+        }
+
+        for validate in (self.validator.validate, self.validator.compile()):
+            with self.assertRaises(ValidationError) as context:
+                validate({key: list(value) for key, value in table.items()})
+
+            self.assertEqual(
+                [(e.path, str(e)) for e in context.exception.inner],
+                [
+                    ("price[1]", "Value too small received"),
+                    ("sku[1]", "Value too short received"),
+                    (
+                        "size[2]",
+                        "Value not present in the received data structure",
+                    ),
+                ],
+            )
+
+        table = {"price": [1, "2.5"], "sku": ["ab", "abc"], "size": ("s",)}
+        self.assertEqual(
+            self.validator.safe_verify(table).errors[0].path, "size"
+        )
+
+        table["size"] = ("s", "m")
+        self.assertEqual(self.validator.validate(table)["price"], [1, 2.5])
+
+        with self.assertRaises(ValidationError) as context:
+            self.validator.validate({"price": "12", "sku": ["ab"]})
+
+        self.assertEqual(
+            [e.path for e in context.exception.inner], ["price", "size"]
+        )
+
+    def test_async_columns(self):
+        async def reject_zz(value):
+            if value == "zz":
+                raise ValidationError("", "Rejected value")
+
+        code = StringValidator().required()
+        code.input_item.validate(reject_zz)
+        validator = DictValidator().columns(
+            {"code": code, "qty": NumericValidator().min(1)}
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            asyncio.run(
+                validator.verify_async({"code": ["ab", "zz"], "qty": [0, 1]})
+            )
+
+        self.assertEqual(
+            [e.path for e in context.exception.inner], ["code[1]", "qty[0]"]
+        )
+
+    def test_string_lengths_in_bulk(self):
+        validator = ArrayValidator().of(StringValidator().required().max(3))
+        values = ["a", "", "abcd", "abc"]
+
+        with patch.object(
+            StringValidator,
+            "run",
+            autospec=True,
+            side_effect=StringValidator.run,
+        ) as run:
+            with self.assertRaises(ValidationError) as context:
+                validator.validate(values)
+
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(
+            [(e.path, str(e)) for e in context.exception.inner],
+            [
+                ("[1]", "Empty value passed to a required input"),
+                ("[2]", "Value too long received"),
+            ],
+        )
+
+        # items that are not strings are coerced one by one
+        self.assertEqual(validator.validate(["a", 1]), ["a", "1"])
+
+
+class TestCSVValidation(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(
+            [
+                InputItem("id", None, "").number().min(1),
+                InputItem("email", None, "").string().email(),
+                InputItem("note", None, "").string().max(9),
+            ],
+            abort_early=False,
+        )
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "users.csv")
+        lines = [
+            "id,email,note,unused",
+            "1,test@test.com,ok,x",
+            "0,test,ok,x",
+            "",
+            '3,test@test.com,"two\nlines",x',
+            "4,test@test.com",
+            *[f"{index},test@test.com,ok,x" for index in range(5, 40)],
+            "-1,test@test.com,ok,x",
+        ]
+
+        with open(self.path, "w", encoding="utf-8", newline="") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_validate_csv(self):
+        report = io.StringIO(newline="")
+        summary = self.schema.validate_csv(self.path, report)
+
+        self.assertEqual(summary, (40, 3, 4))
+        self.assertEqual(
+            report.getvalue().splitlines(),
+            [
+                "row,column,message",
+                "3,id,Value too small received",
+                "3,email,Value for email type does not match a valid format",
+                "7,note,Non-string value received in a string input",
+                "43,id,Value too small received",
+            ],
+        )
+
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("")
+
+        self.assertEqual(self.schema.validate_csv(self.path), (0, 0, 0))
+
+    def test_shards(self):
+        report = io.StringIO(newline="")
+        self.schema.validate_csv(self.path, report, block_size=16)
+        reports = []
+        rows = 0
+
+        for index in range(4):
+            shard = io.StringIO(newline="")
+            summary = self.schema.validate_csv(
+                self.path, shard, shard=(index, 4), block_size=16
+            )
+            reports.append(shard.getvalue())
+            rows += summary.rows
+
+        self.assertEqual(rows, 40)
+        self.assertEqual("".join(reports), report.getvalue())
+
+        with self.assertRaises(ValueError):
+            self.schema.validate_csv(self.path, shard=(4, 4))
+
+        planned = []
+
+        with patch(
+            "PyYep.utils.csvfile.count_lines", wraps=count_lines
+        ) as count:
+            shards = plan_csv_shards(self.path, 4, block_size=16)
+            scanned = sum(
+                call.args[2] - call.args[1] for call in count.call_args_list
+            )
+
+            for shard in shards:
+                output = io.StringIO(newline="")
+                self.schema.validate_csv(
+                    self.path, output, shard=shard, block_size=16
+                )
+                planned.append(output.getvalue())
+
+        # the file is scanned once, up to the start of the last shard
+        self.assertEqual(scanned, shards[-1].start)
+        self.assertEqual(count.call_count, 4)
+        self.assertEqual(planned, reports)
+
+    def test_byte_order_mark(self):
+        with open(self.path, "rb") as file:
+            content = file.read()
+
+        with open(self.path, "wb") as file:
+            file.write(codecs.BOM_UTF8 + content)
+
+        report = io.StringIO(newline="")
+        summary = self.schema.validate_csv(self.path, report)
+
+        self.assertEqual(summary, (40, 3, 4))
+        self.assertIn("3,id,Value too small received", report.getvalue())
+
+
+class TestDedupe(unittest.TestCase):
+    def test_dedupe(self):
+        item = StringValidator().matches("[a-z]+")
+        validator = ArrayValidator().of(item, dedupe=True)
+        values = ["ab", "X", "ab", "X", 1, True, "1"]
+        expected = ["[1]", "[3]", "[4]", "[5]", "[6]"]
+
+        with patch.object(
+            StringValidator,
+            "run",
+            autospec=True,
+            side_effect=StringValidator.run,
+        ) as run:
+            with self.assertRaises(ValidationError) as context:
+                validator.validate(values)
+
+        # 1 and True are distinct from each other and from "1"
+        self.assertEqual(run.call_count, 5)
+        self.assertEqual([e.path for e in context.exception.inner], expected)
+        self.assertEqual(
+            len({id(e) for e in context.exception.inner}), len(expected)
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            asyncio.run(validator.verify_async(values))
+
+        self.assertEqual([e.path for e in context.exception.inner], expected)
+
+    def test_dedupe_objects(self):
+        customer = {"id": "5"}
+        validator = ArrayValidator().of(
+            DictValidator().shape({"id": NumericValidator().min(10)}),
+            dedupe=True,
+        )
+
+        with patch.object(
+            DictValidator,
+            "run",
+            autospec=True,
+            side_effect=DictValidator.run,
+        ) as run:
+            with self.assertRaises(ValidationError) as context:
+                validator.validate([customer, customer, {"id": "5"}])
+
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(
+            [e.path for e in context.exception.inner],
+            ["[0].id", "[1].id", "[2].id"],
+        )
+
+        error = context.exception.inner[0]
+        copy = error.copy()
+        copy.prepend_path("items")
+        self.assertEqual(error.path, "[0].id")
+        self.assertEqual(copy.path, "items[0].id")
+
+
+class TestSpec(unittest.TestCase):
+    def setUp(self):
+        name = InputItem("name", None, "").string().required().min(2)
+        name.input_item.condition(bool)
+        self.schema = Schema(
+            [
+                name,
+                InputItem("sku", None, "").string().in_(["a", "b"]),
+                InputItem("site", None, "").string().url(schemes=("https",)),
+                InputItem("active", None, "").bool(True).to_be(True),
+                InputItem("items", None, "")
+                .array()
+                .of(
+                    DictValidator().shape(
+                        {
+                            "qty": NumericValidator().min(1),
+                            "size": NumericValidator().in_(range(3)),
+                        }
+                    )
+                )
+                .max(2),
+                InputItem("even", None, "", on_fail=list).validate(is_even),
+            ],
+            abort_early=False,
+            dependencies={"name": ["sku"]},
+        )
+
+    def test_round_trip(self):
+        spec = json.loads(json.dumps(self.schema.to_spec()))
+        schema = Schema.from_spec(spec)
+
+        self.assertEqual(schema.to_spec(), spec)
+        self.assertEqual(schema.describe(), self.schema.describe())
+        checks = spec["inputs"][0]["checks"]
+        self.assertEqual(checks[1]["condition"], "builtins:bool")
+        self.assertEqual(spec["inputs"][5]["on_fail"], "builtins:list")
+
+        data = {
+            "name": "",
+            "sku": "c",
+            "site": "http://example.com",
+            "active": True,
+            "items": [{"qty": 0, "size": 1}, {"qty": 1, "size": 3}],
+            "even": 3,
+        }
+
+        for validate in (self.schema.validate, schema.validate):
+            with self.assertRaises(ValidationError) as context:
+                validate(data)
+
+            self.assertEqual(
+                [error.path for error in context.exception.inner],
+                ["name", "sku", "site", "items[0].qty", "items[1].size", ""],
+            )
+
+    def test_validators(self):
+        validator = ArrayValidator().of(StringValidator().min(2)).max_errors(1)
+        spec = validator.to_spec()
+        built = ArrayValidator.from_spec(spec)
+
+        self.assertEqual(built.to_spec(), spec)
+        self.assertEqual(built.validate(["ab"]), ["ab"])
+
+        with self.assertRaises(ValidationError) as context:
+            built.validate(["a", "b"])
+
+        self.assertEqual(len(context.exception.inner), 1)
+
+        with self.assertRaises(ValueError):
+            StringValidator.from_spec(spec)
+
+    def test_invalid_specs(self):
+        validator = StringValidator().min(1)
+        validator.input_item.validate(lambda value: None)
+
+        with self.assertRaises(TypeError):
+            validator.to_spec()
+
+        with self.assertRaises(TypeError):
+            to_spec(
+                InputItem("value", None, "").validate(
+                    DocumentsValidator_pt_BR().cpf
+                )
+            )
+
+        for spec in (
+            {"type": "Unknown", "checks": []},
+            {"type": "StringValidator", "checks": [{"check": "max_errors"}]},
+            {"type": "StringValidator", "checks": [{"check": "compile"}]},
+            {
+                "type": "ArrayValidator",
+                "checks": [{"check": "of", "args": [{"$unknown": 1}]}],
+            },
+        ):
+            with self.assertRaises(ValueError):
+                from_spec(spec)
+
+    def test_disk_cache(self):
+        spec = json.loads(json.dumps(self.schema.to_spec()))
+
+        with tempfile.TemporaryDirectory() as directory:
+            schema = load_spec(spec, directory)
+            [name] = os.listdir(directory)
+
+            with patch("PyYep.spec.from_spec") as build:
+                cached = load_spec(spec, directory)
+
+            build.assert_not_called()
+            self.assertIsNot(cached, schema)
+            self.assertEqual(cached.to_spec(), spec)
+
+            with open(os.path.join(directory, name), "wb") as file:
+                file.write(b"corrupted")
+
+            self.assertEqual(load_spec(spec, directory).to_spec(), spec)
+            self.assertEqual(os.listdir(directory), [name])
+
+    def test_allowed_references(self):
+        spec = self.schema.to_spec()
+        spec["inputs"][5]["checks"][0]["function"] = "os:system"
+
+        with patch("os.system") as system:
+            with self.assertRaises(ValueError):
+                Schema.from_spec(spec, allowed=["tests", "builtins:bool"])
+
+            with self.assertRaises(ValueError):
+                from_spec(spec, allowed=["tests", "builtins"])
+
+        system.assert_not_called()
+        spec = self.schema.to_spec()
+        allowed = ["tests", "builtins"]
+
+        self.assertEqual(from_spec(spec, allowed).to_spec(), spec)
+
+        validator = ArrayValidator().of(DictValidator().shape({"id": is_ok}))
+        validator = validator.to_spec()
+
+        with self.assertRaises(ValueError):
+            ArrayValidator.from_spec(validator, allowed=["builtins"])
+
+    def test_signed_cache(self):
+        spec = json.loads(json.dumps(self.schema.to_spec()))
+        secret = b"secret"
+
+        with tempfile.TemporaryDirectory() as directory:
+            load_spec(spec, directory, secret=secret)
+            [name] = os.listdir(directory)
+            path = os.path.join(directory, name)
+
+            # a forged file with a valid checksum but no valid signature
+            data = pickle.dumps(Schema([]))
+
+            with open(path, "wb") as file:
+                file.write(hashlib.sha256(data).digest() + data)
+
+            with patch("PyYep.spec.from_spec", wraps=from_spec) as build:
+                schema = load_spec(spec, directory, secret=secret)
+
+            build.assert_called()
+            self.assertEqual(schema.to_spec(), spec)
+
+            with patch("PyYep.spec.from_spec") as build:
+                load_spec(spec, directory, secret=secret)
+
+            build.assert_not_called()
+
+            # only the errors of stale or corrupted files are rebuilt
+            with patch("PyYep.spec.pickle.loads", side_effect=EOFError):
+                self.assertEqual(
+                    load_spec(spec, directory, secret=secret).to_spec(), spec
+                )
+
+            with patch("PyYep.spec.pickle.loads", side_effect=MemoryError):
+                with self.assertRaises(MemoryError):
+                    load_spec(spec, directory, secret=secret)
+
+    def test_invalid_arguments(self):
+        for arg in ({"$range": 5}, {"$pattern": ["("]}, {"$dict": [1]}):
+            spec = {
+                "type": "StringValidator",
+                "checks": [{"check": "in_", "args": [arg]}],
+            }
+
+            with self.assertRaises(ValueError) as context:
+                from_spec(spec)
+
+            self.assertIsNotNone(context.exception.__cause__)
+
+
+class TestReorder(unittest.TestCase):
+    def checks(self, validator):
+        return [check["check"] for check in validator.describe()["checks"]]
+
+    def test_static_order(self):
+        validator = StringValidator().matches("[a-z]+").email().max(5)
+        validator.reorder(0)
+
+        self.assertEqual(
+            self.checks(validator),
+            [
+                "StringValidator.max",
+                "StringValidator.matches",
+                "StringValidator.email",
+            ],
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            validator.validate("abcdefgh")
+
+        self.assertEqual(str(context.exception), "Value too long received")
+
+        with self.assertRaises(ValueError):
+            validator.reorder(-1)
+
+        # there are no checks to reorder before the first one is added
+        with self.assertRaises(AttributeError):
+            StringValidator().reorder()
+
+    def test_nested_checks(self):
+        validator = (
+            ArrayValidator()
+            .of(NumericValidator().min(0))
+            .includes(1)
+            .max(2)
+            .reorder(0)
+        )
+
+        # includes reads the items, which are coerced by of
+        self.assertEqual(
+            self.checks(validator),
+            [
+                "ArrayValidator.max",
+                "ArrayValidator.of",
+                "ArrayValidator.includes",
+            ],
+        )
+        self.assertEqual(validator.validate(["1", "2"]), [1, 2])
+
+    def test_observed_order(self):
+        validator = StringValidator().min(0)
+        validator.input_item.validate(is_even_length).validate(is_ok)
+        validator.reorder(4)
+        ticks = iter(range(100))
+
+        # every check takes one tick, only the failures change the order
+        with patch("PyYep.perf_counter", lambda: next(ticks)):
+            for value in ["a", "ab", "cd", "abc"]:
+                validator.run(value)
+
+        self.assertIsNone(validator.input_item._optimizer)
+        self.assertEqual(
+            self.checks(validator),
+            ["is_ok", "is_even_length", "StringValidator.min"],
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            validator.validate("odd")
+
+        self.assertEqual(str(context.exception), "Not ok")
+
+
+class UpperValidator(Validator):
+    def verify(self):
+        value = self.get_input_item_value()
+
+        if not isinstance(value, str):
+            raise ValidationError(self.name, "Non-string code received")
+
+        return value.upper()
+
+
+class TrimValidator(StringValidator):
+    def verify(self):
+        return super().verify().strip()
+
+
+class CodeValidator(StringValidator):
+    @validator_method
+    def digits(self, value):
+        if not value.isdigit():
+            raise ValidationError(self.name, "Non-digit code received")
+
+
+class DummyInput:
+    def __init__(self, value):
+        self.value = value
+
+    def get_value(self):
+        return self.value
+
+
+def is_even(value):
+    if value % 2:
+        raise ValidationError("", "Odd value")
+
+
+def is_even_length(value):
+    if len(value) % 2:
+        raise ValidationError("", "Odd length")
+
+
+def is_ok(value):
+    if value != "ok":
+        raise ValidationError("", "Not ok")